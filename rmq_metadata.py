@@ -29,7 +29,7 @@ exit 2
 
     Usage:
         rmq_metadata.py -c config_file -d dir_path
-            {-M}
+            {-M | -B bench_dir}
             [-y flavor_id]
             [-v | -h]
 
@@ -40,6 +40,11 @@ exit 2
             Required argument.
 
         -M => Monitor and process messages from a RabbitMQ queue.
+        -B bench_dir => Benchmark the processing of the PDF and archived
+            message body (.body) files in the directory.  The files are not
+            changed, RabbitMQ is not used and the metadata is kept in memory
+            instead of being inserted into Mongo.  Reports documents per
+            second, stage timings and peak memory use.
 
         -y value => A flavor id for the program lock.  To create unique lock.
         -v => Display version of this program.
@@ -97,6 +102,17 @@ exit 2
             archive_dir = None
             # Directory name for temporary message processing.
             tmp_dir = "tmp"
+            # Size in bytes above which an encoded message body is base64
+            #   decoded in chunks of this size.
+            # Smaller message bodies are decoded in one pass.  Default is 8MB.
+            decode_chunk_size = 8388608
+            # Keep the decoded PDF in memory for the PyPDF2 and pdfminer
+            #   extractions: True|False
+            # The PDF file is still written to tmp_dir for the textract
+            #   extraction and the move to the queue directory.
+            # Recommended when tmp_dir is on a network file system.  Default is
+            #   False.
+            pdf_in_memory = False
             # These entries for the Stanford NLP library module.
             # Path to Stanford language module.
             # By default lang_module will point to the English language module.
@@ -111,14 +127,160 @@ exit 2
             # Do not change unless you understand Stanford NLP and textract
             #   modules.
             token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+            # List of normalizations applied to entities before checking for
+            #   duplicate entities of the same token type.
+            # -> "whitespace" - Collapse runs of whitespace into a single
+            #   space.
+            # -> "casefold" - Ignore case differences.
+            # The first entity found is stored in the metadata.  Default is no
+            #   normalization.
+            entity_normalize = []
             # List of textract module decodes.
             # Do not change unless you understand textract module.
             textract_codes = ["utf-8", "ascii", "iso-8859-1"]
+            # Character encoding detection of the textract text.
+            # Detector module: "chardet"|"cchardet"|"auto"
+            # "auto" and "cchardet" will use the faster cchardet module if it
+            #   is installed, otherwise the chardet module is used.
+            encoding_backend = "chardet"
+            # Size in bytes of the head, middle and tail samples used to detect
+            #   the encoding of large texts.
+            # Texts no larger than three samples are detected in full.
+            encoding_sample_size = 65536
+            # Minimum detector confidence to accept a detected encoding,
+            #   between 0.0 and 1.0.
+            encoding_confidence = 1.0
+            # Cache the first detected encoding for each queue and use it for
+            #   later messages from the queue: True|False
+            encoding_cache = False
+            # Stanford NER server settings.
+            # Share one Stanford NER server process between all rmq_metadata
+            #   processes on the host: True|False
+            # The shared server is left running when the program exits.
+            # False starts a private NER server for this process only, which is
+            #   restarted if it fails and stopped when the program exits.
+            # If no NER server can be used, each tag request starts a new Java
+            #   process and loads the language module.
+            ner_server = False
+            # Host and port the NER server listens on.
+            ner_server_host = "127.0.0.1"
+            ner_server_port = 9199
+            # Java heap size for the NER server.
+            ner_server_heap = "1000m"
+            # Seconds to wait for the NER server to start or to answer a
+            #   request.
+            ner_server_timeout = 60
+            # Categorize the text from the PyPDF2, textract and pdfminer
+            #   extractions in a single NER pass: True|False
+            # Duplicate lines across the three extractions are removed before
+            #   the NER pass.
+            # False will run a NER pass on each extraction.
+            ner_single_pass = False
+            # Tokenize and categorize the PyPDF2, textract and pdfminer
+            #   extractions a page at a time: True|False
+            # Keeps memory use flat for large PDF files.  Not used when
+            #   ner_single_pass is True.
+            stream_pages = False
+            # Number of tokens collected from the pages before they are sent to
+            #   the Stanford NER tagger in streaming mode.
+            stream_batch_tokens = 10000
+            # Number of threads used to run the PyPDF2, textract and pdfminer
+            #   extractions.
+            # Default is 1, the extractions run one after another.  Set to 3 to
+            #   run all three extractions at the same time.
+            extract_workers = 1
+            # Number of processes used by pdfminer to extract the text of large
+            #   PDF files.
+            # Default is 1, the pages are extracted one after another.  If
+            #   greater than 1, the pages are split into a range of pages for
+            #   each process.
+            pdfminer_workers = 1
+            # Minimum number of pages in a PDF file before pdfminer splits the
+            #   pages across the processes.
+            pdfminer_min_pages = 100
+            # Number of recent messages kept in memory for the rolling
+            #   percentiles of the stage timings.
+            # The stage timings of each message are logged as a single JSON
+            #   line.
+            stats_window = 1000
+            # Number of metadata documents inserted into Mongo in one request.
+            # Default is 1, each document is inserted as the message is
+            #   processed.
+            # If greater than 1, messages are acknowledged once their documents
+            #   are inserted, set prefetch_count to at least write_batch_size.
+            write_batch_size = 1
+            # Maximum number of seconds a document is held in the write buffer
+            #   before it is inserted.
+            write_flush_interval = 1.0
+            # Local database file of the SHA-256 hashes of the PDF files
+            #   already processed, used by the dedup entry in the queue_list.
+            # A relative path is under the base_dir directory.  None turns off
+            #   the content hash checks.
+            # A unique index on the ContentHash field of the Mongo collection
+            #   is created as a backstop across daemons.
+            dedup_db = None
+            # Local database file caching the entities extracted from each PDF
+            #   file, keyed by the SHA-256 of the PDF file.
+            # A relative path is under the base_dir directory.  None turns off
+            #   the result cache.
+            # Entries are also keyed by the NER model files, token_types,
+            #   entity_normalize, ner_single_pass, stream_pages,
+            #   textract_codes, the encoding_backend, encoding_confidence,
+            #   encoding_sample_size and encoding_cache settings, the NER
+            #   server, batching, worker and cache settings and the module
+            #   versions, so changing them does not reuse old entries.
+            result_cache_db = None
+            # Maximum size in bytes of the cached entities.  The least recently
+            #   used entries are evicted first.
+            result_cache_size = 268435456
+            # Estimated size in bytes of the in-memory cache of NER tags for
+            #   each sentence.  0 turns off the cache.
+            # The hit ratio is logged as ner_cache_hit_ratio in the stage
+            #   timings and the benchmark report.
+            ner_cache_size = 0
+            # Maximum number of tokens in a sentence kept in the NER cache.
+            #   Longer sentences, such as pdfminer text which has no periods,
+            #   are not cached.
+            ner_cache_max_tokens = 200
+            # Maximum number of NER requests from the worker and extractor
+            #   threads sent to the tagger together.  1 turns off batching.
+            # Only useful when workers or extract_workers is greater than 1.
+            ner_batch_docs = 1
+            # Maximum number of tokens in a batch of NER requests.
+            ner_batch_tokens = 50000
+            # Maximum time in seconds a NER request waits for the batch to
+            #   fill.
+            ner_batch_wait = 0.02
+            # Number of tagger processes a large list of tokens is split
+            #   across, in chunks of whole sentences.  1 tags the tokens
+            #   serially.
+            # The chunks are sent on parallel connections to the NER server.
+            #   Without a NER server, each chunk is its own Java process
+            #   holding the language module.
+            ner_workers = 1
+            # Minimum number of tokens in each chunk tagged in parallel.
+            ner_chunk_tokens = 2000
+            # Number of worker threads processing messages from the queues.
+            # Default is 1, messages are processed one at a time on the
+            #   RabbitMQ connection thread.
+            # If greater than 1 and prefetch_count is not set, the RabbitMQ
+            #   prefetch count is set to the number of workers.
+            workers = 1
+            # Number of unacknowledged messages RabbitMQ will send to this
+            #   program for each queue.
+            # Can be overridden for a queue with the prefetch_count entry in
+            #   the queue_list.
+            # None will use the number of workers if workers is greater than 1,
+            #   otherwise there is no limit.
+            # Recommend setting this to the number of workers, so messages are
+            #   spread evenly across the daemons on different hosts.
+            prefetch_count = None
             # List of queues to monitor.
             # Make a copy of the dictionary for each combination of a queue
                 name and routing key.
             # -> queue:  "QUEUE_NAME" - Name of queue to monitor.
-            # -> routing_key:  "ROUTING_KEY" - Name of routing key for queue.
+            # -> routing_key:  "ROUTING_KEY" - Name of routing key for queue
+                (must be unique across the queue_list entries).
             # -> directory:  "/DIR_PATH" - Directory path to where a PDF will
                 be written to.
             # -> prename:  "NAME" - Static pre-file name string.
@@ -127,6 +289,11 @@ exit 2
             # -> ext:  "pdf" - Extension name to the file name.
             # -> stype:  "encode" - Require the PDF file to be decoded.
             # -> archive:  True|False - Archive the RMQ body.
+            # -> prefetch_count:  N - Prefetch count for the queue (optional,
+                overrides the global prefetch_count entry).
+            # -> dedup:  "skip"|"link"|"reprocess" - Handling of a PDF file
+                already processed (optional, requires dedup_db, default:
+                "reprocess").
             queue_list = [
                     {"queue": "QUEUE_NAME",
                      "routing_key": "ROUTING_KEY",
@@ -227,6 +394,21 @@ exit 2
             # Name of Mongo table/collection.
             tbl = "TABLE"
 
+            # Connection pool settings
+            # The connection to Mongo is opened once at startup and shared by
+            #   all messages.
+            # Maximum number of connections in the pool.
+            # Default is 100.
+            pool_size = 100
+            # Number of times to reconnect to Mongo after a failed insert
+            #   before the message is treated as failed.
+            reconnect_retries = 3
+            # Seconds to wait before the first reconnect, doubled for each
+            #   further reconnect.
+            reconnect_backoff = 1.0
+            # Maximum seconds to wait between reconnects.
+            reconnect_max_backoff = 30.0
+
         Configuration modules -> Name is runtime dependent as it can be used to
             connect to different databases with different names.
 
@@ -249,11 +431,28 @@ exit 2
 import sys
 import os
 import socket
+import subprocess
+import time
 import getpass
 import datetime
 import io
 import base64
+import codecs
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
+import multiprocessing
+import resource
+import shutil
+import sqlite3
+import tempfile
+import threading
 import chardet
+from chardet.universaldetector import UniversalDetector
 import PyPDF2
 import textract
 from nltk.tokenize import word_tokenize
@@ -264,7 +463,16 @@ from pdfminer.layout import LAParams
 from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
 from pdfminer.pdfparser import PDFParser
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+
+# Optional faster character encoding detector.
+try:
+    import cchardet
+
+except ImportError:
+    cchardet = None                                     # pylint:disable=C0103
 
 # Local
 try:
@@ -284,6 +492,8 @@ except (ValueError, ImportError) as err:
 __version__ = version.__version__
 
 # Global Variables
+DTG_LOCK = threading.Lock()
+LAST_DTG = {}
 
 
 def help_message():
@@ -300,6 +510,34 @@ def help_message():
     print(__doc__)
 
 
+def get_dtg(dtg_format):
+
+    """Function:  get_dtg
+
+    Description:  Return the current date time group with tenths of
+        milliseconds added.  The date time group is unique within the process
+        for each format, so messages processed at the same time by worker
+        threads get different file names.
+
+    Arguments:
+        (input) dtg_format -> Date time format string
+        (output) dtg -> Date time group
+
+    """
+
+    with DTG_LOCK:
+        dtg = LAST_DTG.get(dtg_format)
+
+        while dtg == LAST_DTG.get(dtg_format):
+            rdtg = datetime.datetime.now()
+            msecs = str(int(rdtg.microsecond / 100))
+            dtg = datetime.datetime.strftime(rdtg, dtg_format) + "." + msecs
+
+        LAST_DTG[dtg_format] = dtg
+
+    return dtg
+
+
 def validate_create_settings(cfg):
 
     """Function:  validate_create_settings
@@ -357,6 +595,15 @@ def validate_create_settings(cfg):
             err_msg = err_msg + msg
             status_flag = False
 
+    # Check on content index file.
+    if getattr(cfg, "dedup_db", None) and not os.path.isabs(cfg.dedup_db):
+        cfg.dedup_db = os.path.join(cfg.base_dir, cfg.dedup_db)
+
+    # Check on result cache file.
+    if getattr(cfg, "result_cache_db", None) and \
+       not os.path.isabs(cfg.result_cache_db):
+        cfg.result_cache_db = os.path.join(cfg.base_dir, cfg.result_cache_db)
+
     # Check on temporary message processing directory.
     if not os.path.isabs(cfg.tmp_dir):
         cfg.tmp_dir = os.path.join(cfg.base_dir, cfg.tmp_dir)
@@ -371,7 +618,7 @@ def validate_create_settings(cfg):
     # Check on file entries.
     status_flag, err_msg = validate_files(cfg, status_flag, err_msg)
 
-    # Check on final directory for each queue.
+    # Check on final directory and prefetch count for each queue.
     for queue in cfg.queue_list:
         status, msg = gen_libs.chk_crt_dir(
             queue["directory"], write=True, read=True, no_print=True)
@@ -380,6 +627,17 @@ def validate_create_settings(cfg):
             err_msg = err_msg + msg
             status_flag = False
 
+        prefetch = get_prefetch(cfg, queue)
+
+        if prefetch is not None and (
+                not isinstance(prefetch, int) or not 0 < prefetch < 65536):
+            err_msg = err_msg + \
+                f'prefetch_count invalid for queue: {queue["queue"]}'
+            status_flag = False
+
+    # Check on routing keys and create the routing key index.
+    status_flag, err_msg = validate_routes(cfg, status_flag, err_msg)
+
     return cfg, status_flag, err_msg
 
 
@@ -429,6 +687,82 @@ def validate_files(cfg, status_flag, err_msg):
     return status_flag, err_msg
 
 
+def validate_routes(cfg, status_flag, err_msg):
+
+    """Function:  validate_routes
+
+    Description:  Creates the index of routing keys to the queue entries and
+        their precomputed settings.  A routing key in more than one queue
+        entry is an error, as only the first entry would ever be used.  Also
+        checks the dedup setting of each queue.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) status_flag -> True|False - successfully validation
+        (input) err_msg -> Error message from checks
+        (output) status_flag -> True|False - successfully validation
+        (output) err_msg -> Error message from checks
+
+    """
+
+    cfg.route_index = {}
+
+    for queue in cfg.queue_list:
+        r_key = queue["routing_key"]
+
+        dedup = queue.get("dedup", "reprocess")
+
+        if r_key in cfg.route_index:
+            err_msg = err_msg + \
+                f'Duplicate routing_key: {r_key} in queue: {queue["queue"]}'
+            status_flag = False
+
+        else:
+            cfg.route_index[r_key] = create_route(cfg, queue)
+
+        if dedup not in ["skip", "link", "reprocess"]:
+            err_msg = err_msg + f'dedup invalid for queue: {queue["queue"]}'
+            status_flag = False
+
+        elif dedup != "reprocess" and not getattr(cfg, "dedup_db", None):
+            err_msg = err_msg + \
+                f'dedup_db not set for dedup in queue: {queue["queue"]}'
+            status_flag = False
+
+    return status_flag, err_msg
+
+
+def create_route(cfg, queue):
+
+    """Function:  create_route
+
+    Description:  Precomputes the file name parts and the archive path of the
+        messages from a queue.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) queue -> RabbitMQ queue
+        (output) route -> Dictionary of the queue and its precomputed settings
+
+    """
+
+    r_name = cfg.exchange_name + "_" + queue["routing_key"] + "_"
+    prename = queue.get("prename")
+    postname = queue.get("postname")
+    ext = queue.get("ext")
+    archive_prefix = None
+
+    if queue.get("archive") and cfg.archive_dir:
+        archive_prefix = os.path.join(cfg.archive_dir, r_name)
+
+    return {
+        "queue": queue,
+        "file_prefix": (prename + "_" if prename else "") + r_name,
+        "file_suffix": ("_" + postname if postname else "") +
+                       ("." + ext if ext else ""),
+        "archive_prefix": archive_prefix}
+
+
 def non_proc_msg(                               # pylint:disable=R0913,R0914
         rmq, log, cfg, data, subj, r_key):
 
@@ -449,9 +783,7 @@ def non_proc_msg(                               # pylint:disable=R0913,R0914
     log.log_info(
         f"non_proc_msg:  Processing failed message: Routing Key: {r_key}")
     frm_line = getpass.getuser() + "@" + socket.gethostname()
-    rdtg = datetime.datetime.now()
-    msecs = str(int(rdtg.microsecond / 100))
-    dtg = datetime.datetime.strftime(rdtg, "%Y-%m-%d_%H:%M:%S") + "." + msecs
+    dtg = get_dtg("%Y-%m-%d_%H:%M:%S")
     f_name = rmq.exchange + "_" + r_key + "_" + dtg + ".txt"
     f_path = os.path.join(cfg.message_dir, f_name)
     subj = "rmq_metadata: " + subj
@@ -480,7 +812,8 @@ def non_proc_msg(                               # pylint:disable=R0913,R0914
     gen_libs.write_file(f_path, data=data, mode="w")
 
 
-def process_msg(rmq, log, cfg, method, body):
+def process_msg(                                       # pylint:disable=R0913
+        rmq, log, cfg, method, body, done=None):
 
     """Function:  process_msg
 
@@ -492,604 +825,4436 @@ def process_msg(rmq, log, cfg, method, body):
         (input) cfg -> Configuration settings module for the program
         (input) method -> Delivery properties
         (input) body -> Message body
+        (input) done -> Function called once the message is finished with
 
     """
 
     r_key = method.routing_key
-    queue = None
     log.log_info(
         f"process_msg:  Processing message body from Routing Key: {r_key}")
 
-    for item in cfg.queue_list:
+    # Index is created by validate_create_settings at startup.
+    if getattr(cfg, "route_index", None) is None:
+        validate_routes(cfg, True, "")
 
-        if item["routing_key"] == r_key:
-            queue = item
+    route = cfg.route_index.get(r_key)
 
-            if queue["archive"] and cfg.archive_dir:
-                rdtg = datetime.datetime.now()
-                msecs = str(int(rdtg.microsecond / 100))
-                dtg = datetime.datetime.strftime(rdtg, "%Y-%m-%d_%H:%M:%S") + \
-                    "." + msecs
-                f_name = rmq.exchange + "_" + queue["routing_key"] + "_" + \
-                    dtg + ".body"
-                f_path = os.path.join(cfg.archive_dir, f_name)
-                log.log_info(f"process_msg:  Archiving message to: {f_path}")
-                gen_libs.write_file(f_path, data=body, mode="w")
+    if route:
 
-            break
+        if route["archive_prefix"]:
+            f_path = route["archive_prefix"] + \
+                get_dtg("%Y-%m-%d_%H:%M:%S") + ".body"
+            log.log_info(f"process_msg:  Archiving message to: {f_path}")
+            gen_libs.write_file(f_path, data=body, mode="w")
 
-    if queue:
-        convert_data(rmq, log, cfg, queue, body, r_key)
+        convert_data(rmq, log, cfg, route["queue"], body, r_key, done=done,
+                     route=route)
 
     else:
         non_proc_msg(rmq, log, cfg, body, "No queue detected", r_key)
 
+        if done:
+            done()
 
-def convert_data(                               # pylint:disable=R0913,R0914
-        rmq, log, cfg, queue, body, r_key):
 
-    """Function:  convert_data
+class StageTimer():
 
-    Description:  Pre-processing of message and decode the message.
+    """Class:  StageTimer
 
-    Arguments:
-        (input) rmq -> RabbitMQ class instance
-        (input) log -> Log class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) queue -> RabbitMQ queue
-        (input) body -> Message body
-        (input) r_key -> Routing key
+    Description:  Records the monotonic duration of each stage of processing
+        a message and the byte, token and entity counts of the stages.  The
+        extractions may run in threads, so updates are locked.
+
+    Methods:
+        __init__
+        time
+        add
+        count
+        wrap
+        summary
 
     """
 
-    prename = ""
-    postname = ""
-    ext = ""
-    log.log_info("convert_data:  Converting data in message body.")
-    rdtg = datetime.datetime.now()
-    msecs = str(int(rdtg.microsecond / 100))
-    dtg = datetime.datetime.strftime(rdtg, "%Y%m%d%H%M%S") + "." + msecs
-    t_filename = "tmp_" + rmq.exchange + "_" + r_key + "_" + dtg + ".txt"
-    t_file = os.path.join(cfg.tmp_dir, t_filename)
+    def __init__(self):
 
-    if queue["prename"]:
-        prename = queue["prename"] + "_"
+        """Method:  __init__
 
-    if queue["postname"]:
-        postname = "_" + queue["postname"]
+        Description:  Initialization of an instance of the StageTimer class.
 
-    if queue["ext"]:
-        ext = "." + queue["ext"]
+        Arguments:
 
-    f_filename = prename + rmq.exchange + "_" + r_key + "_" + dtg + \
-        postname + ext
-    f_name = os.path.join(cfg.tmp_dir, f_filename)
-    log.log_info(f"Starting processing of: {f_name}")
-    gen_libs.write_file(t_file, data=body, mode="w")
+        """
 
-    if queue["stype"] == "encoded":
-        log.log_info("convert_data:  Decoding data in message body.")
-        base64.decode(
-            io.open(t_file, "rb"),                      # pylint:disable=R1732
-            io.open(f_name, "wb"))                      # pylint:disable=R1732
-        os.remove(t_file)
+        self.start = time.monotonic()
+        self.stages = {}
+        self.counts = {}
+        self.lock = threading.Lock()
 
-    else:
-        log.log_info("convert_data:  No encoding setting detected.")
-        gen_libs.rename_file(t_filename, f_filename, cfg.tmp_dir)
+    @contextlib.contextmanager
+    def time(self, stage):
 
-    status = process_message(queue, cfg, f_name, log)
+        """Method:  time
 
-    if status:
-        log.log_info(f"Finished processing of: {f_filename}")
+        Description:  Context manager which adds the time spent in the block
+            to the stage.
 
-    else:
-        log.log_err(f"Insert or extractions failed on: {f_filename}")
-        log.log_info("Body of message being saved to a file - see below")
-        non_proc_msg(rmq, log, cfg, body,
-                     "All extractions or Mongo insertion failure", r_key)
-        os.remove(f_name)
-        log.log_info("Cleanup of temporary files completed.")
-        log.log_info(f"Finished processing of: {f_filename}")
+        Arguments:
+            (input) stage -> Name of the stage
 
+        """
 
-def read_pdf(filename, log):
+        start = time.monotonic()
 
-    """Function:  read_pdf
+        try:
+            yield
 
-    Description:  Extract text from a PDF file using the PyPDF2 module.
+        finally:
+            self.add(stage, time.monotonic() - start)
 
-    Arguments:
-        (input) filename -> PDF file name
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
-        (output) text -> Raw text
+    def add(self, stage, seconds):
 
-    """
+        """Method:  add
 
-    text = ""
-    status = True
-    pdf = io.open(filename, "rb")                       # pylint:disable=R1732
-    pdfreader = PyPDF2.PdfFileReader(pdf)
+        Description:  Add a duration to the stage.
 
-    if pdfreader.isEncrypted:
-        log.log_err("read_pdf:  PDF is encrypted.")
-        status = False
+        Arguments:
+            (input) stage -> Name of the stage
+            (input) seconds -> Duration in seconds
 
-    else:
-        log.log_info("read_pdf:  Extracting data...")
-        count = 0
-        num_pages = pdfreader.numPages
+        """
 
-        while count < num_pages:
-            page = pdfreader.getPage(count)
-            count += 1
-            text += page.extractText()
+        with self.lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
 
-    return status, text
+    def count(self, name, value):
 
+        """Method:  count
 
-def find_tokens(tokenized_text, cfg):
+        Description:  Add a value to a count.
 
-    """Function:  find_tokens
+        Arguments:
+            (input) name -> Name of the count
+            (input) value -> Value to add to the count
 
-    Description:  Using the Stanford NLP module to classify a list of set of
-        tokens.
+        """
 
-    Arguments:
-        (input) tokenized_text -> List of tokens
-        (input) cfg -> Configuration settings module for the program
-        (output) categorized_text -> List of categorized tokens
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + value
 
-    """
+    def wrap(self, stage, func):
 
-    tokenized_text = list(tokenized_text)
-    snt = StanfordNERTagger(cfg.lang_module, cfg.stanford_jar, cfg.encoding)
-    categorized_text = snt.tag(tokenized_text)
+        """Method:  wrap
 
-    return categorized_text
+        Description:  Return a function which calls func and adds the time
+            spent in the call to the stage.
 
+        Arguments:
+            (input) stage -> Name of the stage
+            (input) func -> Function to time
+            (output) timed -> Timed function
 
-def summarize_data(categorized_text, token_types):
+        """
 
-    """Function:  summarize_data
+        def timed(*args, **kwargs):
 
-    Description:  Summarize a list of categorized tokens and merging them into
-        a single unique list.
+            """Function:  timed
 
-    Arguments:
-        (input) categorized_text -> List of categorized tokens
-        (input) token_types -> List of token types to be accepted
-        (output) data_list -> List of summarized categorized tokens
+            Description:  Call the function within the stage.
 
-    """
+            Arguments:
 
-    categorized_text = list(categorized_text)
-    token_types = list(token_types)
-    data_list = []
-    tmp_data = []
-    current_type = ""
+            """
 
-    for item in categorized_text:
-        current_type, data_list, tmp_data = sort_data(
-            item, current_type, data_list, tmp_data, token_types)
+            with self.time(stage):
+                return func(*args, **kwargs)
 
-    else:                                               # pylint:disable=W0120
-        if tmp_data:
-            data_list = merge_data(data_list, tmp_data)
+        return timed
 
-    return data_list
+    def summary(self):
 
+        """Method:  summary
 
-def sort_data(item, current_type, data_list, tmp_data, token_types):
+        Description:  Return the total time, stage durations and counts.
 
-    """Function:  sort_data
+        Arguments:
+            (output) Dictionary of the timings and counts
 
-    Description:  Combines a series of same token types into a data set and
-        ignores the "O" (OTHER) token type.
+        """
 
-    Arguments:
-        (input) item -> Single set token
-        (input) current_type -> Current token type
-        (input) data_list -> List of summarized categorized tokens
-        (input) tmp_data -> List of current series of token data
-        (input) token_types -> List of token types
-        (output) current_type -> Current token type
-        (output) data_list -> List of summarized categorized tokens
-        (output) tmp_data -> List of current series of token data
+        with self.lock:
+            return {"total": round(time.monotonic() - self.start, 4),
+                    "stages": {stage: round(seconds, 4)
+                               for stage, seconds in self.stages.items()},
+                    "counts": dict(self.counts)}
+
+
+class PipelineStats():
+
+    """Class:  PipelineStats
+
+    Description:  Keeps the durations of each stage for the most recent
+        messages in memory and returns rolling percentiles of them.
+
+    Methods:
+        __init__
+        record
+        percentiles
 
     """
 
-    data_list = list(data_list)
-    tmp_data = list(tmp_data)
-    token_types = list(token_types)
+    def __init__(self, window=1000):
 
-    if item[1] == "O":
-        current_type = item[1]
+        """Method:  __init__
 
-        if tmp_data:
-            data_list = merge_data(data_list, tmp_data)
-            tmp_data = []
+        Description:  Initialization of an instance of the PipelineStats
+            class.
 
-    elif item[1] in token_types and item[1] == current_type:
-        tmp_data.append(item)
+        Arguments:
+            (input) window -> Number of messages to keep for each stage
 
-    elif item[1] in token_types:
+        """
 
-        if tmp_data:
-            data_list = merge_data(data_list, tmp_data)
+        self.window = window
+        self.messages = 0
+        self.stages = {}
+        self.lock = threading.Lock()
 
-        tmp_data = []
-        tmp_data.append(item)
-        current_type = item[1]
+    def record(self, summary):
 
-    return current_type, data_list, tmp_data
+        """Method:  record
 
+        Description:  Add the stage durations of a message.
 
-def merge_data(data_list, tmp_data):
+        Arguments:
+            (input) summary -> Dictionary from StageTimer.summary
 
-    """Function:  merge_data
+        """
 
-    Description:  Adds a series of similar token data into a single string
-        and adds the token type and string as set to a list.
+        with self.lock:
+            self.messages += 1
+            stages = dict(summary["stages"], total=summary["total"])
 
-    Arguments:
-        (input) data_list -> List of summarized categorized tokens
-        (input) tmp_data -> List of current series of token data
-        (output) data_list -> List of summarized categorized tokens
+            for stage, seconds in stages.items():
+                self.stages.setdefault(
+                    stage, collections.deque(maxlen=self.window)).append(
+                        seconds)
 
-    """
+    def percentiles(self, pcts=(50, 90, 99)):
+
+        """Method:  percentiles
 
-    data_list = list(data_list)
-    tmp_data = list(tmp_data)
-    data = tmp_data.pop(0)
-    tmp_a = data[0]
-    data_type = data[1]
+        Description:  Return the nearest-rank percentiles of each stage over
+            the window.
 
-    for item in tmp_data:
-        tmp_a = tmp_a + " " + item[0]
+        Arguments:
+            (input) pcts -> List of percentiles
+            (output) data -> Dictionary of stage to dictionary of percentiles
 
-    data_list.append((tmp_a, data_type))
+        """
 
-    return data_list
+        data = {}
 
+        with self.lock:
+            stages = {stage: sorted(values)
+                      for stage, values in self.stages.items()}
 
-def get_pypdf2_data(f_name, cfg, log):
+        for stage, values in stages.items():
+            data[stage] = {"count": len(values)}
 
-    """Function:  get_pypdf2_data
+            for pct in pcts:
+                index = max(-(-len(values) * pct // 100) - 1, 0)
+                data[stage][f"p{pct}"] = values[index]
 
-    Description:  Tokenize, categorize, summarize the raw data from the PDF
-        file extracted using PyPDF2 module.
+        return data
+
+
+def decode_body(                                        # pylint:disable=R0913
+        body, f_name, chunk_size=8388608, keep=False, digest=None):
+
+    """Function:  decode_body
+
+    Description:  Decode a base64 encoded message body from memory and write
+        the decoded data to a file.  Bodies larger than the chunk size are
+        decoded a chunk at a time.
 
     Arguments:
-        (input) f_name -> PDF file name
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
-        (output) final_data -> List of categorized tokens from PDF file
+        (input) body -> Message body
+        (input) f_name -> Name of file to write the decoded data to
+        (input) chunk_size -> Size in bytes of the chunks to decode
+        (input) keep -> True|False - Return the decoded data
+        (input) digest -> hashlib hash object updated with the decoded data
+        (output) pdf_data -> Decoded data or None if keep is False
 
     """
 
-    log.log_info("get_pypdf2_data:  Extracting data using PyPDF2.")
-    final_data = []
-    status, rawtext = read_pdf(f_name, log)
-
-    if status:
-        log.log_info("get_pypdf2_data:  Running word_tokenizer.")
-        tokens = word_tokenize(rawtext)
-        log.log_info("get_pypdf2_data:  Finding tokens.")
-        categorized_text = find_tokens(tokens, cfg)
+    pdf_data = None
 
-        if categorized_text:
-            log.log_info("get_pypdf2_data:  Summarizing data")
-            final_data = summarize_data(categorized_text, cfg.token_types)
+    if isinstance(body, str):
+        body = body.encode("ascii")
 
-    else:
-        log.log_warn("get_pypdf2_data:  Extraction failed.")
+    data = memoryview(body)
 
-    return status, final_data
+    with io.open(f_name, "wb") as f_hdlr:
 
+        if len(data) <= chunk_size:
+            pdf_data = base64.b64decode(data)
+            f_hdlr.write(pdf_data)
 
-def create_metadata(metadata, data):
+            if digest:
+                digest.update(pdf_data)
 
-    """Function:  create_metadata2
+        else:
+            remainder = b""
+            buf = io.BytesIO() if keep else None
 
-    Description:  Merge a list of data sets into an existing dictionary based
-        on the keys in the dictionary or create new keys in the dictionary
-        based on the data set in the list.
+            for start in range(0, len(data), chunk_size):
+                chunk = remainder + bytes(
+                    data[start:start + chunk_size]).translate(
+                        None, b" \t\r\n")
+                end = len(chunk) - len(chunk) % 4
+                remainder = chunk[end:]
+                chunk = base64.b64decode(chunk[:end])
+                f_hdlr.write(chunk)
 
-    Arguments:
-        (input) metadata -> Dictionary of meta-data
-        (input) data -> List of data sets
-        (output) metadata -> Dictionary of meta-data
+                if keep:
+                    buf.write(chunk)
 
-    """
+                if digest:
+                    digest.update(chunk)
 
-    data = list(data)
+            if remainder:
+                chunk = base64.b64decode(remainder)
+                f_hdlr.write(chunk)
 
-    for item in data:
+                if keep:
+                    buf.write(chunk)
 
-        # Create new key.
-        if item[1] not in list(metadata.keys()):
-            metadata[item[1]] = [item[0]]
+                if digest:
+                    digest.update(chunk)
 
-        # Check for duplicate entry in dictionary's list.
-        elif item[0] not in metadata[item[1]]:
-            metadata[item[1]].append(item[0])
+            if keep:
+                pdf_data = buf.getvalue()
 
-    return metadata
+    return pdf_data if keep else None
 
 
-def extract_pdf(f_name, log, char_encoding=None):
+def convert_data(                               # pylint:disable=R0913
+        rmq, log, cfg, queue, body, r_key, done=None, route=None):
 
-    """Function:  extract_pdf
+    """Function:  convert_data
 
-    Description:  Extract text from PDF using textract module.
+    Description:  Pre-processing of message and decode the message.  If the
+        metadata is left in the write buffer, the message is finished once
+        the buffer is flushed.
 
     Arguments:
-        (input) f_name -> PDF file name
+        (input) rmq -> RabbitMQ class instance
         (input) log -> Log class instance
-        (input) char_encoding -> Character encoding code
-        (output) status -> True|False - successfully extraction of data
-        (output) text -> Raw text
+        (input) cfg -> Configuration settings module for the program
+        (input) queue -> RabbitMQ queue
+        (input) body -> Message body
+        (input) r_key -> Routing key
+        (input) done -> Function called once the message is finished with
+        (input) route -> Precomputed settings of the queue from create_route
 
     """
 
-    status = True
-    text = ""
+    log.log_info("convert_data:  Converting data in message body.")
+    route = route or create_route(cfg, queue)
+    f_filename = route["file_prefix"] + get_dtg("%Y%m%d%H%M%S") + \
+        route["file_suffix"]
+    f_name = os.path.join(cfg.tmp_dir, f_filename)
+    log.log_info(f"Starting processing of: {f_name}")
+    pdf_data = None
+    timer = StageTimer()
+    timer.count("body_bytes", len(body))
+    index = getattr(cfg, "content_index", None)
+    dedup = queue.get("dedup", "reprocess") if index else "reprocess"
+    digest = hashlib.sha256() \
+        if dedup != "reprocess" or getattr(cfg, "result_cache", None) else None
+
+    with timer.time("decode"):
+
+        if queue["stype"] == "encoded":
+            log.log_info("convert_data:  Decoding data in message body.")
+            pdf_data = decode_body(
+                body, f_name, getattr(cfg, "decode_chunk_size", 8388608),
+                keep=getattr(cfg, "pdf_in_memory", False), digest=digest)
 
-    if char_encoding:
+        else:
+            log.log_info("convert_data:  No encoding setting detected.")
+            gen_libs.write_file(f_name, data=body, mode="w")
 
-        try:
-            log.log_info("extract_pdf:  Extracting data -> set encoding.")
-            text = textract.process(f_name, encoding=char_encoding)
+            if digest:
+                digest.update(
+                    body.encode() if isinstance(body, str) else body)
 
-        except textract.exceptions.ShellError as msg:
-            status = False
+    finish = functools.partial(
+        finish_message, rmq, log, cfg, body, r_key, f_name, f_filename,
+        timer, done)
+    content_hash = digest.hexdigest() if digest else None
+    original = None
 
-            if str(msg).find("Incorrect password") >= 0:
-                log.log_err("extract_pdf:  PDF is password protected.")
+    if content_hash and dedup != "reprocess":
+        with timer.time("dedup"):
+            original = index.lookup(content_hash)
 
-            else:
-                log.log_err("extract_pdf:  Error detected.")
-                log.log_err(f"Error Message:  {msg}")
+    if original:
+        status = process_duplicate(
+            queue, cfg, f_name, log, content_hash, original, timer)
 
     else:
-        try:
-            log.log_info("extract_pdf:  Extracting data -> default encoding.")
-            text = textract.process(f_name)
+        status = process_message(
+            queue, cfg, f_name, log, pdf_data=pdf_data, timer=timer,
+            on_done=finish, content_hash=content_hash)
 
-        except textract.exceptions.ShellError as msg:
-            status = False
+    if status is not None:
+        finish(status)
 
-            if str(msg).find("Incorrect password") >= 0:
-                log.log_err("extract_pdf:  PDF is password protected.")
 
-            else:
-                log.log_err("extract_pdf:  Error detected.")
-                log.log_err(f"Error Message:  {msg}")
+def finish_message(                             # pylint:disable=R0913
+        rmq, log, cfg, body, r_key, f_name, f_filename, timer, done,
+        status):
+
+    """Function:  finish_message
+
+    Description:  Complete the processing of a message.  A failed message
+        is saved to a file by non_proc_msg.  The done function is always
+        called, so the message is acknowledged.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) body -> Message body
+        (input) r_key -> Routing key
+        (input) f_name -> PDF file name
+        (input) f_filename -> PDF file name without the directory
+        (input) timer -> StageTimer class instance
+        (input) done -> Function called once the message is finished with
+        (input) status -> True|False - successfully processed message
+
+    """
+
+    try:
+        if status:
+            log.log_info(f"Finished processing of: {f_filename}")
+
+        else:
+            log.log_err(f"Insert or extractions failed on: {f_filename}")
+            log.log_info("Body of message being saved to a file - see below")
+            non_proc_msg(rmq, log, cfg, body,
+                         "All extractions or Mongo insertion failure", r_key)
+            os.remove(f_name)
+            log.log_info("Cleanup of temporary files completed.")
+            log.log_info(f"Finished processing of: {f_filename}")
+
+        log_timings(cfg, log, timer, f_filename, status)
+
+    finally:
+        if done:
+            done()
+
+
+def log_timings(cfg, log, timer, f_name, status):
+
+    """Function:  log_timings
+
+    Description:  Log the stage timings of a message as a single JSON line
+        and add them to the rolling statistics, if set up.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) timer -> StageTimer class instance
+        (input) f_name -> File name of the message
+        (input) status -> True|False - message processed successfully
+
+    """
+
+    summary = timer.summary()
+    stats = getattr(cfg, "pipeline_stats", None)
+
+    if stats:
+        stats.record(summary)
+
+    summary.update({"file": f_name, "status": bool(status)})
+    tagger = getattr(cfg, "ner_tagger", None)
+
+    if tagger and tagger.cache:
+        summary["ner_cache_hit_ratio"] = round(tagger.cache.ratio(), 4)
+
+    log.log_info(f"Stage timings: {json.dumps(summary, sort_keys=True)}")
+
+
+def open_pdf(f_name, pdf_data=None):
+
+    """Function:  open_pdf
+
+    Description:  Open a PDF file for reading or wrap the PDF data already in
+        memory in a file object.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) pdf_data -> PDF file contents as bytes or memoryview
+        (output) File object opened for reading in binary mode
+
+    """
+
+    if pdf_data is not None:
+        return io.BytesIO(pdf_data)
+
+    return io.open(f_name, "rb")                        # pylint:disable=R1732
+
+
+def pdf_pages(pdfreader):
+
+    """Function:  pdf_pages
+
+    Description:  Generator which yields the text of each page in a PDF file
+        using the PyPDF2 module.
+
+    Arguments:
+        (input) pdfreader -> PyPDF2.PdfReader class instance
+        (output) Text of a page
+
+    """
+
+    for page in pdfreader.pages:
+        yield page.extract_text()
+
+
+def read_pdf(filename, log, pdf_data=None):
+
+    """Function:  read_pdf
+
+    Description:  Extract text from a PDF file using the PyPDF2 module.
+
+    Arguments:
+        (input) filename -> PDF file name
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (output) status -> True|False - successfully extraction of data
+        (output) text -> Raw text
+
+    """
+
+    text = ""
+    status = True
+
+    with open_pdf(filename, pdf_data) as pdf:
+        pdfreader = PyPDF2.PdfReader(pdf)
+
+        if pdfreader.is_encrypted:
+            log.log_err("read_pdf:  PDF is encrypted.")
+            status = False
+
+        else:
+            log.log_info("read_pdf:  Extracting data...")
+            text = "".join(pdf_pages(pdfreader))
 
     return status, text
 
 
-def get_textract_data(f_name, cfg, log):
+def read_pdf_pages(filename, log, pdf_data=None):
+
+    """Function:  read_pdf_pages
+
+    Description:  Generator which yields the text of each page of a PDF file
+        using the PyPDF2 module.  No pages are returned if the PDF file is
+        encrypted.
+
+    Arguments:
+        (input) filename -> PDF file name
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (output) Text of a page
+
+    """
+
+    with open_pdf(filename, pdf_data) as pdf:
+        pdfreader = PyPDF2.PdfReader(pdf)
+
+        if pdfreader.is_encrypted:
+            log.log_err("read_pdf_pages:  PDF is encrypted.")
+
+        else:
+            log.log_info("read_pdf_pages:  Extracting data...")
+            yield from pdf_pages(pdfreader)
+
+
+class NerServer():
+
+    """Class:  NerServer
+
+    Description:  Client for a Stanford NER server running as a long-running
+        local process which holds one loaded language module.  A shared
+        server is used by every rmq_metadata process on the host and if no
+        server is listening on the configured port, one is started.  A
+        private server is started by this process on a free port for its own
+        use and is stopped with it.
+
+    Methods:
+        __init__
+        command
+        is_running
+        is_alive
+        start
+        stop
+        tag
+
+    """
+
+    def __init__(self, cfg, private=False):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the NerServer class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) private -> True|False - server is private to this process
+
+        """
+
+        self.lang_module = cfg.lang_module
+        self.stanford_jar = cfg.stanford_jar
+        self.encoding = cfg.encoding
+        self.private = private
+        self.host = getattr(cfg, "ner_server_host", "127.0.0.1")
+        self.port = None if private else getattr(cfg, "ner_server_port", 9199)
+        self.heap = getattr(cfg, "ner_server_heap", "1000m")
+        self.timeout = getattr(cfg, "ner_server_timeout", 60)
+        self.proc = None
+
+    def command(self):
+
+        """Method:  command
+
+        Description:  Java command line to start the NER server.  Tokens are
+            sent whitespace separated so the server keeps the tokenization
+            done by word_tokenize.
+
+        Arguments:
+            (output) List of command line arguments
+
+        """
+
+        return ["java", "-mx" + self.heap, "-cp", self.stanford_jar,
+                "edu.stanford.nlp.ie.NERServer",
+                "-loadClassifier", self.lang_module,
+                "-port", str(self.port),
+                "-encoding", self.encoding,
+                "-outputFormat", "slashTags",
+                "-tokenizerFactory",
+                "edu.stanford.nlp.process.WhitespaceTokenizer",
+                "-tokenizerOptions", "tokenizeNLs=false"]
+
+    def is_running(self):
+
+        """Method:  is_running
+
+        Description:  Check if a NER server is listening on the port.
+
+        Arguments:
+            (output) True|False - NER server is accepting connections
+
+        """
+
+        try:
+            with socket.create_connection((self.host, self.port), timeout=1):
+                status = True
+
+        except OSError:
+            status = False
+
+        return status
+
+    def is_alive(self):
+
+        """Method:  is_alive
+
+        Description:  Check the NER server is accepting connections and, for
+            a private server, that its process is still running.
+
+        Arguments:
+            (output) True|False - NER server is ready for requests
+
+        """
+
+        if self.port is None or self.private and (
+                self.proc is None or self.proc.poll() is not None):
+            return False
+
+        return self.is_running()
+
+    def start(self, log):
+
+        """Method:  start
+
+        Description:  Use the NER server already listening on the port or
+            start a new one and wait for it to load the language module.  A
+            shared server is started in its own session so it outlives this
+            process and stays available to the other processes on the host.
+            A private server is started on a free port.
+
+        Arguments:
+            (input) log -> Log class instance
+            (output) status -> True|False - NER server is accepting connections
+
+        """
+
+        if not self.private and self.is_running():
+            log.log_info(f"NerServer:  Using NER server on port: {self.port}")
+            return True
+
+        if self.private:
+
+            with socket.socket() as sock:
+                sock.bind((self.host, 0))
+                self.port = sock.getsockname()[1]
+
+        log.log_info(f"NerServer:  Starting NER server on port: {self.port}")
+
+        try:
+            self.proc = subprocess.Popen(               # pylint:disable=R1732
+                self.command(), stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, start_new_session=not self.private)
+
+        except OSError as msg:
+            log.log_err(f"NerServer:  Unable to start NER server: {msg}")
+            self.stop()
+            return False
+
+        end_time = time.monotonic() + self.timeout
+        status = self.is_running()
+
+        while not status and time.monotonic() < end_time:
+
+            if self.proc.poll() is not None and not self.is_running():
+                break
+
+            time.sleep(0.5)
+            status = self.is_running()
+
+        if not status:
+            log.log_err("NerServer:  NER server failed to start.")
+            self.stop()
+
+        return status
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop a private NER server.  A shared server is left
+            running for the other processes on the host.
+
+        Arguments:
+
+        """
+
+        if not self.private:
+            return
+
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+
+            try:
+                self.proc.wait(timeout=10)
+
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+        self.proc = None
+        self.port = None
+
+    def tag(self, tokenized_text):
+
+        """Method:  tag
+
+        Description:  Send a list of tokens to the NER server and return the
+            categorized tokens.  The NER server answers one request per
+            connection.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        request = " ".join(tokenized_text).replace("\n", " ") + "\n"
+        response = []
+
+        with socket.create_connection(
+                (self.host, self.port), timeout=self.timeout) as sock:
+            sock.sendall(request.encode(self.encoding))
+            sock.shutdown(socket.SHUT_WR)
+            data = sock.recv(65536)
+
+            while data:
+                response.append(data)
+                data = sock.recv(65536)
+
+        categorized_text = [
+            tuple(item.rsplit("/", 1))
+            for item in b"".join(response).decode(self.encoding).split()]
+
+        if len(categorized_text) != len(tokenized_text) \
+           or any(len(item) != 2 for item in categorized_text):
+            raise ValueError("NER server response does not match request")
+
+        return categorized_text
+
+
+def split_sentences(tokens):
+
+    """Function:  split_sentences
+
+    Description:  Split a list of tokens into sentences at the sentence ending
+        tokens created by word_tokenize.
+
+    Arguments:
+        (input) tokens -> List of tokens
+        (output) sentences -> List of lists of tokens
+
+    """
+
+    sentences = []
+    start = 0
+
+    for pos, token in enumerate(tokens):
+
+        if token in (".", "!", "?"):
+            sentences.append(tokens[start:pos + 1])
+            start = pos + 1
+
+    if start < len(tokens):
+        sentences.append(tokens[start:])
+
+    return sentences
+
+
+def split_clauses(tokens):
+
+    """Function:  split_clauses
+
+    Description:  Split a list of tokens into clauses at the comma, semicolon
+        and colon tokens, which the tagger does not include in an entity.
+
+    Arguments:
+        (input) tokens -> List of tokens
+        (output) clauses -> List of lists of tokens
+
+    """
+
+    clauses = []
+    start = 0
+
+    for pos, token in enumerate(tokens):
+
+        if token in (",", ";", ":"):
+            clauses.append(tokens[start:pos + 1])
+            start = pos + 1
+
+    if start < len(tokens):
+        clauses.append(tokens[start:])
+
+    return clauses
+
+
+def get_sentence_chunks(tokens, workers, min_tokens):
+
+    """Function:  get_sentence_chunks
+
+    Description:  Split a list of tokens into at most one chunk for each
+        worker.  Chunks are made of whole sentences and have at least
+        min_tokens tokens.  A sentence longer than a chunk, such as the
+        pdfminer text which has the periods removed, is split into clauses
+        instead.  Either way an entity is never split between chunks.
+
+    Arguments:
+        (input) tokens -> List of tokens
+        (input) workers -> Number of workers
+        (input) min_tokens -> Minimum number of tokens in a chunk
+        (output) chunks -> List of lists of tokens
+
+    """
+
+    size = max(-(-len(tokens) // workers), min_tokens, 1)
+    chunks = []
+    chunk = []
+
+    for sentence in split_sentences(tokens):
+        parts = split_clauses(sentence) if len(sentence) > size \
+            else [sentence]
+
+        for part in parts:
+            chunk.extend(part)
+
+            if len(chunk) >= size:
+                chunks.append(chunk)
+                chunk = []
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+class SentenceCache():
+
+    """Class:  SentenceCache
+
+    Description:  Least recently used cache of the categorized tokens of each
+        sentence, keyed by a hash of the tokens of the sentence.  The memory
+        used is bounded by an estimate of the size of the cached entries.
+        Sentences longer than max_tokens are not cached, as text without
+        sentence endings, such as the pdfminer text which has the periods
+        removed, is one long sentence that is never seen again.
+        Shared by the worker threads, so access is locked.
+
+    Methods:
+        __init__
+        key
+        get
+        put
+        ratio
+
+    """
+
+    def __init__(self, max_bytes, max_tokens=200):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the SentenceCache class.
+
+        Arguments:
+            (input) max_bytes -> Maximum estimated size in bytes of the cache
+            (input) max_tokens -> Maximum number of tokens in a cached sentence
+
+        """
+
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(sentence):
+
+        """Method:  key
+
+        Description:  Return the cache key of a sentence.
+
+        Arguments:
+            (input) sentence -> List of tokens
+            (output) key -> Hash of the tokens
+
+        """
+
+        return hashlib.blake2b(
+            "\x1f".join(sentence).encode(), digest_size=16).digest()
+
+    def get(self, key):
+
+        """Method:  get
+
+        Description:  Return the categorized tokens of a sentence and mark the
+            entry as used.
+
+        Arguments:
+            (input) key -> Cache key of the sentence
+            (output) tags -> List of categorized tokens or None
+
+        """
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[0]
+
+    def put(self, key, tags):
+
+        """Method:  put
+
+        Description:  Cache the categorized tokens of a sentence and evict the
+            least recently used entries over the maximum size.
+
+        Arguments:
+            (input) key -> Cache key of the sentence
+            (input) tags -> List of categorized tokens
+
+        """
+
+        # Approximate size of the key, list, tuples and token strings.
+        size = 120 + sum(len(word) + 120 for word, _ in tags)
+
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            old = self.entries.pop(key, None)
+
+            if old:
+                self.size -= old[1]
+
+            self.entries[key] = (tags, size)
+            self.size += size
+
+            while self.size > self.max_bytes:
+                _, (_, old_size) = self.entries.popitem(last=False)
+                self.size -= old_size
+
+    def ratio(self):
+
+        """Method:  ratio
+
+        Description:  Return the hit ratio of the cache.
+
+        Arguments:
+            (output) ratio -> Hits divided by lookups
+
+        """
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class NerTagger():
+
+    """Class:  NerTagger
+
+    Description:  Wrapper around the Stanford NER tagger, created once at
+        startup and shared by every message.  Requests go to a NER server,
+        which keeps the language module loaded.  When the shared NER server
+        is not enabled, a private NER server is started at warm-up and is
+        restarted if a request to it fails.  If no NER server is available,
+        requests fall back to the nltk tagger, which starts a new Java
+        process and loads the language module for each request.  With a
+        sentence cache, only the sentences not already cached are sent to the
+        tagger.  With more than one NER worker, large lists of tokens are
+        tagged in sentence-aligned chunks in parallel.
+
+    Methods:
+        __init__
+        local_tagger
+        warm_up
+        is_healthy
+        restart
+        stop
+        tag
+        tag_chunk
+        tag_sents
+        tag_cached
+        tag_request
+        tag_sents_request
+        tag_server
+        tag_local
+
+    """
+
+    def __init__(self, cfg):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the NerTagger class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+
+        """
+
+        self.lang_module = cfg.lang_module
+        self.stanford_jar = cfg.stanford_jar
+        self.encoding = cfg.encoding
+        self.healthy = False
+        self.restarts = 0
+        self.fallbacks = 0
+        self.log = None
+        self.lock = threading.Lock()
+        self.server = NerServer(
+            cfg, private=not getattr(cfg, "ner_server", False))
+        cache_size = getattr(cfg, "ner_cache_size", 0)
+        self.cache = SentenceCache(
+            cache_size, getattr(cfg, "ner_cache_max_tokens", 200)) \
+            if cache_size else None
+        self.workers = getattr(cfg, "ner_workers", 1)
+        self.chunk_tokens = getattr(cfg, "ner_chunk_tokens", 2000)
+
+    def local_tagger(self):
+
+        """Method:  local_tagger
+
+        Description:  Create a nltk Stanford NER tagger.  The nltk tagger
+            keeps the temporary file of the request it is running on the
+            instance, so each request uses its own instance.
+
+        Arguments:
+            (output) StanfordNERTagger instance
+
+        """
+
+        return StanfordNERTagger(
+            self.lang_module, self.stanford_jar, self.encoding)
+
+    def warm_up(self, log):
+
+        """Method:  warm_up
+
+        Description:  Start the NER server and check it answers a small tag
+            request before the first message arrives.  If the server cannot
+            be used, check the nltk tagger works instead.
+
+        Arguments:
+            (input) log -> Log class instance
+            (output) healthy -> True|False - tagger is ready for use
+
+        """
+
+        tokens = ["Warm", "up", "in", "London", "."]
+        self.log = log
+
+        if self.server.start(log):
+
+            try:
+                self.server.tag(tokens)
+                self.healthy = True
+
+                return self.healthy
+
+            except (OSError, ValueError) as msg:
+                log.log_warn(f"NerTagger:  NER server warm-up failed: {msg}")
+                self.server.stop()
+
+        log.log_warn("NerTagger:  Using the nltk tagger, which loads the"
+                     " language module for each request.")
+
+        try:
+            self.tag_local(tokens)
+
+        except (LookupError, OSError) as msg:
+            log.log_warn(f"NerTagger:  Warm-up failed: {msg}")
+            self.healthy = False
+
+        return self.healthy
+
+    def is_healthy(self):
+
+        """Method:  is_healthy
+
+        Description:  Report whether the NER server is ready for requests.
+            Without a NER server, report whether the last request to the nltk
+            tagger succeeded.
+
+        Arguments:
+            (output) True|False - tagger is ready for use
+
+        """
+
+        if self.server.port is not None:
+            return self.server.is_alive()
+
+        return self.healthy
+
+    def restart(self, proc):
+
+        """Method:  restart
+
+        Description:  Stop the private NER server and start a new one.  The
+            server is only restarted if it is still the process which failed,
+            so concurrent failed requests restart it once.
+
+        Arguments:
+            (input) proc -> Server process the failed request was sent to
+            (output) True|False - NER server is running
+
+        """
+
+        with self.lock:
+
+            if self.server.proc is proc:
+                self.restarts += 1
+                self.healthy = False
+                self.server.stop()
+                self.server.start(self.log)
+
+            return self.server.port is not None
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the private NER server.
+
+        Arguments:
+
+        """
+
+        self.server.stop()
+
+    def tag(self, tokenized_text):
+
+        """Method:  tag
+
+        Description:  Classify a list of tokens.  With more than one NER
+            worker, a large list is split into sentence-aligned chunks which
+            are classified concurrently, each on its own NER server connection
+            or nltk tagger, and the categorized tokens are joined in order.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        chunks = get_sentence_chunks(
+            tokenized_text, self.workers, self.chunk_tokens) \
+            if self.workers > 1 else []
+
+        if len(chunks) > 1:
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(chunks)) as executor:
+                results = list(executor.map(self.tag_chunk, chunks))
+
+            return [item for result in results for item in result]
+
+        return self.tag_chunk(tokenized_text)
+
+    def tag_chunk(self, tokenized_text):
+
+        """Method:  tag_chunk
+
+        Description:  Classify a list of tokens through the sentence cache,
+            if one is set.  If the tagger does not return one tag for each
+            token, the tokens are classified again without the cache.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        if self.cache:
+            tags = self.tag_cached(split_sentences(tokenized_text))
+
+            if tags is not None:
+                return [item for sentence in tags for item in sentence]
+
+        return self.tag_request(tokenized_text)
+
+    def tag_sents(self, token_lists):
+
+        """Method:  tag_sents
+
+        Description:  Classify several lists of tokens in one request to the
+            tagger, through the sentence cache if one is set.
+
+        Arguments:
+            (input) token_lists -> List of lists of tokens
+            (output) List of lists of categorized tokens
+
+        """
+
+        if self.cache:
+            docs = [split_sentences(tokens) for tokens in token_lists]
+            tags = self.tag_cached(
+                [sentence for sentences in docs for sentence in sentences])
+
+            if tags is not None:
+                results = []
+                start = 0
+
+                for sentences in docs:
+                    end = start + len(sentences)
+                    results.append(
+                        [item for sentence in tags[start:end]
+                         for item in sentence])
+                    start = end
+
+                return results
+
+        return self.tag_sents_request(token_lists)
+
+    def tag_cached(self, sentences):
+
+        """Method:  tag_cached
+
+        Description:  Classify a list of sentences using the sentence cache.
+            The sentences not in the cache are classified in a single request
+            and cached.  Sentences too long for the cache are classified in
+            the same request without being looked up or cached.
+
+        Arguments:
+            (input) sentences -> List of lists of tokens
+            (output) tags -> List of lists of categorized tokens for each
+                sentence or None if the tagger does not return one tag for
+                each token
+
+        """
+
+        keys = [self.cache.key(sentence)
+                if len(sentence) <= self.cache.max_tokens else None
+                for sentence in sentences]
+        tags = [self.cache.get(key) if key else None for key in keys]
+        missing = [pos for pos, item in enumerate(tags) if item is None]
+
+        if missing:
+            tokens = [token for pos in missing for token in sentences[pos]]
+            results = self.tag_request(tokens)
+
+            if len(results) != len(tokens):
+                return None
+
+            start = 0
+
+            for pos in missing:
+                end = start + len(sentences[pos])
+                tags[pos] = results[start:end]
+
+                if keys[pos]:
+                    self.cache.put(keys[pos], tags[pos])
+
+                start = end
+
+        return tags
+
+    def tag_request(self, tokenized_text):
+
+        """Method:  tag_request
+
+        Description:  Classify a list of tokens using the NER server, if it
+            is running, otherwise the nltk tagger.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        if self.server.port is not None:
+            categorized_text = self.tag_server(tokenized_text)
+
+            if categorized_text is not None:
+                return categorized_text
+
+        return self.tag_local(tokenized_text)
+
+    def tag_sents_request(self, token_lists):
+
+        """Method:  tag_sents_request
+
+        Description:  Classify several lists of tokens in one request to the
+            NER server, if it is running, otherwise to the nltk tagger.
+            The NER server is sent the lists joined together and the
+            categorized tokens are split back out by the length of each list.
+
+        Arguments:
+            (input) token_lists -> List of lists of tokens
+            (output) results -> List of lists of categorized tokens
+
+        """
+
+        if self.server.port is not None:
+            categorized_text = self.tag_server(
+                [token for tokens in token_lists for token in tokens])
+
+            if categorized_text is not None:
+                results = []
+                start = 0
+
+                for tokens in token_lists:
+                    results.append(
+                        categorized_text[start:start + len(tokens)])
+                    start += len(tokens)
+
+                return results
+
+        results = self.local_tagger().tag_sents(token_lists)
+        self.healthy = True
+
+        return results
+
+    def tag_server(self, tokenized_text):
+
+        """Method:  tag_server
+
+        Description:  Classify a list of tokens with the NER server.  A failed
+            request to a private server restarts the server and is retried
+            once.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens or None if
+                the NER server failed
+
+        """
+
+        proc = self.server.proc
+
+        try:
+            categorized_text = self.server.tag(tokenized_text)
+
+        except (OSError, ValueError):
+            categorized_text = None
+
+        if categorized_text is None and self.server.private \
+           and self.restart(proc):
+
+            try:
+                categorized_text = self.server.tag(tokenized_text)
+
+            except (OSError, ValueError):
+                categorized_text = None
+
+        if categorized_text is None:
+            self.fallbacks += 1
+
+        else:
+            self.healthy = True
+
+        return categorized_text
+
+    def tag_local(self, tokenized_text):
+
+        """Method:  tag_local
+
+        Description:  Classify a list of tokens with a new nltk tagger, which
+            starts a Java process and loads the language module.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        categorized_text = self.local_tagger().tag(tokenized_text)
+        self.healthy = True
+
+        return categorized_text
+
+
+class NerBatcher():
+
+    """Class:  NerBatcher
+
+    Description:  Micro-batches tag requests from the worker and extractor
+        threads.  Requests are held for up to ner_batch_wait seconds and sent
+        to the NER tagger together in one tag_sents request, once
+        ner_batch_docs requests or ner_batch_tokens tokens are waiting or the
+        oldest request has waited long enough.  The categorized tokens are
+        handed back to each waiting thread.
+
+    Methods:
+        __init__
+        start
+        run
+        take
+        send
+        tag
+        stop
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the NerBatcher class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.tagger = cfg.ner_tagger
+        self.log = log
+        self.max_docs = getattr(cfg, "ner_batch_docs", 1)
+        self.max_tokens = getattr(cfg, "ner_batch_tokens", 50000)
+        self.wait = getattr(cfg, "ner_batch_wait", 0.02)
+        self.pending = collections.deque()
+        self.tokens = 0
+        self.first = None
+        self.requests = 0
+        self.docs = 0
+        self.cond = threading.Condition()
+        self.stopped = False
+        self.thread = None
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the thread which sends the batches to the tagger.
+
+        Arguments:
+
+        """
+
+        self.thread = threading.Thread(
+            target=self.run, name="NerBatcher", daemon=True)
+        self.thread.start()
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Send a batch of requests to the tagger when it is full
+            or the oldest request has waited for ner_batch_wait seconds, until
+            stopped.
+
+        Arguments:
+
+        """
+
+        while True:
+
+            with self.cond:
+
+                while not self.pending and not self.stopped:
+                    self.cond.wait()
+
+                if not self.pending:
+                    return
+
+                remaining = self.first + self.wait - time.monotonic()
+
+                while remaining > 0 and not self.stopped \
+                        and len(self.pending) < self.max_docs \
+                        and self.tokens < self.max_tokens:
+                    self.cond.wait(remaining)
+                    remaining = self.first + self.wait - time.monotonic()
+
+                batch = self.take()
+
+            self.send(batch)
+
+    def take(self):
+
+        """Method:  take
+
+        Description:  Remove the next batch of requests from the pending
+            requests.  Called with the condition held.
+
+        Arguments:
+            (output) batch -> List of requests
+
+        """
+
+        batch = [self.pending.popleft()]
+        tokens = len(batch[0]["tokens"])
+
+        while self.pending and len(batch) < self.max_docs \
+                and tokens + len(self.pending[0]["tokens"]) \
+                <= self.max_tokens:
+            batch.append(self.pending.popleft())
+            tokens += len(batch[-1]["tokens"])
+
+        self.tokens -= tokens
+        self.first = self.pending[0]["time"] if self.pending else None
+
+        return batch
+
+    def send(self, batch):
+
+        """Method:  send
+
+        Description:  Classify a batch of requests in one request to the
+            tagger and wake the waiting threads.  A failed request is passed
+            on to each of the waiting threads.
+
+        Arguments:
+            (input) batch -> List of requests
+
+        """
+
+        try:
+            results = self.tagger.tag_sents(
+                [request["tokens"] for request in batch])
+
+            for request, result in zip(batch, results):
+                request["result"] = result
+
+        except Exception as msg:                        # pylint:disable=W0718
+            self.log.log_warn(f"NerBatcher:  Batch of {len(batch)} requests"
+                              f" failed: {msg}")
+
+            for request in batch:
+                request["error"] = msg
+
+        self.requests += 1
+        self.docs += len(batch)
+
+        for request in batch:
+            request["event"].set()
+
+    def tag(self, tokenized_text):
+
+        """Method:  tag
+
+        Description:  Add a list of tokens to the next batch and wait for the
+            categorized tokens.  The tokens are classified directly once the
+            batcher is stopped.
+
+        Arguments:
+            (input) tokenized_text -> List of tokens
+            (output) categorized_text -> List of categorized tokens
+
+        """
+
+        if not tokenized_text:
+            return []
+
+        request = {"tokens": tokenized_text, "time": time.monotonic(),
+                   "event": threading.Event()}
+
+        with self.cond:
+
+            if self.stopped:
+                return self.tagger.tag(tokenized_text)
+
+            if not self.pending:
+                self.first = request["time"]
+
+            self.pending.append(request)
+            self.tokens += len(tokenized_text)
+            self.cond.notify()
+
+        request["event"].wait()
+
+        if "error" in request:
+            raise request["error"]
+
+        return request["result"]
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Send the pending requests and stop the batch thread.
+
+        Arguments:
+
+        """
+
+        with self.cond:
+            self.stopped = True
+            self.cond.notify()
+
+        if self.thread:
+            self.thread.join()
+
+
+def find_tokens(tokenized_text, cfg):
+
+    """Function:  find_tokens
+
+    Description:  Using the Stanford NLP module to classify a list of set of
+        tokens.  Uses the NER batcher or the shared tagger on the
+        configuration module if one has been set up.
+
+    Arguments:
+        (input) tokenized_text -> List of tokens
+        (input) cfg -> Configuration settings module for the program
+        (output) categorized_text -> List of categorized tokens
+
+    """
+
+    tokenized_text = list(tokenized_text)
+    snt = getattr(cfg, "ner_batcher", None) \
+        or getattr(cfg, "ner_tagger", None) or NerTagger(cfg)
+    categorized_text = snt.tag(tokenized_text)
+
+    return categorized_text
+
+
+def tag_pages(pages, cfg):
+
+    """Function:  tag_pages
+
+    Description:  Generator which tokenizes the pages of a document and yields
+        the categorized tokens.  Tokens are collected across pages and sent
+        to the tagger in batches of about stream_batch_tokens tokens.
+
+    Arguments:
+        (input) pages -> Iterator of page text
+        (input) cfg -> Configuration settings module for the program
+        (output) Categorized token
+
+    """
+
+    batch_tokens = getattr(cfg, "stream_batch_tokens", 10000)
+    tokens = []
+
+    for page in pages:
+        tokens.extend(word_tokenize(page))
+
+        if len(tokens) >= batch_tokens:
+            yield from find_tokens(tokens, cfg)
+            tokens = []
+
+    if tokens:
+        yield from find_tokens(tokens, cfg)
+
+
+def get_stream_data(pages, cfg, log, name):
+
+    """Function:  get_stream_data
+
+    Description:  Tokenize, categorize and summarize the pages of a document
+        as they are extracted, so the full text and token lists are never
+        held in memory.  Entity runs which span a page break are joined, the
+        same as in the full text.
+
+    Arguments:
+        (input) pages -> Iterator of page text
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) name -> Name of the calling function for the log
+        (output) status -> True|False - successfully extraction of data
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    final_data = []
+    pages = iter(pages)
+    first = next(pages, None)
+    status = first is not None
+
+    if status:
+        log.log_info(f"{name}:  Streaming pages through the tagger.")
+        final_data = summarize_data(
+            tag_pages(itertools.chain([first], pages), cfg), cfg.token_types)
+
+    return status, final_data
+
+
+def summarize_data(categorized_text, token_types):
+
+    """Function:  summarize_data
+
+    Description:  Summarize a list of categorized tokens and merging them into
+        a single unique list.
+
+    Arguments:
+        (input) categorized_text -> List or iterator of categorized tokens
+        (input) token_types -> List of token types to be accepted
+        (output) data_list -> List of summarized categorized tokens
+
+    """
+
+    token_types = frozenset(token_types)
+    data_list = []
+    tmp_data = []
+    current_type = ""
+
+    for item in categorized_text:
+        current_type, data_list, tmp_data = sort_data(
+            item, current_type, data_list, tmp_data, token_types)
+
+    else:                                               # pylint:disable=W0120
+        if tmp_data:
+            data_list = merge_data(data_list, tmp_data)
+
+    return data_list
+
+
+def sort_data(item, current_type, data_list, tmp_data, token_types):
+
+    """Function:  sort_data
+
+    Description:  Combines a series of same token types into a data set and
+        ignores the "O" (OTHER) token type.  The data_list and tmp_data lists
+        are updated in place, so the caller must own them; summarize_data
+        creates both lists itself.
+
+    Arguments:
+        (input) item -> Single set token
+        (input) current_type -> Current token type
+        (input) data_list -> List of summarized categorized tokens
+        (input) tmp_data -> List of current series of token data
+        (input) token_types -> Set or list of token types
+        (output) current_type -> Current token type
+        (output) data_list -> List of summarized categorized tokens
+        (output) tmp_data -> List of current series of token data
+
+    """
+
+    if item[1] == "O":
+        current_type = item[1]
+
+        if tmp_data:
+            data_list = merge_data(data_list, tmp_data)
+            tmp_data = []
+
+    elif item[1] in token_types and item[1] == current_type:
+        tmp_data.append(item)
+
+    elif item[1] in token_types:
+
+        if tmp_data:
+            data_list = merge_data(data_list, tmp_data)
+
+        tmp_data = [item]
+        current_type = item[1]
+
+    return current_type, data_list, tmp_data
+
+
+def merge_data(data_list, tmp_data):
+
+    """Function:  merge_data
+
+    Description:  Adds a series of similar token data into a single string
+        and adds the token type and string as set to a list.  The data_list
+        is updated in place.
+
+    Arguments:
+        (input) data_list -> List of summarized categorized tokens
+        (input) tmp_data -> List of current series of token data
+        (output) data_list -> List of summarized categorized tokens
+
+    """
+
+    data_list.append(
+        (" ".join([item[0] for item in tmp_data]), tmp_data[0][1]))
+
+    return data_list
+
+
+def get_pypdf2_data(f_name, cfg, log, pdf_data=None, timer=None):
+
+    """Function:  get_pypdf2_data
+
+    Description:  Tokenize, categorize, summarize the raw data from the PDF
+        file extracted using PyPDF2 module.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully extraction of data
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    log.log_info("get_pypdf2_data:  Extracting data using PyPDF2.")
+    final_data = []
+    timer = timer or StageTimer()
+
+    if getattr(cfg, "stream_pages", False):
+
+        with timer.time("pypdf2.stream"):
+            status, final_data = get_stream_data(
+                read_pdf_pages(f_name, log, pdf_data=pdf_data), cfg, log,
+                "get_pypdf2_data")
+
+        timer.count("pypdf2.entities", len(final_data))
+
+        if not status:
+            log.log_warn("get_pypdf2_data:  Extraction failed.")
+
+        return status, final_data
+
+    with timer.time("pypdf2.extract"):
+        status, rawtext = read_pdf(f_name, log, pdf_data=pdf_data)
+
+    if status:
+        timer.count("pypdf2.chars", len(rawtext))
+        log.log_info("get_pypdf2_data:  Running word_tokenizer.")
+
+        with timer.time("pypdf2.tokenize"):
+            tokens = word_tokenize(rawtext)
+
+        timer.count("pypdf2.tokens", len(tokens))
+        log.log_info("get_pypdf2_data:  Finding tokens.")
+
+        with timer.time("pypdf2.ner"):
+            categorized_text = find_tokens(tokens, cfg)
+
+        if categorized_text:
+            log.log_info("get_pypdf2_data:  Summarizing data")
+
+            with timer.time("pypdf2.summarize"):
+                final_data = summarize_data(
+                    categorized_text, cfg.token_types)
+
+            timer.count("pypdf2.entities", len(final_data))
+
+    else:
+        log.log_warn("get_pypdf2_data:  Extraction failed.")
+
+    return status, final_data
+
+
+def normalize_entity(entity, normalize):
+
+    """Function:  normalize_entity
+
+    Description:  Normalize an entity for the duplicate entry check.
+
+    Arguments:
+        (input) entity -> Entity string
+        (input) normalize -> List of normalizations:  whitespace, casefold
+        (output) entity -> Normalized entity string
+
+    """
+
+    if "whitespace" in normalize:
+        entity = " ".join(entity.split())
+
+    if "casefold" in normalize:
+        entity = entity.casefold()
+
+    return entity
+
+
+def create_metadata(metadata, data, seen=None, normalize=None):
+
+    """Function:  create_metadata2
+
+    Description:  Merge a list of data sets into an existing dictionary based
+        on the keys in the dictionary or create new keys in the dictionary
+        based on the data set in the list.  The first entry of a duplicate is
+        kept.
+
+    Arguments:
+        (input) metadata -> Dictionary of meta-data
+        (input) data -> List of data sets
+        (input) seen -> Dictionary of sets of entries already in metadata
+        (input) normalize -> List of normalizations for duplicate checks
+        (output) metadata -> Dictionary of meta-data
+
+    """
+
+    seen = {} if seen is None else seen
+    normalize = list() if normalize is None else normalize
+
+    for item in data:
+
+        # Create new key or index the entries already in the key.
+        if item[1] not in seen:
+            metadata.setdefault(item[1], [])
+            seen[item[1]] = {normalize_entity(entry, normalize)
+                             for entry in metadata[item[1]]}
+
+        # Check for duplicate entry in dictionary's list.
+        entity = normalize_entity(item[0], normalize)
+
+        if entity not in seen[item[1]]:
+            seen[item[1]].add(entity)
+            metadata[item[1]].append(item[0])
+
+    return metadata
+
+
+def extract_pdf(f_name, log, char_encoding=None):
+
+    """Function:  extract_pdf
+
+    Description:  Extract text from PDF using textract module.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) char_encoding -> Character encoding code
+        (output) status -> True|False - successfully extraction of data
+        (output) text -> Raw text
+
+    """
+
+    status = True
+    text = ""
+
+    if char_encoding:
+
+        try:
+            log.log_info("extract_pdf:  Extracting data -> set encoding.")
+            text = textract.process(f_name, encoding=char_encoding)
+
+        except textract.exceptions.ShellError as msg:
+            status = False
+
+            if str(msg).find("Incorrect password") >= 0:
+                log.log_err("extract_pdf:  PDF is password protected.")
+
+            else:
+                log.log_err("extract_pdf:  Error detected.")
+                log.log_err(f"Error Message:  {msg}")
+
+    else:
+        try:
+            log.log_info("extract_pdf:  Extracting data -> default encoding.")
+            text = textract.process(f_name)
+
+        except textract.exceptions.ShellError as msg:
+            status = False
+
+            if str(msg).find("Incorrect password") >= 0:
+                log.log_err("extract_pdf:  PDF is password protected.")
+
+            else:
+                log.log_err("extract_pdf:  Error detected.")
+                log.log_err(f"Error Message:  {msg}")
+
+    return status, text
+
+
+class EncodingDetector():
+
+    """Class:  EncodingDetector
+
+    Description:  Character encoding detection over a bounded sample of the
+        text.  Large texts are sampled from the head, middle and tail and fed
+        to an incremental detector, which stops as soon as it is confident.
+        Uses the cchardet module when installed, otherwise the chardet module.
+        Detected encodings can be cached for each source queue.
+
+    Methods:
+        __init__
+        sample
+        detect_text
+        detect
+
+    """
+
+    def __init__(self, cfg):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the EncodingDetector
+            class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module or None for defaults
+
+        """
+
+        self.sample_size = getattr(cfg, "encoding_sample_size", 65536)
+        self.confidence = getattr(cfg, "encoding_confidence", 1.0)
+        self.use_cache = getattr(cfg, "encoding_cache", False)
+        self.backend = getattr(cfg, "encoding_backend", "chardet")
+
+        if self.backend == "auto" or not cchardet:
+            self.backend = "cchardet" if cchardet else "chardet"
+
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def sample(self, text):
+
+        """Method:  sample
+
+        Description:  Return the head, middle and tail windows of the text or
+            the whole text if it is no larger than the three windows.
+
+        Arguments:
+            (input) text -> Raw text
+            (output) List of text windows
+
+        """
+
+        size = self.sample_size
+
+        if len(text) <= size * 3:
+            return [text]
+
+        middle = (len(text) - size) // 2
+
+        return [text[:size], text[middle:middle + size], text[-size:]]
+
+    def detect_text(self, text):
+
+        """Method:  detect_text
+
+        Description:  Detect the character encoding of the text.
+
+        Arguments:
+            (input) text -> Raw text
+            (output) data -> Dictionary with encoding and confidence
+
+        """
+
+        module = cchardet if self.backend == "cchardet" else chardet
+        windows = self.sample(text)
+
+        if len(windows) == 1:
+            return module.detect(text)
+
+        detector = cchardet.UniversalDetector() \
+            if self.backend == "cchardet" else UniversalDetector()
+
+        for window in windows:
+            detector.feed(window)
+
+            if detector.done:
+                break
+
+        detector.close()
+
+        return detector.result
+
+    def detect(self, text, log, queue_name=None):
+
+        """Method:  detect
+
+        Description:  Return the detected character encoding if the detector
+            is confident enough, using the cached encoding for the queue when
+            caching is enabled.
+
+        Arguments:
+            (input) text -> Raw text
+            (input) log -> Log class instance
+            (input) queue_name -> Name of the source queue
+            (output) char_encoding -> Character encoding code or None
+            (output) elapsed -> Seconds spent detecting the encoding
+
+        """
+
+        if self.use_cache and queue_name:
+
+            with self.lock:
+
+                if queue_name in self.cache:
+                    return self.cache[queue_name], 0.0
+
+        start = time.perf_counter()
+        data = self.detect_text(text)
+        elapsed = time.perf_counter() - start
+        char_encoding = None
+        log.log_info(f"EncodingDetector:  Detection took {elapsed:.3f}s with"
+                     f" {self.backend}.")
+
+        if data["encoding"] and data["confidence"] is not None \
+           and data["confidence"] >= self.confidence:
+            char_encoding = data["encoding"]
+
+            if self.use_cache and queue_name:
+
+                with self.lock:
+                    self.cache[queue_name] = char_encoding
+
+        return char_encoding, elapsed
+
+
+def recode_text(text, char_encoding):
+
+    """Function:  recode_text
+
+    Description:  Encode text extracted by textract with its default utf-8
+        encoding into another character encoding, the same as running textract
+        again with the encoding set.
+
+    Arguments:
+        (input) text -> Raw text in utf-8
+        (input) char_encoding -> Character encoding code
+        (output) text -> Raw text in the character encoding
+
+    """
+
+    if isinstance(text, str):
+        return text.encode(char_encoding, "ignore")
+
+    if codecs.lookup(char_encoding).name == "utf-8":
+        return text
+
+    return text.decode("utf-8", "ignore").encode(char_encoding, "ignore")
+
+
+def get_textract_text(f_name, log, detector=None, queue_name=None,
+                      timer=None):
+
+    """Function:  get_textract_text
+
+    Description:  Extract raw text from PDF using the textract module with
+        the detected character encoding.  The text is returned decoded with
+        the encoding it was recoded to, so it can be merged with the text of
+        the other extractions without knowing its encoding.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) detector -> EncodingDetector class instance
+        (input) queue_name -> Name of the source queue
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully extraction of data
+        (output) rawtext -> Raw text
+
+    """
+
+    status, rawtext = extract_pdf(f_name, log)
+
+    if status:
+        detector = detector or EncodingDetector(None)
+        char_encoding, elapsed = detector.detect(rawtext, log, queue_name)
+
+        if timer:
+            timer.add("textract.detect", elapsed)
+
+        if char_encoding:
+            log.log_info(f"get_textract_text:  Detected character encode:"
+                         f" {char_encoding}")
+            rawtext = recode_text(rawtext, char_encoding)
+
+        if isinstance(rawtext, bytes):
+            rawtext = rawtext.decode(char_encoding or "utf-8", "replace")
+
+    return status, rawtext
+
+
+def textract_pages(text):
+
+    """Function:  textract_pages
+
+    Description:  Generator which yields the text of each page of the
+        textract text, which separates the pages with form feeds.
+
+    Arguments:
+        (input) text -> Raw text
+        (output) Text of a page
+
+    """
+
+    sep = b"\f" if isinstance(text, bytes) else "\f"
+    start = 0
+    end = text.find(sep)
+
+    while end >= 0:
+        yield text[start:end]
+        start = end + 1
+        end = text.find(sep, start)
+
+    yield text[start:]
+
+
+def get_textract_stream(tmptext, rawtext, cfg, log):
+
+    """Function:  get_textract_stream
+
+    Description:  Tokenize, categorize and summarize the textract text a page
+        at a time.  On a UnicodeDecodeError, each of the textract_codes is
+        tried in turn.
+
+    Arguments:
+        (input) tmptext -> Raw text from textract
+        (input) rawtext -> Raw text in the detected character encoding
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    final_data = []
+
+    try:
+        _, final_data = get_stream_data(
+            textract_pages(rawtext), cfg, log, "get_textract_stream")
+
+    except UnicodeDecodeError:
+        log.log_warn("get_textract_stream:  UnicodeDecodeError detected.")
+
+        for char_encoding in cfg.textract_codes:
+            log.log_info(f"get_textract_stream:  Trying encoding code:"
+                         f" {char_encoding}")
+
+            try:
+                _, final_data = get_stream_data(
+                    textract_pages(recode_text(tmptext, char_encoding)), cfg,
+                    log, "get_textract_stream")
+                break
+
+            except UnicodeDecodeError:
+                continue
+
+        else:
+            log.log_warn("get_textract_stream:  No encoding code detected.")
+
+    return final_data
+
+
+def get_textract_data(f_name, cfg, log, queue_name=None, timer=None):
+
+    """Function:  get_textract_data
+
+    Description:  Process data using the textract module.  The textract
+        module is run once and any change of character encoding is done on
+        the extracted text.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) queue_name -> Name of the source queue
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully extraction of data
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    log.log_info("get_textract_data:  Extracting data using textract.")
+    final_data = []
+    timer = timer or StageTimer()
+
+    # Get character encoding.
+    log.log_info("get_textract_data:  Detecting encode in PDF file.")
+
+    with timer.time("textract.extract"):
+        status, tmptext = extract_pdf(f_name, log)
+
+    if status:
+        timer.count("textract.chars", len(tmptext))
+        suberrstr = "codec can't decode byte"
+        char_encoding = None
+        status_flag = True
+        categorized_text = []
+        detector = getattr(cfg, "encoding_detector", None) \
+            or EncodingDetector(cfg)
+        char_encoding, elapsed = detector.detect(tmptext, log, queue_name)
+        timer.add("textract.detect", elapsed)
+
+        if char_encoding:
+            log.log_info(f"get_textract_data:  Detected character encode:"
+                         f" {char_encoding}")
+
+        rawtext = recode_text(tmptext, char_encoding) if char_encoding \
+            else tmptext
+
+        if getattr(cfg, "stream_pages", False):
+
+            with timer.time("textract.stream"):
+                final_data = get_textract_stream(tmptext, rawtext, cfg, log)
+
+            timer.count("textract.entities", len(final_data))
+
+            return status, final_data
+
+        log.log_info("get_textract_data:  Running word_tokenizer.")
+        start = time.monotonic()
+
+        try:
+            tokens = word_tokenize(rawtext)
+
+        except UnicodeDecodeError as msg:
+            log.log_warn("get_textract_data:  UnicodeDecodeError detected.")
+            status_flag = False
+
+            # Try the encoding in the error first, then the other codes.
+            codes = list(cfg.textract_codes)
+
+            if str(msg).find(suberrstr) >= 0 and msg.args[0] in codes:
+                codes.remove(msg.args[0])
+                codes.insert(0, msg.args[0])
+
+            for char_encoding in codes:
+                log.log_info(f"get_textract_data:  Trying encoding code:"
+                             f" {char_encoding}")
+
+                try:
+                    tokens = word_tokenize(
+                        recode_text(tmptext, char_encoding))
+                    status_flag = True
+                    break
+
+                except UnicodeDecodeError:
+                    continue
+
+            if not status_flag:
+                log.log_warn("get_textract_data:  No encoding code detected.")
+
+        timer.add("textract.tokenize", time.monotonic() - start)
+
+        if status_flag:
+            timer.count("textract.tokens", len(tokens))
+            log.log_info("get_textract_data:  Finding tokens.")
+
+            with timer.time("textract.ner"):
+                categorized_text = find_tokens(tokens, cfg)
+
+        if categorized_text:
+            log.log_info("get_textract_data:  Summarizing data.")
+
+            with timer.time("textract.summarize"):
+                final_data = summarize_data(
+                    categorized_text, cfg.token_types)
+
+            timer.count("textract.entities", len(final_data))
+
+    else:
+        log.log_err("get_textract_data:  Extraction failed.")
+
+    return status, final_data
+
+
+def get_page_ranges(pages, workers):
+
+    """Function:  get_page_ranges
+
+    Description:  Split the pages of a document into a range of pages for
+        each worker.
+
+    Arguments:
+        (input) pages -> Number of pages in the document
+        (input) workers -> Number of workers
+        (output) ranges -> List of (start, end) page ranges
+
+    """
+
+    size = -(-pages // workers)
+
+    return [(start, min(start + size, pages))
+            for start in range(0, pages, size)]
+
+
+def pdfminer_page_range(f_name, start, end, pdf_data=None):
+
+    """Function:  pdfminer_page_range
+
+    Description:  Extract text from a range of pages of a PDF file using the
+        pdfminer module.  Run in a worker process, so it opens the PDF file
+        itself.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) start -> Index of the first page
+        (input) end -> Index after the last page
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (output) Raw text of the pages
+
+    """
+
+    out_string = io.BytesIO()
+
+    with open_pdf(f_name, pdf_data) as f_hdlr:
+        doc = PDFDocument(PDFParser(f_hdlr))
+        rsrcmgr = PDFResourceManager()
+        device = TextConverter(rsrcmgr, out_string, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+
+        for page in itertools.islice(PDFPage.create_pages(doc), start, end):
+            interpreter.process_page(page)
+
+    return out_string.getvalue()
+
+
+def pdf_page_count(doc):
+
+    """Function:  pdf_page_count
+
+    Description:  Return the number of pages in the page tree of a PDF
+        document.  A missing or malformed page tree returns 0.
+
+    Arguments:
+        (input) doc -> PDFDocument class instance
+        (output) pages -> Number of pages
+
+    """
+
+    try:
+        pages = resolve1(doc.catalog["Pages"])["Count"]
+
+        # The count may itself be an indirect object.
+        if not isinstance(pages, int):
+            pages = resolve1(pages)
+
+    except (KeyError, TypeError, ValueError, AttributeError,
+            pdfminer.psparser.PSException):
+        pages = 0
+
+    return pages if isinstance(pages, int) else 0
+
+
+def pdf_to_string(                                      # pylint:disable=R0913
+        f_name, log, pdf_data=None, workers=1, min_pages=100, executor=None):
+
+    """Function:  pdf_to_string
+
+    Description:  Extract text from PDF using pdfminer module.  If a process
+        pool is passed, PDF files with at least min_pages pages are split
+        into page ranges which are extracted in the pool.  A PDF file with a
+        page tree which cannot be read is extracted serially.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (input) workers -> Number of page ranges for large PDF files
+        (input) min_pages -> Number of pages to use the process pool
+        (input) executor -> Process pool shared across messages
+        (output) status -> True|False - successfully extraction of data
+        (output) text -> Raw text
+
+    """
+
+    status = True
+    out_string = io.BytesIO()
+    data = None
+
+    with open_pdf(f_name, pdf_data) as f_hdlr:
+        parser = PDFParser(f_hdlr)
+
+        try:
+            doc = PDFDocument(parser)
+            pages = pdf_page_count(doc) \
+                if executor and workers > 1 else 0
+
+            if pages and pages >= min_pages:
+                log.log_info(f"pdf_to_string:  Extracting data from {pages}"
+                             f" pages in {workers} processes...")
+                ranges = get_page_ranges(pages, workers)
+                texts = list(executor.map(
+                    pdfminer_page_range, [f_name] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges], [pdf_data] * len(ranges)))
+
+                # Reassemble the text in page order.
+                data = texts[0][:0].join(texts)
+
+            else:
+                rsrcmgr = PDFResourceManager()
+                device = TextConverter(
+                    rsrcmgr, out_string, laparams=LAParams())
+                interpreter = PDFPageInterpreter(rsrcmgr, device)
+                log.log_info("pdf_to_string:  Extracting data...")
+
+                for page in PDFPage.create_pages(doc):
+                    interpreter.process_page(page)
+
+        except pdfminer.pdfdocument.PDFPasswordIncorrect:
+            log.log_err("pdf_to_string:  PDF is password protected.")
+            status = False
+            text = ""
+
+    data = out_string.getvalue() if data is None else data
+    text = data.replace(".", "")
+
+    return status, text
+
+
+def pdfminer_pages(f_name, log, pdf_data=None):
+
+    """Function:  pdfminer_pages
+
+    Description:  Generator which yields the text of each page of a PDF file
+        using the pdfminer module.  No pages are returned if the PDF file is
+        password protected.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (output) Text of a page
+
+    """
+
+    out_string = io.StringIO()
+
+    with open_pdf(f_name, pdf_data) as f_hdlr:
+        parser = PDFParser(f_hdlr)
+
+        try:
+            doc = PDFDocument(parser)
+
+        except pdfminer.pdfdocument.PDFPasswordIncorrect:
+            log.log_err("pdfminer_pages:  PDF is password protected.")
+            return
+
+        rsrcmgr = PDFResourceManager()
+        device = TextConverter(rsrcmgr, out_string, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        log.log_info("pdfminer_pages:  Extracting data...")
+
+        for page in PDFPage.create_pages(doc):
+            interpreter.process_page(page)
+            yield out_string.getvalue().replace(".", "")
+            out_string.seek(0)
+            out_string.truncate(0)
+
+
+def get_pdfminer_data(f_name, cfg, log, pdf_data=None, timer=None):
+
+    """Function:  get_pdfminer_data
+
+    Description:  Process data using the pdfminer module.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully extraction of data
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    final_data = []
+    timer = timer or StageTimer()
+    log.log_info("get_pdfminer_data:  Extracting data using pdfminer.")
+
+    if getattr(cfg, "stream_pages", False):
+
+        with timer.time("pdfminer.stream"):
+            status, final_data = get_stream_data(
+                pdfminer_pages(f_name, log, pdf_data=pdf_data), cfg, log,
+                "get_pdfminer_data")
+
+        timer.count("pdfminer.entities", len(final_data))
+
+        if not status:
+            log.log_err("get_pdfminer_data:  Extraction failed.")
+
+        return status, final_data
+
+    with timer.time("pdfminer.extract"):
+        status, rawtext = pdf_to_string(
+            f_name, log, pdf_data=pdf_data,
+            workers=getattr(cfg, "pdfminer_workers", 1),
+            min_pages=getattr(cfg, "pdfminer_min_pages", 100),
+            executor=getattr(cfg, "pdfminer_pool", None))
+
+    if status:
+        timer.count("pdfminer.chars", len(rawtext))
+        log.log_info("get_pdfminer_data:  Running word_tokenizer.")
+
+        with timer.time("pdfminer.tokenize"):
+            tokens = word_tokenize(rawtext)
+
+        timer.count("pdfminer.tokens", len(tokens))
+        log.log_info("get_pdfminer_data:  Finding tokens.")
+
+        with timer.time("pdfminer.ner"):
+            categorized_text = find_tokens(tokens, cfg)
+
+        if categorized_text:
+            log.log_info("get_pdfminer_data:  Summarizing data")
+
+            with timer.time("pdfminer.summarize"):
+                final_data = summarize_data(
+                    categorized_text, cfg.token_types)
+
+            timer.count("pdfminer.entities", len(final_data))
+
+    else:
+        log.log_err("get_pdfminer_data:  Extraction failed.")
+
+    return status, final_data
+
+
+def dedup_text(texts):
+
+    """Function:  dedup_text
+
+    Description:  Merge the text from several extractions into one text with
+        each distinct line kept once, in order of first appearance.  Lines
+        are compared with periods removed and whitespace collapsed, as the
+        pdfminer extraction removes periods from the text.  Texts in bytes
+        are decoded as utf-8.
+
+    Arguments:
+        (input) texts -> List of raw texts
+        (output) Text of distinct lines
+
+    """
+
+    seen = set()
+    lines = []
+
+    for text in texts:
+
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="replace")
+
+        for line in text.splitlines():
+            key = " ".join(line.replace(".", "").split())
+
+            if key and key not in seen:
+                seen.add(key)
+                lines.append(line)
+
+    return "\n".join(lines)
+
+
+def run_extractors(extractors, args, workers=1):
+
+    """Function:  run_extractors
+
+    Description:  Run a list of extraction functions with the same arguments.
+        The functions are run concurrently in a thread pool when workers is
+        greater than one.  Results are returned in the order of the list.
+
+    Arguments:
+        (input) extractors -> List of extraction functions
+        (input) args -> List of arguments passed to each function
+        (input) workers -> Number of threads to run the functions in
+        (output) results -> List of results from the functions
+
+    """
+
+    extractors = list(extractors)
+
+    if workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers) as executor:
+            futures = [executor.submit(func, *args) for func in extractors]
+            results = [future.result() for future in futures]
+
+    else:
+        results = [func(*args) for func in extractors]
+
+    return results
+
+
+def get_union_data(                                     # pylint:disable=R0913
+        f_name, cfg, log, pdf_data=None, queue_name=None, timer=None):
+
+    """Function:  get_union_data
+
+    Description:  Extract the text with the PyPDF2, textract and pdfminer
+        modules and tokenize, categorize, summarize the distinct text from all
+        three extractions in a single pass.
+
+    Arguments:
+        (input) f_name -> PDF file name
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory, instead of the file
+        (input) queue_name -> Name of the source queue
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully extraction of data
+        (output) final_data -> List of categorized tokens from PDF file
+
+    """
+
+    log.log_info("get_union_data:  Extracting data using all modules.")
+    final_data = []
+    texts = []
+    timer = timer or StageTimer()
+
+    results = run_extractors(
+        [timer.wrap("pypdf2.extract",
+                    functools.partial(read_pdf, pdf_data=pdf_data)),
+         timer.wrap("textract.extract",
+                    functools.partial(
+                        get_textract_text, queue_name=queue_name,
+                        detector=getattr(cfg, "encoding_detector", None),
+                        timer=timer)),
+         timer.wrap("pdfminer.extract",
+                    functools.partial(
+                        pdf_to_string, pdf_data=pdf_data,
+                        workers=getattr(cfg, "pdfminer_workers", 1),
+                        min_pages=getattr(cfg, "pdfminer_min_pages", 100),
+                        executor=getattr(cfg, "pdfminer_pool", None)))],
+        (f_name, log),
+        getattr(cfg, "extract_workers", 1))
+
+    for status, rawtext in results:
+
+        if status:
+            texts.append(rawtext)
+
+        else:
+            timer.count("extract_failed", 1)
+
+    status = bool(texts)
+
+    if status:
+        log.log_info("get_union_data:  Removing duplicate text.")
+
+        with timer.time("union.dedup"):
+            rawtext = dedup_text(texts)
+
+        timer.count("union.chars", len(rawtext))
+        log.log_info("get_union_data:  Running word_tokenizer.")
+
+        with timer.time("union.tokenize"):
+            tokens = word_tokenize(rawtext)
+
+        timer.count("union.tokens", len(tokens))
+        log.log_info("get_union_data:  Finding tokens.")
+
+        with timer.time("union.ner"):
+            categorized_text = find_tokens(tokens, cfg)
+
+        if categorized_text:
+            log.log_info("get_union_data:  Summarizing data")
+
+            with timer.time("union.summarize"):
+                final_data = summarize_data(
+                    categorized_text, cfg.token_types)
+
+            timer.count("union.entities", len(final_data))
+
+    else:
+        log.log_err("get_union_data:  All extractions failed.")
+
+    return status, final_data
+
+
+def store_done(                                         # pylint:disable=R0913
+        queue, f_name, log, on_done, status, err_msg, record=None,
+        conflict=None):
+
+    """Function:  store_done
+
+    Description:  Complete a message after its metadata is flushed from the
+        write buffer.  The PDF file is moved if the insert was successful.
+        If the content was already in the collection, conflict applies the
+        dedup setting of the queue instead.
+
+    Arguments:
+        (input) queue -> RabbitMQ queue
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) on_done -> Function called with the status of the message
+        (input) status -> True|False|None - successful insert or None if the
+            content is already in the collection
+        (input) err_msg -> Error message or None
+        (input) record -> Function called once the insert is successful
+        (input) conflict -> Function returning the status of a message whose
+            content is already in the collection
+
+    """
+
+    if status is None and conflict:
+        log.log_warn(f"store_done:  Content already inserted: {err_msg}")
+
+        try:
+            status = conflict()
+
+        except OSError as msg:
+            log.log_err(f"store_done:  Duplicate PDF failed: {msg}")
+            status = False
+
+    elif status:
+
+        if record:
+            record()
+
+        log.log_info(f'store_done:  Moving PDF to: {queue["directory"]}')
+
+        try:
+            gen_libs.mv_file2(
+                f_name, queue["directory"], os.path.basename(f_name))
+
+        except OSError as msg:
+            log.log_err(f"store_done:  Move of PDF failed: {msg}")
+            status = False
+
+    else:
+        log.log_err("store_done: Insert of data into MongoDB failed.")
+        log.log_err(f"Mongo error message:  {err_msg}")
+
+    on_done(status)
+
+
+def process_message(                                    # pylint:disable=R0913
+        queue, cfg, f_name, log, pdf_data=None, timer=None, on_done=None,
+        content_hash=None):
+
+    """Function:  process_message
+
+    Description:  Extract metadata from message.  If the PDF file contents
+        are passed in, the PyPDF2 and pdfminer modules extract from memory and
+        only the textract module reads the file.  If a write buffer is set up
+        and on_done is passed, the metadata is added to the buffer and None
+        is returned.  on_done is called with the status once the buffer is
+        flushed.
+
+    Arguments:
+        (input) queue -> RabbitMQ queue
+        (input) cfg -> Configuration settings module for the program
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) pdf_data -> PDF file contents in memory
+        (input) timer -> StageTimer class instance
+        (input) on_done -> Function called with the status of a buffered
+            message
+        (input) content_hash -> SHA-256 of the PDF file for the result cache
+            and to add to the content index once the metadata is inserted
+        (output) status -> True|False|None - successfully extraction of data
+
+    """
+
+    status = True
+    timer = timer or StageTimer()
+    write_buffer = getattr(cfg, "write_buffer", None)
+    log.log_info("process_message:  Extracting and processing metadata.")
+    dtg = datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y-%m-%d_%H:%M:%S")
+    metadata = {"FileName": os.path.basename(f_name),
+                "Directory": queue["directory"],
+                "DateTime": dtg}
+    record = None
+    index = getattr(cfg, "content_index", None)
+    cache = getattr(cfg, "result_cache", None)
+    key = cache.key(content_hash) if cache and content_hash else None
+    cached = None
+
+    if content_hash and index and \
+       queue.get("dedup", "reprocess") != "reprocess":
+        metadata["ContentHash"] = content_hash
+        record = functools.partial(
+            index.add, content_hash, metadata["FileName"])
+
+    base = set(metadata)
+    seen = {}
+    normalize = getattr(cfg, "entity_normalize", [])
+
+    if key:
+        with timer.time("cache"):
+            cached = cache.get(key)
+
+    if cached is not None:
+        log.log_info("process_message:  Adding metadata from result cache.")
+        metadata.update(cached)
+        timer.count("cache_hits", 1)
+        status_extract = True
+
+    elif getattr(cfg, "ner_single_pass", False):
+
+        # Use all modules to extract data and categorize it once.
+        status_union, final_data = get_union_data(
+            f_name, cfg, log, pdf_data=pdf_data, queue_name=queue["queue"],
+            timer=timer)
+
+        if status_union:
+            log.log_info("process_message:  Adding metadata from union.")
+
+            with timer.time("metadata"):
+                metadata = create_metadata(
+                    metadata, final_data, seen, normalize)
+
+        status_extract = status_union
+
+    else:
+
+        # Use the PyPDF2, textract and pdfminer modules to extract data.
+        extractors = [
+            ("pypdf2", functools.partial(
+                get_pypdf2_data, pdf_data=pdf_data, timer=timer)),
+            ("textract", functools.partial(
+                get_textract_data, queue_name=queue["queue"], timer=timer)),
+            ("pdfminer", functools.partial(
+                get_pdfminer_data, pdf_data=pdf_data, timer=timer))]
+        results = run_extractors(
+            [func for _, func in extractors], (f_name, cfg, log),
+            getattr(cfg, "extract_workers", 1))
+        status_extract = False
+
+        for (name, _), (status_data, final_data) in zip(extractors, results):
+
+            if status_data:
+                log.log_info(f"process_message:  Adding metadata from {name}.")
+
+                with timer.time("metadata"):
+                    metadata = create_metadata(
+                        metadata, final_data, seen, normalize)
+
+                status_extract = True
+
+            else:
+                timer.count("extract_failed", 1)
+
+    # Entities from a partly failed extraction are not cached, as the
+    # failure may be transient.
+    if key and cached is None and status_extract \
+       and not timer.counts.get("extract_failed"):
+        cache.put(key, {name: value for name, value in metadata.items()
+                        if name not in base})
+
+    conflict = functools.partial(
+        process_conflict, queue, cfg, f_name, log, content_hash, timer) \
+        if record else None
+
+    if status_extract and write_buffer and on_done:
+        log.log_info("process_message:  Adding metadata to write buffer.")
+        write_buffer.add(metadata, functools.partial(
+            store_done, queue, f_name, log, on_done, record=record,
+            conflict=conflict), timer)
+        status = None
+
+    elif status_extract:
+        log.log_info("process_message:  Insert metadata into MongoDB.")
+
+        with timer.time("mongo"):
+            mongo_stat = insert_metadata(cfg, metadata)
+
+        if mongo_stat[0] is None and conflict:
+            log.log_warn(f"process_message:  Content already inserted:"
+                         f" {mongo_stat[1]}")
+            status = conflict()
+
+        elif not mongo_stat[0]:
+            log.log_err("process_message: Insert of data into MongoDB failed.")
+            log.log_err(f"Mongo error message:  {mongo_stat[1]}")
+            status = False
+
+        else:
+            if record:
+                record()
+
+            log.log_info(
+                f'process_message:  Moving PDF to: {queue["directory"]}')
+
+            with timer.time("move"):
+                gen_libs.mv_file2(
+                    f_name, queue["directory"], os.path.basename(f_name))
+
+    else:
+        log.log_err("process_message:  All extractions methods failed.")
+        status = False
+
+    return status
+
+
+def insert_metadata(cfg, metadata):
+
+    """Function:  insert_metadata
+
+    Description:  Insert a metadata document through the mongo_sink on the
+        configuration module, if set, otherwise with a new connection.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) metadata -> Metadata document
+        (output) status -> True|False - successful insert
+        (output) err_msg -> Error message or None
+
+    """
+
+    sink = getattr(cfg, "mongo_sink", None)
+
+    if sink:
+        return sink.insert(metadata)
+
+    return mongo_libs.ins_doc(
+        cfg.mongo, cfg.mongo.dbs, cfg.mongo.tbl, metadata)
+
+
+def process_duplicate(                                  # pylint:disable=R0913
+        queue, cfg, f_name, log, content_hash, original, timer):
+
+    """Function:  process_duplicate
+
+    Description:  Process a PDF file already in the content index without
+        extracting it again.  With the queue dedup setting of skip, the PDF
+        file is removed and the existing metadata is reused.  With link, a
+        document referencing the existing metadata is inserted and the PDF
+        file is moved as for a new file.
+
+    Arguments:
+        (input) queue -> RabbitMQ queue
+        (input) cfg -> Configuration settings module for the program
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) content_hash -> SHA-256 of the PDF file
+        (input) original -> File name of the PDF file first processed
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully processed
+
+    """
+
+    mode = queue["dedup"]
+    hits = cfg.content_index.hit(mode)
+    timer.count("dedup_hits", 1)
+    log.log_info(f"process_duplicate:  Same content as {original}, dedup"
+                 f" {mode} hits: {hits}")
+
+    if mode != "link":
+        os.remove(f_name)
+
+        return True
+
+    dtg = datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y-%m-%d_%H:%M:%S")
+    metadata = {"FileName": os.path.basename(f_name),
+                "Directory": queue["directory"],
+                "DateTime": dtg,
+                "DuplicateOf": content_hash,
+                "OriginalFileName": original}
+
+    with timer.time("mongo"):
+        status, err_msg = insert_metadata(cfg, metadata)
+
+    if not status:
+        log.log_err("process_duplicate: Insert of data into MongoDB failed.")
+        log.log_err(f"Mongo error message:  {err_msg}")
+
+        return False
+
+    log.log_info(f'process_duplicate:  Moving PDF to: {queue["directory"]}')
+
+    with timer.time("move"):
+        gen_libs.mv_file2(f_name, queue["directory"], os.path.basename(f_name))
+
+    return True
+
+
+def process_conflict(                                   # pylint:disable=R0913
+        queue, cfg, f_name, log, content_hash, timer):
+
+    """Function:  process_conflict
+
+    Description:  Process a PDF file whose content was inserted into Mongo by
+        another daemon after the content index was checked.  The dedup
+        setting of the queue is applied as for a PDF file found in the
+        content index.  The original file name is read from the document in
+        Mongo, as the other daemon has its own content index, and from the
+        content index if not found in Mongo.
+
+    Arguments:
+        (input) queue -> RabbitMQ queue
+        (input) cfg -> Configuration settings module for the program
+        (input) f_name -> PDF file name
+        (input) log -> Log class instance
+        (input) content_hash -> SHA-256 of the PDF file
+        (input) timer -> StageTimer class instance
+        (output) status -> True|False - successfully processed
+
+    """
+
+    sink = getattr(cfg, "mongo_sink", None)
+    original = sink.find_file_name(content_hash) if sink else None
+
+    if original is None:
+        original = cfg.content_index.lookup(content_hash)
+
+    return process_duplicate(
+        queue, cfg, f_name, log, content_hash, original, timer)
+
+
+def get_prefetch(cfg, queue):
+
+    """Function:  get_prefetch
+
+    Description:  Return the prefetch count for a queue.  The queue entry
+        overrides the global setting.  If neither is set and more than one
+        worker is used, the number of workers is used.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) queue -> RabbitMQ queue
+        (output) prefetch -> Prefetch count or None for no limit
+
+    """
+
+    workers = getattr(cfg, "workers", 1)
+    prefetch = queue.get(
+        "prefetch_count", getattr(cfg, "prefetch_count", None))
+
+    if not prefetch and workers > 1:
+        prefetch = workers
+
+    return prefetch or None
+
+
+class AckTracker():
+
+    """Class:  AckTracker
+
+    Description:  Acknowledges RabbitMQ deliveries in delivery order.  A
+        finished delivery is held until all earlier deliveries on the channel
+        are finished, then the run of finished deliveries is acknowledged
+        with a single multiple-ack.  Deliveries to requeue are nacked on their
+        own.  The acks are passed to the connection thread, as the RabbitMQ
+        connection is not thread safe.
+
+    Methods:
+        __init__
+        received
+        done
+        send
+
+    """
+
+    def __init__(self, rmq, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the AckTracker class.
+
+        Arguments:
+            (input) rmq -> RabbitMQ class instance
+            (input) log -> Log class instance
+
+        """
+
+        self.rmq = rmq
+        self.log = log
+        self.pending = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def received(self, tag):
+
+        """Method:  received
+
+        Description:  Add a delivery to the deliveries in progress.  Called
+            in delivery order on the connection thread.
+
+        Arguments:
+            (input) tag -> Delivery tag
+
+        """
+
+        with self.lock:
+            self.pending[tag] = None
+
+    def done(self, tag, requeue=False):
+
+        """Method:  done
+
+        Description:  Mark a delivery as finished and send the acks for the
+            run of finished deliveries at the start of the deliveries in
+            progress.  Unknown or already finished deliveries are ignored.
+
+        Arguments:
+            (input) tag -> Delivery tag
+            (input) requeue -> True|False - nack and requeue the delivery
+
+        """
+
+        with self.lock:
+
+            if self.pending.get(tag, "") is not None:
+                return
+
+            self.pending[tag] = "nack" if requeue else "ack"
+            last = None
+
+            while self.pending:
+                first, state = next(iter(self.pending.items()))
+
+                if state is None:
+                    break
+
+                self.pending.popitem(last=False)
+
+                if state == "ack":
+                    last = first
+                    continue
+
+                if last is not None:
+                    self.rmq.connection.add_callback_threadsafe(
+                        functools.partial(self.send, "ack", last))
+                    last = None
+
+                self.rmq.connection.add_callback_threadsafe(
+                    functools.partial(self.send, "nack", first))
+
+            # Queued while locked, so the acks stay in delivery order.
+            if last is not None:
+                self.rmq.connection.add_callback_threadsafe(
+                    functools.partial(self.send, "ack", last))
+
+    def send(self, action, tag):
+
+        """Method:  send
+
+        Description:  Send an ack or nack on the connection thread.
+
+        Arguments:
+            (input) action -> ack|nack
+            (input) tag -> Delivery tag
+
+        """
+
+        if action == "ack":
+            self.log.log_info(f"AckTracker:  Deleting messages up to delivery"
+                              f" tag: {tag}")
+            self.rmq.channel.basic_ack(delivery_tag=tag, multiple=True)
+
+        else:
+            self.log.log_warn(f"AckTracker:  Requeuing message with delivery"
+                              f" tag: {tag}")
+            self.rmq.channel.basic_nack(delivery_tag=tag, requeue=True)
+
+
+class WriteBuffer():
+
+    """Class:  WriteBuffer
+
+    Description:  Write-behind buffer of metadata documents.  The documents
+        are inserted with a single insert_many call once write_batch_size
+        documents are buffered or the oldest document has waited
+        write_flush_interval seconds.  The callback of each document is
+        called with the result of its insert.
+
+    Methods:
+        __init__
+        start
+        run
+        add
+        flush
+        stop
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the WriteBuffer class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.sink = cfg.mongo_sink
+        self.log = log
+        self.batch_size = getattr(cfg, "write_batch_size", 1)
+        self.interval = getattr(cfg, "write_flush_interval", 1.0)
+        self.entries = []
+        self.first = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the thread which flushes the buffer on the time
+            threshold.
+
+        Arguments:
+
+        """
+
+        self.thread = threading.Thread(
+            target=self.run, name="WriteBuffer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Flush the buffer when the oldest document has waited
+            for the flush interval, until stopped.
+
+        Arguments:
+
+        """
+
+        while not self.stopped.wait(self.interval / 2):
+
+            with self.lock:
+                due = self.entries \
+                    and time.monotonic() - self.first >= self.interval
+
+            if due:
+                self.flush()
+
+    def add(self, doc, callback, timer=None):
+
+        """Method:  add
+
+        Description:  Add a document to the buffer and flush the buffer if it
+            is full.
+
+        Arguments:
+            (input) doc -> Metadata document
+            (input) callback -> Function called with the status and error
+                message of the insert
+            (input) timer -> StageTimer class instance
+
+        """
+
+        with self.lock:
+
+            if not self.entries:
+                self.first = time.monotonic()
+
+            self.entries.append((doc, callback, timer))
+            full = len(self.entries) >= self.batch_size
+
+        if full:
+            self.flush()
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Insert the buffered documents and call their callbacks.
+            If the insert raises an error, each callback is called with a
+            failed status.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            entries, self.entries = self.entries, []
+
+        if not entries:
+            return
+
+        start = time.monotonic()
+
+        # The callbacks must run, or their messages are never acknowledged.
+        try:
+            results = self.sink.insert_many([doc for doc, _, _ in entries])
+
+        except Exception as msg:                        # pylint:disable=W0718
+            self.log.log_err(f"WriteBuffer:  Insert failed: {msg}")
+            results = [(False, str(msg))] * len(entries)
+
+        elapsed = time.monotonic() - start
+        self.log.log_info(f"WriteBuffer:  Inserted {len(entries)} documents"
+                          f" in {elapsed:.3f}s.")
+
+        for (_, callback, timer), (status, err_msg) in zip(entries, results):
+
+            if timer:
+                timer.add("mongo", elapsed)
+
+            try:
+                callback(status, err_msg)
+
+            except Exception as msg:                    # pylint:disable=W0718
+                self.log.log_err(f"WriteBuffer:  Finishing message failed:"
+                                 f" {msg}")
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the flush thread and flush the buffer.
+
+        Arguments:
+
+        """
+
+        self.stopped.set()
+
+        if self.thread:
+            self.thread.join()
+
+        self.flush()
+
+
+def process_worker(                                    # pylint:disable=R0913
+        rmq, log, cfg, method, body, tracker=None):
+
+    """Function:  process_worker
+
+    Description:  Process message from RabbitMQ queue in a worker thread.  The
+        acknowledgement is passed back to the connection thread, as the
+        RabbitMQ connection is not thread safe.  A message that fails with an
+        unexpected error is saved as a non-processed message and
+        acknowledged, so it does not hold a prefetch slot or get redelivered
+        only to fail again.  With an AckTracker, the tracker acknowledges the
+        message once it is finished with.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) method -> Delivery properties
+        (input) body -> Message body
+        (input) tracker -> AckTracker class instance
+
+    """
+
+    done = functools.partial(tracker.done, method.delivery_tag) \
+        if tracker else None
+
+    try:
+        process_msg(rmq, log, cfg, method, body, done=done)
+
+    except Exception as msg:                            # pylint:disable=W0718
+        log.log_err(f"process_worker:  Message with Routing Key:"
+                    f" {method.routing_key} failed: {msg}")
+
+        try:
+            non_proc_msg(rmq, log, cfg, body, f"Unexpected error: {msg}",
+                         method.routing_key)
+
+        except Exception as err:                        # pylint:disable=W0718
+            log.log_err(f"process_worker:  Unable to save message body:"
+                        f" {err}")
+
+        if tracker:
+            tracker.done(method.delivery_tag)
+
+    if not tracker:
+        log.log_info(
+            f"Deleting message with Routing Key: {method.routing_key}")
+        rmq.connection.add_callback_threadsafe(
+            functools.partial(rmq.ack, method.delivery_tag))
+
+
+def run_loop(rmq, log, executor=None, write_buffer=None):
+
+    """Function:  run_loop
+
+    Description:  Consume messages until the loop is stopped or interrupted.
+        Then finish the messages in progress, flush the write buffer and send
+        the acks queued for the connection thread before the connection is
+        closed, so the finished messages are not redelivered.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) executor -> ThreadPoolExecutor of the worker threads
+        (input) write_buffer -> WriteBuffer class instance
+
+    """
+
+    try:
+        rmq.channel.start_consuming()
+
+    except KeyboardInterrupt:
+        log.log_info("run_loop:  Stopping the consumers.")
+        rmq.channel.stop_consuming()
+
+    if executor:
+        log.log_info("run_loop:  Finishing the messages in progress.")
+        executor.shutdown(wait=True)
+
+    if write_buffer:
+        log.log_info("run_loop:  Flushing the write buffer.")
+        write_buffer.stop()
+
+    if rmq.connection.is_open:
+        rmq.connection.process_data_events(time_limit=0)
+
+    rmq.drop_connection()
+
+
+def monitor_queue(cfg, log):
+
+    """Function:  monitor_queue
+
+    Description:  Monitor RabbitMQ queue for messages.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    def callback(channel, method, properties, body):    # pylint:disable=W0613
+
+        """Function:  callback
+
+        Description:  Process message from RabbitMQ.
+
+        Arguments:
+            (input) channel -> Channel properties
+            (input) method -> Delivery properties
+            (input) properties -> Properties of the message
+            (input) body -> Message body
+
+        """
+
+        log.log_info(f"callback:  Processing message with Routing Key:"
+                     f" {method.routing_key}")
+
+        if tracker:
+            tracker.received(method.delivery_tag)
+
+        if executor:
+            executor.submit(
+                process_worker, rmq, log, cfg, method, body, tracker)
+
+        elif tracker:
+            process_worker(rmq, log, cfg, method, body, tracker)
+
+        else:
+            process_msg(rmq, log, cfg, method, body)
+            log.log_info(
+                f"Deleting message with Routing Key: {method.routing_key}")
+            rmq.ack(method.delivery_tag)
+
+    log.log_info("monitor_queue:  Initialize monitoring of queues...")
+    workers = getattr(cfg, "workers", 1)
+    batch_size = getattr(cfg, "write_batch_size", 1)
+    executor = None
+    tracker = None
+
+    for queue in cfg.queue_list:
+        rmq = rabbitmq_class.RabbitMQCon(
+            cfg.user, cfg.japd, cfg.host, cfg.port,
+            exchange_name=cfg.exchange_name, exchange_type=cfg.exchange_type,
+            queue_name=queue["queue"], routing_key=queue["routing_key"],
+            x_durable=cfg.x_durable, q_durable=cfg.q_durable,
+            auto_delete=cfg.auto_delete)
+
+        log.log_info(f'Initializing:  Queue: {queue["queue"]}, Routing Key:'
+                     f' {queue["routing_key"]}')
+        connect_status, err_msg = rmq.create_connection()
+
+        if connect_status and rmq.channel.is_open:
+            log.log_info(f'Initialized RabbitMQ node: {queue["queue"]}')
+
+        else:
+            log.log_err(f'Initialization failed RabbuitMQ: {queue["queue"]}'
+                        f' -> Msg: {err_msg}')
+
+        rmq.drop_connection()
+
+    log.log_info("monitor_queue:  Start monitoring queue...")
+
+    # Connect to first queue as only one connection required.
+    rmq = rabbitmq_class.RabbitMQCon(
+        cfg.user, cfg.japd, cfg.host, cfg.port,
+        exchange_name=cfg.exchange_name, exchange_type=cfg.exchange_type,
+        queue_name=cfg.queue_list[0]["queue"],
+        routing_key=cfg.queue_list[0]["routing_key"],
+        x_durable=cfg.x_durable, q_durable=cfg.q_durable,
+        auto_delete=cfg.auto_delete)
+
+    log.log_info(f"Connection info: {cfg.host}->{cfg.exchange_name}")
+    connect_status, err_msg = rmq.create_connection()
+
+    if connect_status and rmq.channel.is_open:
+        log.log_info("Connected to RabbitMQ node")
+
+        if workers > 1:
+            log.log_info(f"monitor_queue:  Starting {workers} workers.")
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers)
+
+        if batch_size > 1 and getattr(cfg, "mongo_sink", None):
+            log.log_info(f"monitor_queue:  Buffering up to {batch_size}"
+                         f" inserts.")
+            tracker = AckTracker(rmq, log)
+            cfg.write_buffer = WriteBuffer(cfg, log)
+            cfg.write_buffer.start()
+
+        # Setup the RabbitMQ Consume callback on multiple queues.
+        for queue in cfg.queue_list:
+            log.log_info(f'Monitoring RabbitMQ Queue: {queue["queue"]},'
+                         f' Routing Key: {queue["routing_key"]}')
+            prefetch = get_prefetch(cfg, queue)
+            log.log_info(f"Prefetch count: {prefetch}")
+
+            # The channel QoS applies to the consumers started after it is
+            # set, so it is set for every queue, with 0 for no limit.
+            rmq.channel.basic_qos(prefetch_count=prefetch or 0)
+            rmq.consume(callback, queue=queue["queue"])
+
+        if executor or tracker:
+            run_loop(rmq, log, executor,
+                     cfg.write_buffer if tracker else None)
+
+        else:
+            rmq.start_loop()
+
+    else:
+        log.log_err(f"Failed to connnect to RabbuitMQ -> Msg: {err_msg}")
+
+
+class ContentIndex():
+
+    """Class:  ContentIndex
+
+    Description:  Persistent index of the SHA-256 hashes of the PDF files
+        already inserted into Mongo, kept in a local SQLite database so it
+        survives a restart.  The worker threads share one connection, so
+        access is locked.  Database errors are logged and treated as a miss,
+        leaving the unique Mongo index on ContentHash to catch duplicates.
+
+    Methods:
+        __init__
+        open
+        close
+        lookup
+        add
+        hit
+
+    """
+
+    def __init__(self, path, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ContentIndex class.
+
+        Arguments:
+            (input) path -> Path to the SQLite database file
+            (input) log -> Log class instance
+
+        """
+
+        self.path = path
+        self.log = log
+        self.conn = None
+        self.hits = collections.Counter()
+        self.lock = threading.Lock()
+
+    def open(self):
+
+        """Method:  open
+
+        Description:  Open the database and create the table, if needed.
+
+        Arguments:
+            (output) status -> True|False - database opened
+            (output) err_msg -> Error message or None
+
+        """
+
+        try:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS content (digest TEXT"
+                         " PRIMARY KEY, file_name TEXT, added TEXT)")
+            conn.commit()
+
+        except sqlite3.Error as msg:
+            return False, str(msg)
+
+        self.conn = conn
+
+        return True, None
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the database.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def lookup(self, digest):
+
+        """Method:  lookup
+
+        Description:  Look up the hash of a PDF file.
+
+        Arguments:
+            (input) digest -> SHA-256 of the PDF file
+            (output) file_name -> File name first processed or None
+
+        """
+
+        with self.lock:
+
+            if not self.conn:
+                return None
+
+            try:
+                row = self.conn.execute(
+                    "SELECT file_name FROM content WHERE digest = ?",
+                    (digest,)).fetchone()
+
+            except sqlite3.Error as msg:
+                self.log.log_warn(f"ContentIndex:  Lookup failed: {msg}")
+                row = None
+
+        return row[0] if row else None
+
+    def add(self, digest, file_name):
+
+        """Method:  add
+
+        Description:  Add the hash of a PDF file once its metadata is
+            inserted.  The first file name for a hash is kept.
+
+        Arguments:
+            (input) digest -> SHA-256 of the PDF file
+            (input) file_name -> File name of the PDF file
+
+        """
+
+        dtg = datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y-%m-%d_%H:%M:%S")
+
+        with self.lock:
+
+            if not self.conn:
+                return
+
+            try:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO content VALUES (?, ?, ?)",
+                    (digest, file_name, dtg))
+                self.conn.commit()
+
+            except sqlite3.Error as msg:
+                self.log.log_warn(f"ContentIndex:  Add failed: {msg}")
+
+    def hit(self, mode):
+
+        """Method:  hit
+
+        Description:  Count a duplicate PDF file for the dedup setting.
+
+        Arguments:
+            (input) mode -> Dedup setting of the queue
+            (output) hits -> Number of hits for the dedup setting
+
+        """
+
+        with self.lock:
+            self.hits[mode] += 1
+
+            return self.hits[mode]
+
+
+class ResultCache():
+
+    """Class:  ResultCache
+
+    Description:  On-disk cache of the entities extracted from each PDF file,
+        kept in a local SQLite database.  Entries are keyed by the SHA-256 of
+        the PDF file and a fingerprint of the NER model and extraction
+        settings, so changing them leaves the old entries unused until they
+        are evicted.  The least recently used entries are evicted once the
+        cache is over its size.  Database errors are logged and treated as a
+        miss.
+
+    Methods:
+        __init__
+        open
+        close
+        key
+        get
+        put
+
+    """
+
+    def __init__(self, path, max_bytes, fingerprint, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ResultCache class.
+
+        Arguments:
+            (input) path -> Path to the SQLite database file
+            (input) max_bytes -> Maximum size in bytes of the cached entries
+            (input) fingerprint -> Fingerprint of the pipeline settings
+            (input) log -> Log class instance
+
+        """
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self.log = log
+        self.conn = None
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def open(self):
+
+        """Method:  open
+
+        Description:  Open the database and create the table, if needed.
+
+        Arguments:
+            (output) status -> True|False - database opened
+            (output) err_msg -> Error message or None
+
+        """
+
+        try:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT"
+                         " PRIMARY KEY, value TEXT, size INTEGER, used REAL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results"
+                         " (used)")
+            conn.commit()
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+        except sqlite3.Error as msg:
+            return False, str(msg)
+
+        self.conn = conn
+        self.total = total
+
+        return True, None
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the database.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def key(self, digest):
+
+        """Method:  key
+
+        Description:  Return the cache key of a PDF file.
+
+        Arguments:
+            (input) digest -> SHA-256 of the PDF file
+            (output) key -> Cache key
+
+        """
+
+        return digest + ":" + self.fingerprint
+
+    def get(self, key):
+
+        """Method:  get
+
+        Description:  Return the cached entities and mark the entry as used.
+
+        Arguments:
+            (input) key -> Cache key
+            (output) entities -> Dictionary of entities or None
+
+        """
+
+        with self.lock:
+
+            if not self.conn:
+                return None
+
+            try:
+                row = self.conn.execute(
+                    "SELECT value FROM results WHERE key = ?",
+                    (key,)).fetchone()
+
+                if row:
+                    self.conn.execute(
+                        "UPDATE results SET used = ? WHERE key = ?",
+                        (time.time(), key))
+                    self.conn.commit()
+
+            except sqlite3.Error as msg:
+                self.log.log_warn(f"ResultCache:  Get failed: {msg}")
+                row = None
+
+            if row:
+                self.hits += 1
+
+            else:
+                self.misses += 1
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, key, entities):
+
+        """Method:  put
+
+        Description:  Cache the entities of a PDF file and evict the least
+            recently used entries over the maximum size.
+
+        Arguments:
+            (input) key -> Cache key
+            (input) entities -> Dictionary of entities
+
+        """
+
+        value = json.dumps(entities)
+        size = len(value)
+
+        with self.lock:
+
+            if not self.conn or size > self.max_bytes:
+                return
+
+            try:
+                row = self.conn.execute(
+                    "SELECT size FROM results WHERE key = ?",
+                    (key,)).fetchone()
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, value, size, time.time()))
+                self.total += size - (row[0] if row else 0)
+                evict = []
+
+                if self.total > self.max_bytes:
+                    for old_key, old_size in self.conn.execute(
+                            "SELECT key, size FROM results WHERE key != ?"
+                            " ORDER BY used", (key,)):
+                        evict.append((old_key,))
+                        self.total -= old_size
+
+                        if self.total <= self.max_bytes:
+                            break
+
+                self.conn.executemany(
+                    "DELETE FROM results WHERE key = ?", evict)
+                self.conn.commit()
+
+            except sqlite3.Error as msg:
+                self.log.log_warn(f"ResultCache:  Put failed: {msg}")
+                self.conn.rollback()
+
+
+class MongoSink():
+
+    """Class:  MongoSink
+
+    Description:  Long-lived Mongo collection connection which is opened
+        once and shared by all messages.  The underlying client keeps a pool
+        of connections, so inserts from worker threads are not serialized.
+        A failed insert drops the connection and reconnects with an
+        exponential backoff between attempts.
+
+    Methods:
+        __init__
+        connect
+        create_hash_index
+        close
+        find_file_name
+        insert
+        insert_many
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the MongoSink class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.mongo_cfg = cfg.mongo
+        self.log = log
+        self.pool_size = getattr(cfg.mongo, "pool_size", 100)
+        self.retries = getattr(cfg.mongo, "reconnect_retries", 3)
+        self.backoff = getattr(cfg.mongo, "reconnect_backoff", 1.0)
+        self.max_backoff = getattr(cfg.mongo, "reconnect_max_backoff", 30.0)
+        self.unique_hash = getattr(cfg, "content_index", None) is not None
+        self.coll = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Open the connection to the Mongo collection, if not
+            already open.
+
+        Arguments:
+            (output) status -> True|False - connection successful
+            (output) err_msg -> Error message or None
+
+        """
+
+        with self.lock:
+
+            if self.coll:
+                return True, None
+
+            coll = mongo_libs.crt_coll_inst(
+                self.mongo_cfg, self.mongo_cfg.dbs, self.mongo_cfg.tbl)
+            coll.config["maxPoolSize"] = self.pool_size
+            status, err_msg = coll.connect()
+
+            if status:
+                self.coll = coll
+
+                if self.unique_hash:
+                    self.create_hash_index()
+
+            else:
+                coll.disconnect()
+
+            return status, err_msg
+
+    def create_hash_index(self):
+
+        """Method:  create_hash_index
+
+        Description:  Create a unique index on the ContentHash field of the
+            collection, as a backstop to the local content index.  Documents
+            without the field are not indexed.
+
+        Arguments:
+
+        """
+
+        try:
+            self.coll.coll.create_index(
+                "ContentHash", unique=True,
+                partialFilterExpression={"ContentHash": {"$exists": True}})
+
+        except PyMongoError as msg:
+            self.log.log_warn(f"MongoSink:  ContentHash index failed: {msg}")
+
+    def close(self):
 
-    """Function:  get_textract_data
+        """Method:  close
 
-    Description:  Process data using the textract module.
+        Description:  Close the connection to the Mongo collection.
 
-    Arguments:
-        (input) f_name -> PDF file name
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
-        (output) final_data -> List of categorized tokens from PDF file
+        Arguments:
 
-    """
+        """
 
-    log.log_info("get_textract_data:  Extracting data using textract.")
-    final_data = []
+        with self.lock:
+            coll = self.coll
+            self.coll = None
 
-    # Get character encoding.
-    log.log_info("get_textract_data:  Detecting encode in PDF file.")
-    status, tmptext = extract_pdf(f_name, log)
+        if coll:
+            coll.disconnect()
 
-    if status:
-        suberrstr = "codec can't decode byte"
-        char_encoding = None
-        status_flag = True
-        categorized_text = []
-        data = chardet.detect(tmptext)
+    def find_file_name(self, content_hash):
 
-        if data["confidence"] == 1.0:
-            char_encoding = data["encoding"]
-            log.log_info(f"get_textract_data:  Detected character encode:"
-                         f" {char_encoding}")
+        """Method:  find_file_name
 
-        _, rawtext = extract_pdf(f_name, log, char_encoding)
-        log.log_info("get_textract_data:  Running word_tokenizer.")
+        Description:  Return the file name of the document in the Mongo
+            collection with the content hash.
+
+        Arguments:
+            (input) content_hash -> SHA-256 of the PDF file
+            (output) File name or None if not found
+
+        """
+
+        status, err_msg = self.connect()
+        coll = self.coll
+
+        if not status or not coll:
+            self.log.log_warn(f"MongoSink:  Unable to find content hash:"
+                              f" {err_msg}")
+            return None
 
         try:
-            tokens = word_tokenize(rawtext)
+            doc = coll.coll.find_one(
+                {"ContentHash": content_hash}, {"FileName": 1})
 
-        except UnicodeDecodeError as msg:
-            log.log_warn("get_textract_data:  UnicodeDecodeError detected.")
+        except PyMongoError as msg:
+            self.log.log_warn(f"MongoSink:  Unable to find content hash:"
+                              f" {msg}")
+            return None
 
-            if str(msg).find(suberrstr) >= 0 \
-               and msg.args[0] in cfg.textract_codes:
-                char_encoding = msg.args[0]
-                log.log_info(f"get_textract_data:  New encoding code detected:"
-                             f" {char_encoding}")
-                _, rawtext = extract_pdf(f_name, log, char_encoding)
-                log.log_info("get_textract_data:  Re-running word_tokenizer.")
-                tokens = word_tokenize(rawtext)
+        return doc.get("FileName") if doc else None
 
-            else:
-                log.log_warn("get_textract_data:  No encoding code detected.")
-                status_flag = False
+    def insert(self, doc):
 
-        if status_flag:
-            log.log_info("get_textract_data:  Finding tokens.")
-            categorized_text = find_tokens(tokens, cfg)
+        """Method:  insert
 
-        if categorized_text:
-            log.log_info("get_textract_data:  Summarizing data.")
-            final_data = summarize_data(categorized_text, cfg.token_types)
+        Description:  Insert a document into the Mongo collection, connecting
+            again on failure up to the number of retries.  A document with
+            the same ContentHash as one already in the collection is not
+            inserted and returns a status of None, so the caller can apply
+            the dedup setting of the queue.
 
-    else:
-        log.log_err("get_textract_data:  Extraction failed.")
+        Arguments:
+            (input) doc -> Metadata document
+            (output) status -> True|False|None - successful insert or None if
+                the content is already in the collection
+            (output) err_msg -> Error message or None
 
-    return status, final_data
+        """
 
+        err_msg = None
 
-def pdf_to_string(f_name, log):
+        for attempt in range(self.retries + 1):
 
-    """Function:  pdf_to_string
+            if attempt:
+                delay = min(self.backoff * 2 ** (attempt - 1),
+                            self.max_backoff)
+                self.log.log_warn(f"MongoSink:  Reconnecting in {delay}s"
+                                  f" after: {err_msg}")
+                time.sleep(delay)
 
-    Description:  Extract text from PDF using pdfminer module.
+            status, err_msg = self.connect()
+            coll = self.coll
 
-    Arguments:
-        (input) f_name -> PDF file name
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
-        (output) text -> Raw text
+            if not status or not coll:
+                continue
+
+            try:
+                coll.ins_doc(dict(doc))
+
+                return True, None
+
+            # Same content inserted by another daemon.
+            except DuplicateKeyError as msg:
+                self.log.log_warn(f"MongoSink:  Document already inserted:"
+                                  f" {msg}")
+
+                return (None, str(msg)) if "ContentHash" in str(msg) \
+                    else (True, None)
+
+            except PyMongoError as msg:
+                err_msg = str(msg)
+                self.close()
+
+        return False, err_msg
+
+    def insert_many(self, docs):
+
+        """Method:  insert_many
+
+        Description:  Insert documents into the Mongo collection with a
+            single unordered insert, connecting again on failure up to the
+            number of retries.  pymongo sets the document ids before the
+            first attempt, so documents inserted before a failure are
+            rejected as duplicate keys on a retry and are counted as
+            inserted.  A document with the same ContentHash as one already
+            in the collection has a status of None.
+
+        Arguments:
+            (input) docs -> List of metadata documents
+            (output) results -> List of (status, err_msg) for each document
+
+        """
+
+        docs = [dict(doc) for doc in docs]
+        err_msg = None
+
+        for attempt in range(self.retries + 1):
+
+            if attempt:
+                delay = min(self.backoff * 2 ** (attempt - 1),
+                            self.max_backoff)
+                self.log.log_warn(f"MongoSink:  Reconnecting in {delay}s"
+                                  f" after: {err_msg}")
+                time.sleep(delay)
+
+            status, err_msg = self.connect()
+            coll = self.coll
+
+            if not status or not coll:
+                continue
+
+            results = [(True, None)] * len(docs)
+
+            try:
+                coll.coll.insert_many(docs, ordered=False)
+
+            except BulkWriteError as msg:
+                for error in msg.details.get("writeErrors", []):
+
+                    # Duplicate id from an earlier attempt is inserted.
+                    if error.get("code") != 11000:
+                        results[error["index"]] = (False, error.get("errmsg"))
+
+                    elif "ContentHash" in str(error.get("errmsg")):
+                        results[error["index"]] = (None, error.get("errmsg"))
+
+            except PyMongoError as msg:
+                err_msg = str(msg)
+                self.close()
+                continue
+
+            return results
+
+        return [(False, err_msg)] * len(docs)
+
+
+class MemorySink():
+
+    """Class:  MemorySink
+
+    Description:  Keeps the metadata documents in memory in place of
+        inserting them into the Mongo database.
+
+    Methods:
+        __init__
+        insert
+        insert_many
+        close
 
     """
 
-    status = True
-    out_string = io.BytesIO()
+    def __init__(self):
 
-    with io.open(f_name, "rb") as f_hdlr:
-        parser = PDFParser(f_hdlr)
+        """Method:  __init__
 
-        try:
-            doc = PDFDocument(parser)
-            rsrcmgr = PDFResourceManager()
-            device = TextConverter(rsrcmgr, out_string, laparams=LAParams())
-            interpreter = PDFPageInterpreter(rsrcmgr, device)
-            log.log_info("pdf_to_string:  Extracting data...")
+        Description:  Initialization of an instance of the MemorySink class.
 
-            for page in PDFPage.create_pages(doc):
-                interpreter.process_page(page)
+        Arguments:
 
-        except pdfminer.pdfdocument.PDFPasswordIncorrect:
-            log.log_err("pdf_to_string:  PDF is password protected.")
-            status = False
-            text = ""
+        """
 
-    data = out_string.getvalue()
-    text = data.replace(".", "")
+        self.docs = []
+        self.lock = threading.Lock()
 
-    return status, text
+    def insert(self, doc):
 
+        """Method:  insert
 
-def get_pdfminer_data(f_name, cfg, log):
+        Description:  Add a document to the sink.
 
-    """Function:  get_pdfminer_data
+        Arguments:
+            (input) doc -> Metadata document
+            (output) status -> True|False - successful insert
+            (output) err_msg -> Error message or None
 
-    Description:  Process data using the pdfminer module.
+        """
 
-    Arguments:
-        (input) f_name -> PDF file name
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
-        (output) final_data -> List of categorized tokens from PDF file
+        with self.lock:
+            self.docs.append(doc)
+
+        return True, None
+
+    def insert_many(self, docs):
+
+        """Method:  insert_many
+
+        Description:  Add documents to the sink.
+
+        Arguments:
+            (input) docs -> List of metadata documents
+            (output) results -> List of (status, err_msg) for each document
+
+        """
+
+        with self.lock:
+            self.docs.extend(docs)
+
+        return [(True, None)] * len(docs)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Nothing to close for an in-memory sink.
+
+        Arguments:
+
+        """
+
+
+class BenchRMQ():                                       # pylint:disable=R0903
+
+    """Class:  BenchRMQ
+
+    Description:  Stands in for the RabbitMQ class instance in benchmark mode
+        to supply the exchange name.
+
+    Methods:
+        __init__
 
     """
 
-    final_data = []
-    log.log_info("get_pdfminer_data:  Extracting data using pdfminer.")
-    status, rawtext = pdf_to_string(f_name, log)
+    def __init__(self, exchange):
 
-    if status:
-        log.log_info("get_pdfminer_data:  Running word_tokenizer.")
-        tokens = word_tokenize(rawtext)
-        log.log_info("get_pdfminer_data:  Finding tokens.")
-        categorized_text = find_tokens(tokens, cfg)
+        """Method:  __init__
 
-        if categorized_text:
-            log.log_info("get_pdfminer_data:  Summarizing data")
-            final_data = summarize_data(categorized_text, cfg.token_types)
+        Description:  Initialization of an instance of the BenchRMQ class.
 
-    else:
-        log.log_err("get_pdfminer_data:  Extraction failed.")
+        Arguments:
+            (input) exchange -> Exchange name
 
-    return status, final_data
+        """
 
+        self.exchange = exchange
 
-def process_message(queue, cfg, f_name, log):
 
-    """Function:  process_message
+def get_bench_files(cfg, bench_dir):
+
+    """Function:  get_bench_files
 
-    Description:  Extract metadata from message.
+    Description:  Return the PDF and archived message body files in the
+        benchmark directory with the queue to process each under.  Archived
+        bodies are matched to a queue by the routing key in the file name,
+        PDF files are processed as encoded messages of the first queue.
 
     Arguments:
-        (input) queue -> RabbitMQ queue
         (input) cfg -> Configuration settings module for the program
-        (input) f_name -> PDF file name
-        (input) log -> Log class instance
-        (output) status -> True|False - successfully extraction of data
+        (input) bench_dir -> Directory of files to benchmark
+        (output) files -> List of (file path, queue) sets
 
     """
 
-    status = True
-    log.log_info("process_message:  Extracting and processing metadata.")
-    dtg = datetime.datetime.strftime(
-        datetime.datetime.now(), "%Y-%m-%d_%H:%M:%S")
-    metadata = {"FileName": os.path.basename(f_name),
-                "Directory": queue["directory"],
-                "DateTime": dtg}
+    files = []
 
-    # Use the PyPDF2 module to extract data.
-    status_pypdf2, final_data = get_pypdf2_data(f_name, cfg, log)
+    for f_name in sorted(os.listdir(bench_dir)):
+        f_path = os.path.join(bench_dir, f_name)
+        ext = os.path.splitext(f_name)[1].lower()
 
-    if status_pypdf2:
-        log.log_info("process_message:  Adding metadata from pypdf2.")
-        metadata = create_metadata(metadata, final_data)
+        if not os.path.isfile(f_path) or ext not in (".pdf", ".body"):
+            continue
 
-    # Use the textract module to extract data.
-    status_textract, final_data = get_textract_data(f_name, cfg, log)
+        queue = dict(cfg.queue_list[0])
 
-    if status_textract:
-        log.log_info("process_message:  Adding metadata from textract.")
-        metadata = create_metadata(metadata, final_data)
+        if ext == ".pdf":
+            queue["stype"] = "encoded"
 
-    # Use the pdfminer module to extract data.
-    status_pdfminer, final_data = get_pdfminer_data(f_name, cfg, log)
+        else:
+            for item in cfg.queue_list:
 
-    if status_pdfminer:
-        log.log_info("process_message:  Adding metadata from pdfminer.")
-        metadata = create_metadata(metadata, final_data)
+                if f_name.startswith(
+                        f'{cfg.exchange_name}_{item["routing_key"]}_'):
+                    queue = dict(item)
+                    break
 
-    if status_pypdf2 or status_textract or status_pdfminer:
-        log.log_info("process_message:  Insert metadata into MongoDB.")
-        mongo_stat = mongo_libs.ins_doc(cfg.mongo, cfg.mongo.dbs,
-                                        cfg.mongo.tbl, metadata)
+        files.append((f_path, queue))
 
-        if not mongo_stat[0]:
-            log.log_err("process_message: Insert of data into MongoDB failed.")
-            log.log_err(f"Mongo error message:  {mongo_stat[1]}")
-            status = False
+    return files
 
-        else:
-            log.log_info(
-                f'process_message:  Moving PDF to: {queue["directory"]}')
-            gen_libs.mv_file2(
-                f_name, queue["directory"], os.path.basename(f_name))
 
-    else:
-        log.log_err("process_message:  All extractions methods failed.")
-        status = False
+def bench_file(rmq, log, cfg, f_path, queue):
 
-    return status
+    """Function:  bench_file
 
+    Description:  Process a benchmark file through convert_data as a message
+        from the queue.
 
-def monitor_queue(cfg, log):
+    Arguments:
+        (input) rmq -> BenchRMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) f_path -> Path to the PDF or archived message body file
+        (input) queue -> RabbitMQ queue
 
-    """Function:  monitor_queue
+    """
 
-    Description:  Monitor RabbitMQ queue for messages.
+    with io.open(f_path, "rb") as f_hdlr:
+        body = f_hdlr.read()
+
+    if f_path.lower().endswith(".pdf"):
+        body = base64.b64encode(body)
+
+    convert_data(rmq, log, cfg, queue, body, queue["routing_key"])
+
+
+def benchmark(cfg, log):
+
+    """Function:  benchmark
+
+    Description:  Run the files in the benchmark directory through the
+        message processing without RabbitMQ or Mongo and report the documents
+        per second, stage timings and peak memory use.  Files are processed
+        by the configured number of workers.  The PDF files and the bodies of
+        failed files are written to a temporary directory which is removed
+        afterwards.  Documents per second counts the processed files only.
+        The peak memory use is reported for this process and for the largest
+        child process which has exited, such as textract; the NER server and
+        pdfminer processes still running are not measured.
 
     Arguments:
         (input) cfg -> Configuration settings module for the program
@@ -1097,77 +5262,199 @@ def monitor_queue(cfg, log):
 
     """
 
-    def callback(channel, method, properties, body):    # pylint:disable=W0613
+    files = get_bench_files(cfg, cfg.bench_dir)
+    workers = getattr(cfg, "workers", 1)
+    log.log_info(f"benchmark:  Processing {len(files)} files from:"
+                 f" {cfg.bench_dir}")
+    rmq = BenchRMQ(cfg.exchange_name)
+    cfg.to_line = None
+    cfg.mongo_sink = MemorySink()
+    cfg.pipeline_stats = PipelineStats(max(len(files), 1))
+    out_dir = tempfile.mkdtemp(dir=cfg.tmp_dir)
+    cfg.message_dir = os.path.join(out_dir, "message_dir")
+    os.mkdir(cfg.message_dir)
+    start = time.monotonic()
+
+    try:
+        args = [(rmq, log, cfg, f_path, dict(queue, directory=out_dir))
+                for f_path, queue in files]
+
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=workers) as executor:
+                futures = [executor.submit(bench_file, *item)
+                           for item in args]
+
+                for future in futures:
+                    future.result()
 
-        """Function:  callback
+        else:
+            for item in args:
+                bench_file(*item)
 
-        Description:  Process message from RabbitMQ.
+    finally:
+        elapsed = time.monotonic() - start
+        shutil.rmtree(out_dir, ignore_errors=True)
 
-        Arguments:
-            (input) channel -> Channel properties
-            (input) method -> Delivery properties
-            (input) properties -> Properties of the message
-            (input) body -> Message body
+    processed = len(cfg.mongo_sink.docs)
+    report = {
+        "files": len(files), "processed": processed,
+        "failed": len(files) - processed,
+        "workers": workers, "seconds": round(elapsed, 3),
+        "docs_per_sec": round(processed / elapsed, 3) if elapsed else 0.0,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "peak_child_rss_kb":
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        "stages": cfg.pipeline_stats.percentiles()}
+    tagger = getattr(cfg, "ner_tagger", None)
 
-        """
+    if tagger and tagger.cache:
+        report["ner_cache_hit_ratio"] = round(tagger.cache.ratio(), 4)
 
-        log.log_info(f"callback:  Processing message with Routing Key:"
-                     f" {method.routing_key}")
-        process_msg(rmq, log, cfg, method, body)
-        log.log_info(
-            f"Deleting message with Routing Key: {method.routing_key}")
-        rmq.ack(method.delivery_tag)
+    batcher = getattr(cfg, "ner_batcher", None)
 
-    log.log_info("monitor_queue:  Initialize monitoring of queues...")
+    if batcher and batcher.requests:
+        report["ner_docs_per_batch"] = round(
+            batcher.docs / batcher.requests, 3)
 
-    for queue in cfg.queue_list:
-        rmq = rabbitmq_class.RabbitMQCon(
-            cfg.user, cfg.japd, cfg.host, cfg.port,
-            exchange_name=cfg.exchange_name, exchange_type=cfg.exchange_type,
-            queue_name=queue["queue"], routing_key=queue["routing_key"],
-            x_durable=cfg.x_durable, q_durable=cfg.q_durable,
-            auto_delete=cfg.auto_delete)
+    report = json.dumps(report, sort_keys=True)
+    log.log_info(f"benchmark:  Results: {report}")
+    print(report)
 
-        log.log_info(f'Initializing:  Queue: {queue["queue"]}, Routing Key:'
-                     f' {queue["routing_key"]}')
-        connect_status, err_msg = rmq.create_connection()
 
-        if connect_status and rmq.channel.is_open:
-            log.log_info(f'Initialized RabbitMQ node: {queue["queue"]}')
+def pipeline_fingerprint(cfg):
 
-        else:
-            log.log_err(f'Initialization failed RabbuitMQ: {queue["queue"]}'
-                        f' -> Msg: {err_msg}')
+    """Function:  pipeline_fingerprint
 
-        rmq.drop_connection()
+    Description:  Return a fingerprint of the settings and module versions
+        that change the extracted entities, including the text extraction,
+        character encoding detection and NER modes.  The NER model and jar
+        files are included by size and modification time, so a replaced
+        model changes the fingerprint.
 
-    log.log_info("monitor_queue:  Start monitoring queue...")
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (output) fingerprint -> Hex digest of the pipeline settings
 
-    # Connect to first queue as only one connection required.
-    rmq = rabbitmq_class.RabbitMQCon(
-        cfg.user, cfg.japd, cfg.host, cfg.port,
-        exchange_name=cfg.exchange_name, exchange_type=cfg.exchange_type,
-        queue_name=cfg.queue_list[0]["queue"],
-        routing_key=cfg.queue_list[0]["routing_key"],
-        x_durable=cfg.x_durable, q_durable=cfg.q_durable,
-        auto_delete=cfg.auto_delete)
+    """
 
-    log.log_info(f"Connection info: {cfg.host}->{cfg.exchange_name}")
-    connect_status, err_msg = rmq.create_connection()
+    files = {}
 
-    if connect_status and rmq.channel.is_open:
-        log.log_info("Connected to RabbitMQ node")
+    for f_name in [cfg.lang_module, cfg.stanford_jar]:
 
-        # Setup the RabbitMQ Consume callback on multiple queues.
-        for queue in cfg.queue_list:
-            log.log_info(f'Monitoring RabbitMQ Queue: {queue["queue"]},'
-                         f' Routing Key: {queue["routing_key"]}')
-            rmq.consume(callback, queue=queue["queue"])
+        try:
+            stat = os.stat(f_name)
+            files[f_name] = [stat.st_size, stat.st_mtime]
+
+        except OSError:
+            files[f_name] = None
+
+    settings = {
+        "files": files,
+        "token_types": cfg.token_types,
+        "entity_normalize": getattr(cfg, "entity_normalize", []),
+        "ner_single_pass": getattr(cfg, "ner_single_pass", False),
+        "stream_pages": getattr(cfg, "stream_pages", False),
+        "textract_codes": getattr(cfg, "textract_codes", None),
+        "encoding": [getattr(cfg, "encoding_backend", "chardet"),
+                     getattr(cfg, "encoding_confidence", 1.0),
+                     getattr(cfg, "encoding_sample_size", 65536),
+                     getattr(cfg, "encoding_cache", False)],
+        "ner": [getattr(cfg, "ner_server", False),
+                getattr(cfg, "ner_batch_docs", 1) > 1,
+                getattr(cfg, "ner_workers", 1),
+                getattr(cfg, "ner_chunk_tokens", 2000),
+                bool(getattr(cfg, "ner_cache_size", 0))],
+        "versions": [__version__, PyPDF2.__version__,
+                     getattr(pdfminer, "__version__", None),
+                     getattr(textract, "VERSION", None)]}
+
+    return hashlib.sha256(
+        json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def setup_pipeline(cfg, log):
+
+    """Function:  setup_pipeline
+
+    Description:  Create the long-lived processing objects that are shared
+        across messages and attach them to the configuration module.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) cfg -> Configuration settings module for the program
+
+    """
 
-        rmq.start_loop()
+    cfg.encoding_detector = EncodingDetector(cfg)
+    cfg.pipeline_stats = PipelineStats(getattr(cfg, "stats_window", 1000))
+    workers = getattr(cfg, "pdfminer_workers", 1)
+
+    # Forking a process that already runs threads can deadlock on their
+    # locks, so the pool processes come from a forkserver.
+    if workers > 1:
+        log.log_info(f"setup_pipeline:  Starting {workers} pdfminer"
+                     f" processes.")
+        cfg.pdfminer_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"))
+
+    # The benchmark keeps the metadata in memory instead.
+    if not getattr(cfg, "bench_dir", None):
+
+        if getattr(cfg, "dedup_db", None):
+            log.log_info(f"setup_pipeline:  Opening content index:"
+                         f" {cfg.dedup_db}")
+            cfg.content_index = ContentIndex(cfg.dedup_db, log)
+            status, err_msg = cfg.content_index.open()
+
+            if not status:
+                log.log_warn(f"setup_pipeline:  Content index failed,"
+                             f" duplicates will be processed: {err_msg}")
+                cfg.content_index = None
+
+        if getattr(cfg, "result_cache_db", None):
+            log.log_info(f"setup_pipeline:  Opening result cache:"
+                         f" {cfg.result_cache_db}")
+            cache = ResultCache(
+                cfg.result_cache_db,
+                getattr(cfg, "result_cache_size", 268435456),
+                pipeline_fingerprint(cfg), log)
+            status, err_msg = cache.open()
+
+            if status:
+                cfg.result_cache = cache
+
+            else:
+                log.log_warn(f"setup_pipeline:  Result cache failed, results"
+                             f" will not be cached: {err_msg}")
+
+        log.log_info("setup_pipeline:  Connecting to Mongo.")
+        cfg.mongo_sink = MongoSink(cfg, log)
+        status, err_msg = cfg.mongo_sink.connect()
+
+        if not status:
+            log.log_warn(f"setup_pipeline:  Mongo connection failed, it will"
+                         f" be retried on the first insert: {err_msg}")
+
+    log.log_info("setup_pipeline:  Checking the NER tagger.")
+    cfg.ner_tagger = NerTagger(cfg)
+
+    if cfg.ner_tagger.warm_up(log):
+        log.log_info("setup_pipeline:  NER tagger is ready.")
 
     else:
-        log.log_err(f"Failed to connnect to RabbuitMQ -> Msg: {err_msg}")
+        log.log_warn("setup_pipeline:  NER tagger check failed, it will be"
+                     " retried on the first message.")
+
+    if getattr(cfg, "ner_batch_docs", 1) > 1:
+        log.log_info(f"setup_pipeline:  Batching up to {cfg.ner_batch_docs}"
+                     f" NER requests.")
+        cfg.ner_batcher = NerBatcher(cfg, log)
+        cfg.ner_batcher.start()
+
+    return cfg
 
 
 def run_program(args, func_dict, **kwargs):
@@ -1186,6 +5473,7 @@ def run_program(args, func_dict, **kwargs):
     func_dict = dict(func_dict)
     cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
     cfg.mongo = gen_libs.load_module(cfg.mongo_cfg, args.get_val("-d"))
+    cfg.bench_dir = args.get_val("-B")
     cfg, status_flag, err_msg = validate_create_settings(cfg)
 
     if status_flag:
@@ -1208,11 +5496,36 @@ def run_program(args, func_dict, **kwargs):
         try:
             flavor_id = args.get_val("-y", def_val=cfg.exchange_name)
             prog_lock = gen_class.ProgramLock(sys.argv, flavor_id)
+            cfg = setup_pipeline(cfg, log)
 
             # Intersect args.args_array & func_dict to determine function call
             for opt in set(args.get_args_keys()) & set(func_dict.keys()):
                 func_dict[opt](cfg, log, **kwargs)
 
+            if getattr(cfg, "ner_batcher", None):
+                cfg.ner_batcher.stop()
+                log.log_info(f"NER batches: {cfg.ner_batcher.requests},"
+                             f" documents: {cfg.ner_batcher.docs}")
+
+            if getattr(cfg, "pdfminer_pool", None):
+                cfg.pdfminer_pool.shutdown(wait=True)
+
+            if getattr(cfg, "ner_tagger", None):
+                cfg.ner_tagger.stop()
+
+            if getattr(cfg, "mongo_sink", None):
+                cfg.mongo_sink.close()
+
+            if getattr(cfg, "content_index", None):
+                log.log_info(f"Duplicate PDF files:"
+                             f" {dict(cfg.content_index.hits)}")
+                cfg.content_index.close()
+
+            if getattr(cfg, "result_cache", None):
+                log.log_info(f"Result cache hits: {cfg.result_cache.hits},"
+                             f" misses: {cfg.result_cache.misses}")
+                cfg.result_cache.close()
+
             del prog_lock
 
         except gen_class.SingleInstanceException:
@@ -1247,10 +5560,10 @@ def main(**kwargs):
     """
 
     sys.argv = list(kwargs.get("argv_list", sys.argv))
-    dir_perms_chk = {"-d": 5}
-    func_dict = {"-M": monitor_queue}
+    dir_perms_chk = {"-d": 5, "-B": 5}
+    func_dict = {"-M": monitor_queue, "-B": benchmark}
     opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-c", "-d", "-y"]
+    opt_val_list = ["-c", "-d", "-y", "-B"]
 
     # Process argument list from command line.
     args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
@@ -0,0 +1,185 @@
+# Classification (U)
+
+"""Program:  ack_tracker.py
+
+    Description:  Unit testing of AckTracker class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/ack_tracker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        run_callbacks
+        test_in_order
+        test_out_of_order
+        test_held
+        test_requeue
+        test_unknown_tag
+        test_done_twice
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rmq = mock.MagicMock()
+        self.logger = mock.Mock()
+        self.tracker = rmq_metadata.AckTracker(self.rmq, self.logger)
+
+        for tag in [1, 2, 3]:
+            self.tracker.received(tag)
+
+    def run_callbacks(self):
+
+        """Function:  run_callbacks
+
+        Description:  Run the callbacks passed to the connection thread and
+            return the acks and nacks sent in order.
+
+        Arguments:
+
+        """
+
+        for item in self.rmq.connection.add_callback_threadsafe.call_args_list:
+            item[0][0]()
+
+        return [call[0] for call in self.rmq.channel.method_calls]
+
+    def test_in_order(self):
+
+        """Function:  test_in_order
+
+        Description:  Test with each delivery finished in order.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(1)
+        self.tracker.done(2)
+
+        self.assertEqual(self.run_callbacks(), ["basic_ack", "basic_ack"])
+        self.rmq.channel.basic_ack.assert_called_with(
+            delivery_tag=2, multiple=True)
+
+    def test_out_of_order(self):
+
+        """Function:  test_out_of_order
+
+        Description:  Test with a run of deliveries acked with one ack.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(3)
+        self.tracker.done(2)
+        self.tracker.done(1)
+
+        self.assertEqual(self.run_callbacks(), ["basic_ack"])
+        self.rmq.channel.basic_ack.assert_called_once_with(
+            delivery_tag=3, multiple=True)
+        self.assertEqual(len(self.tracker.pending), 0)
+
+    def test_held(self):
+
+        """Function:  test_held
+
+        Description:  Test with finished delivery held behind an earlier one.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(2)
+
+        self.assertEqual(self.run_callbacks(), [])
+        self.assertEqual(list(self.tracker.pending), [1, 2, 3])
+
+    def test_requeue(self):
+
+        """Function:  test_requeue
+
+        Description:  Test with a delivery nacked between acks.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(2, requeue=True)
+        self.tracker.done(3)
+        self.tracker.done(1)
+
+        self.assertEqual(
+            self.run_callbacks(), ["basic_ack", "basic_nack", "basic_ack"])
+        self.rmq.channel.basic_nack.assert_called_once_with(
+            delivery_tag=2, requeue=True)
+        self.rmq.channel.basic_ack.assert_called_with(
+            delivery_tag=3, multiple=True)
+
+    def test_unknown_tag(self):
+
+        """Function:  test_unknown_tag
+
+        Description:  Test with a delivery which was not received.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(9)
+
+        self.assertEqual(self.run_callbacks(), [])
+        self.assertNotIn(9, self.tracker.pending)
+
+    def test_done_twice(self):
+
+        """Function:  test_done_twice
+
+        Description:  Test with a delivery finished twice.
+
+        Arguments:
+
+        """
+
+        self.tracker.done(2)
+        self.tracker.done(2, requeue=True)
+
+        self.assertEqual(self.tracker.pending[2], "ack")
+
+
+if __name__ == "__main__":
+    unittest.main()
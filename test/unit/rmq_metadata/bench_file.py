@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  bench_file.py
+
+    Description:  Unit testing of bench_file in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/bench_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pdf_file
+        test_body_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.bench_dir = tempfile.mkdtemp()
+        self.rmq = rmq_metadata.BenchRMQ("Exchange")
+        self.logger = mock.Mock()
+        self.queue = {"routing_key": "Route1", "stype": "encoded"}
+
+    def make_file(self, f_name, data):
+
+        """Function:  make_file
+
+        Description:  Create a file in the benchmark directory.
+
+        Arguments:
+
+        """
+
+        f_path = os.path.join(self.bench_dir, f_name)
+
+        with open(f_path, "wb") as f_hdlr:
+            f_hdlr.write(data)
+
+        return f_path
+
+    @mock.patch("rmq_metadata.convert_data")
+    def test_pdf_file(self, mock_convert):
+
+        """Function:  test_pdf_file
+
+        Description:  Test with a PDF file encoded as a message body.
+
+        Arguments:
+
+        """
+
+        f_path = self.make_file("Doc.pdf", b"%PDF")
+        rmq_metadata.bench_file(
+            self.rmq, self.logger, None, f_path, self.queue)
+
+        mock_convert.assert_called_once_with(
+            self.rmq, self.logger, None, self.queue, b"JVBERg==", "Route1")
+
+    @mock.patch("rmq_metadata.convert_data")
+    def test_body_file(self, mock_convert):
+
+        """Function:  test_body_file
+
+        Description:  Test with an archived body passed as is.
+
+        Arguments:
+
+        """
+
+        f_path = self.make_file("Exchange_Route1.body", b"JVBERg==")
+        rmq_metadata.bench_file(
+            self.rmq, self.logger, None, f_path, self.queue)
+
+        self.assertEqual(mock_convert.call_args[0][4], b"JVBERg==")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.bench_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
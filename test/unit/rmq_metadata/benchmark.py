@@ -0,0 +1,242 @@
+# Classification (U)
+
+"""Program:  benchmark.py
+
+    Description:  Unit testing of benchmark in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/benchmark.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.exchange_name = "Exchange"
+        self.to_line = "EMAIL_ADDRESS@EMAIL_DOMAIN"
+        self.tmp_dir = None
+        self.bench_dir = None
+        self.workers = 1
+        self.queue_list = [
+            {"queue": "Queue1", "routing_key": "Route1",
+             "directory": "/dir/path", "stype": "encoded"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_report
+        test_failed_file
+        test_workers
+        test_ner_batcher
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.cfg.tmp_dir = tempfile.mkdtemp()
+        self.logger = mock.Mock()
+        self.files = [("Doc1.pdf", dict(self.cfg.queue_list[0])),
+                      ("Doc2.pdf", dict(self.cfg.queue_list[0]))]
+
+    def bench_file(self, rmq, log, cfg, f_path, queue):
+
+        """Function:  bench_file
+
+        Description:  Insert a document into the sink, as processing a file
+            does.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(os.path.isdir(queue["directory"]))
+        self.assertEqual((rmq.exchange, log), ("Exchange", self.logger))
+        cfg.mongo_sink.insert({"FileName": f_path})
+
+    @mock.patch("rmq_metadata.print")
+    @mock.patch("rmq_metadata.bench_file")
+    @mock.patch("rmq_metadata.get_bench_files")
+    def test_report(self, mock_files, mock_bench, mock_print):
+
+        """Function:  test_report
+
+        Description:  Test with the results reported.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.files
+        mock_bench.side_effect = self.bench_file
+        rmq_metadata.benchmark(self.cfg, self.logger)
+        report = json.loads(mock_print.call_args[0][0])
+
+        self.assertEqual(
+            (report["files"], report["processed"], report["workers"]),
+            (2, 2, 1))
+        self.assertIn("peak_rss_kb", report)
+        self.assertIsNone(self.cfg.to_line)
+        self.assertEqual(os.listdir(self.cfg.tmp_dir), [])
+
+    def failed_file(self, rmq, log, cfg, f_path, queue):
+
+        """Function:  failed_file
+
+        Description:  Save the body of the second file as a non-processed
+            message, as a failed file does.
+
+        Arguments:
+
+        """
+
+        if f_path == "Doc2.pdf":
+            self.assertTrue(
+                cfg.message_dir.startswith(self.cfg.tmp_dir + os.sep))
+            with open(os.path.join(cfg.message_dir, "Doc2.txt"), "w",
+                      encoding="utf-8") as f_hdlr:
+                f_hdlr.write("Body")
+
+        else:
+            self.bench_file(rmq, log, cfg, f_path, queue)
+
+    @mock.patch("rmq_metadata.time.monotonic",
+                mock.Mock(side_effect=[0.0, 2.0]))
+    @mock.patch("rmq_metadata.print")
+    @mock.patch("rmq_metadata.bench_file")
+    @mock.patch("rmq_metadata.get_bench_files")
+    def test_failed_file(self, mock_files, mock_bench, mock_print):
+
+        """Function:  test_failed_file
+
+        Description:  Test with a failed file left out of the documents per
+            second and its body written to the temporary directory.
+
+        Arguments:
+
+        """
+
+        self.cfg.message_dir = "/not/used"
+        mock_files.return_value = self.files
+        mock_bench.side_effect = self.failed_file
+        rmq_metadata.benchmark(self.cfg, self.logger)
+        report = json.loads(mock_print.call_args[0][0])
+
+        self.assertEqual(
+            (report["processed"], report["failed"], report["docs_per_sec"]),
+            (1, 1, 0.5))
+        self.assertIn("peak_child_rss_kb", report)
+        self.assertEqual(os.listdir(self.cfg.tmp_dir), [])
+
+    @mock.patch("rmq_metadata.print", mock.Mock())
+    @mock.patch("rmq_metadata.bench_file")
+    @mock.patch("rmq_metadata.get_bench_files")
+    def test_workers(self, mock_files, mock_bench):
+
+        """Function:  test_workers
+
+        Description:  Test with files processed by a pool of workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+        mock_files.return_value = self.files
+        mock_bench.side_effect = self.bench_file
+        rmq_metadata.benchmark(self.cfg, self.logger)
+
+        self.assertEqual(
+            sorted(doc["FileName"] for doc in self.cfg.mongo_sink.docs),
+            ["Doc1.pdf", "Doc2.pdf"])
+
+    @mock.patch("rmq_metadata.print")
+    @mock.patch("rmq_metadata.bench_file")
+    @mock.patch("rmq_metadata.get_bench_files")
+    def test_ner_batcher(self, mock_files, mock_bench, mock_print):
+
+        """Function:  test_ner_batcher
+
+        Description:  Test with the documents per NER batch reported.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_batcher = mock.Mock(requests=2, docs=3)
+        mock_files.return_value = self.files
+        mock_bench.side_effect = self.bench_file
+        rmq_metadata.benchmark(self.cfg, self.logger)
+        report = json.loads(mock_print.call_args[0][0])
+
+        self.assertEqual(report["ner_docs_per_batch"], 1.5)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
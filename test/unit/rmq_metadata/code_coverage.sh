@@ -8,27 +8,78 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/ack_tracker.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/bench_file.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/benchmark.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/content_index.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/convert_data.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/create_metadata.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/create_route.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/decode_body.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/dedup_text.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/encoding_detector.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/extract_pdf.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/find_tokens.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/finish_message.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_bench_files.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_dtg.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_page_ranges.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_pdfminer_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_prefetch.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_pypdf2_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_sentence_chunks.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_stream_data.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_textract_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_textract_stream.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_textract_text.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/get_union_data.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/help_message.py 
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/insert_metadata.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/log_timings.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/main.py 
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/memory_sink.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/merge_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/mongo_sink.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/monitor_queue.py 
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/ner_batcher.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/ner_server.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/ner_tagger.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/non_proc_msg.py 
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/normalize_entity.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/open_pdf.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pdf_page_count.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pdf_pages.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pdf_to_string.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pdfminer_page_range.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pdfminer_pages.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pipeline_fingerprint.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/pipeline_stats.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/process_conflict.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/process_duplicate.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/process_message.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/process_msg.py 
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/process_worker.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/read_pdf.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/read_pdf_pages.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/recode_text.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/result_cache.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/run_extractors.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/run_loop.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/run_program.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/sentence_cache.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/setup_pipeline.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/sort_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/split_clauses.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/split_sentences.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/stage_timer.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/store_done.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/summarize_data.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/tag_pages.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/textract_pages.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/validate_create_settings.py
 coverage run -a --source=rmq_metadata test/unit/rmq_metadata/validate_files.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/validate_routes.py
+coverage run -a --source=rmq_metadata test/unit/rmq_metadata/write_buffer.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  content_index.py
+
+    Description:  Unit testing of ContentIndex class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/content_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_open_failed
+        test_lookup_miss
+        test_lookup_hit
+        test_first_name_kept
+        test_reopen
+        test_closed
+        test_hit
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = "./test/unit/rmq_metadata/testfiles"
+        self.path = os.path.join(self.tmpdir, "content_index.db")
+        self.logger = mock.Mock()
+        self.digest = "ab" * 32
+        self.index = rmq_metadata.ContentIndex(self.path, self.logger)
+
+    def test_open_failed(self):
+
+        """Function:  test_open_failed
+
+        Description:  Test with a database which cannot be created.
+
+        Arguments:
+
+        """
+
+        index = rmq_metadata.ContentIndex(
+            os.path.join(self.tmpdir, "no_dir", "index.db"), self.logger)
+        status, err_msg = index.open()
+
+        self.assertFalse(status)
+        self.assertTrue(err_msg)
+        self.assertIsNone(index.lookup(self.digest))
+
+    def test_lookup_miss(self):
+
+        """Function:  test_lookup_miss
+
+        Description:  Test with a hash not in the index.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.index.open(), (True, None))
+        self.assertIsNone(self.index.lookup(self.digest))
+
+    def test_lookup_hit(self):
+
+        """Function:  test_lookup_hit
+
+        Description:  Test with a hash added to the index.
+
+        Arguments:
+
+        """
+
+        self.index.open()
+        self.index.add(self.digest, "File1.pdf")
+
+        self.assertEqual(self.index.lookup(self.digest), "File1.pdf")
+
+    def test_first_name_kept(self):
+
+        """Function:  test_first_name_kept
+
+        Description:  Test with a hash added twice.
+
+        Arguments:
+
+        """
+
+        self.index.open()
+        self.index.add(self.digest, "File1.pdf")
+        self.index.add(self.digest, "File2.pdf")
+
+        self.assertEqual(self.index.lookup(self.digest), "File1.pdf")
+
+    def test_reopen(self):
+
+        """Function:  test_reopen
+
+        Description:  Test with the index kept across a restart.
+
+        Arguments:
+
+        """
+
+        self.index.open()
+        self.index.add(self.digest, "File1.pdf")
+        self.index.close()
+        index = rmq_metadata.ContentIndex(self.path, self.logger)
+        index.open()
+
+        self.assertEqual(index.lookup(self.digest), "File1.pdf")
+        index.close()
+
+    def test_closed(self):
+
+        """Function:  test_closed
+
+        Description:  Test with the index not open.
+
+        Arguments:
+
+        """
+
+        self.index.add(self.digest, "File1.pdf")
+
+        self.assertIsNone(self.index.lookup(self.digest))
+
+    def test_hit(self):
+
+        """Function:  test_hit
+
+        Description:  Test with the hits counted for each dedup setting.
+
+        Arguments:
+
+        """
+
+        self.index.hit("skip")
+        self.index.hit("link")
+
+        self.assertEqual(self.index.hit("skip"), 2)
+        self.assertEqual(dict(self.index.hits), {"skip": 2, "link": 1})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.index.close()
+
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
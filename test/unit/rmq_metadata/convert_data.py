@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import hashlib
 import mock
 
 # Local
@@ -200,7 +201,12 @@ class UnitTest(unittest.TestCase):
         test_ext_default
         test_file_not_encoded -> Test with file not encoded
         test_file_encoded
+        test_pdf_in_memory
         test_default_name
+        test_write_buffer
+        test_duplicate
+        test_not_duplicate
+        test_result_cache
         tearDown
 
     """
@@ -216,7 +222,6 @@ class UnitTest(unittest.TestCase):
         """
 
         self.tmpdir = "./test/unit/rmq_metadata/testfiles"
-        self.t_file = os.path.join(self.tmpdir, "t_file.txt")
         self.f_name = os.path.join(self.tmpdir, "f_file.txt")
 
         self.rmq = RabbitMQCon()
@@ -229,7 +234,7 @@ class UnitTest(unittest.TestCase):
     @mock.patch("rmq_metadata.non_proc_msg", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=False))
     @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -243,7 +248,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -251,8 +256,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -270,7 +274,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.queue_list[0]["postname"] = "post_name"
         self.cfg.queue_list[0]["ext"] = "txt"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -278,8 +282,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -296,7 +299,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.queue_list[0]["prename"] = "pre_name"
         self.cfg.queue_list[0]["postname"] = "post_name"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -304,8 +307,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -321,7 +323,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["prename"] = None
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -329,8 +331,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -346,7 +347,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["prename"] = "pre_name"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -354,8 +355,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -369,7 +369,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -377,8 +377,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -394,7 +393,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["postname"] = None
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -402,8 +401,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -419,7 +417,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["postname"] = "post_name"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -427,8 +425,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -442,7 +439,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -450,8 +447,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -467,7 +463,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["ext"] = ""
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -475,8 +471,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -492,7 +487,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["ext"] = None
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -500,8 +495,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -517,7 +511,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["ext"] = "txt"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -525,8 +519,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -540,7 +533,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -565,7 +558,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.queue_list[0]["stype"] = "not_encoded"
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
@@ -573,8 +566,7 @@ class UnitTest(unittest.TestCase):
                 self.body, self.method.routing_key))
 
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -588,16 +580,40 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
                 self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
                 self.body, self.method.routing_key))
 
+    @mock.patch("rmq_metadata.process_message")
+    @mock.patch("rmq_metadata.decode_body")
+    @mock.patch("rmq_metadata.os.path")
+    def test_pdf_in_memory(self, mock_path, mock_decode, mock_process):
+
+        """Function:  test_pdf_in_memory
+
+        Description:  Test with decoded PDF passed in memory.
+
+        Arguments:
+
+        """
+
+        self.cfg.pdf_in_memory = True
+        mock_path.join.return_value = self.f_name
+        mock_decode.return_value = b"%PDF"
+        mock_process.return_value = True
+
+        rmq_metadata.convert_data(
+            self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
+            self.body, self.method.routing_key)
+
+        self.assertTrue(mock_decode.call_args[1]["keep"])
+        self.assertEqual(mock_process.call_args[1]["pdf_data"], b"%PDF")
+
     @mock.patch("rmq_metadata.process_message", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.os.remove", mock.Mock(return_value=True))
-    @mock.patch("rmq_metadata.base64.decode", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.gen_libs.write_file",
                 mock.Mock(return_value=True))
     @mock.patch("rmq_metadata.os.path")
@@ -611,13 +627,129 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_path.join.side_effect = [self.t_file, self.f_name]
+        mock_path.join.return_value = self.f_name
 
         self.assertFalse(
             rmq_metadata.convert_data(
                 self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
                 self.body, self.method.routing_key))
 
+    @mock.patch("rmq_metadata.non_proc_msg")
+    @mock.patch("rmq_metadata.process_message")
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.os.path")
+    def test_write_buffer(self, mock_path, mock_process, mock_non):
+
+        """Function:  test_write_buffer
+
+        Description:  Test with message finished after the write buffer is
+            flushed.
+
+        Arguments:
+
+        """
+
+        done = mock.Mock()
+        mock_path.join.return_value = self.f_name
+        mock_process.return_value = None
+
+        rmq_metadata.convert_data(
+            self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
+            self.body, self.method.routing_key, done=done)
+
+        self.assertFalse(done.called)
+        mock_process.call_args[1]["on_done"](True)
+        self.assertFalse(mock_non.called)
+        done.assert_called_once_with()
+
+    @mock.patch("rmq_metadata.non_proc_msg")
+    @mock.patch("rmq_metadata.process_message")
+    @mock.patch("rmq_metadata.process_duplicate")
+    @mock.patch("rmq_metadata.decode_body")
+    @mock.patch("rmq_metadata.os.path")
+    def test_duplicate(self, mock_path, mock_decode, mock_dup, mock_process,
+                       mock_non):
+
+        """Function:  test_duplicate
+
+        Description:  Test with PDF file found in the content index.
+
+        Arguments:
+
+        """
+
+        self.cfg.content_index = mock.Mock()
+        self.cfg.content_index.lookup.return_value = "File1.pdf"
+        self.cfg.queue_list[0]["dedup"] = "skip"
+        mock_path.join.return_value = self.f_name
+        mock_decode.side_effect = lambda *args, **kwargs: kwargs[
+            "digest"].update(b"%PDF")
+        mock_dup.return_value = True
+
+        rmq_metadata.convert_data(
+            self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
+            self.body, self.method.routing_key)
+
+        self.assertEqual(
+            mock_dup.call_args[0][4], hashlib.sha256(b"%PDF").hexdigest())
+        self.assertEqual(mock_dup.call_args[0][5], "File1.pdf")
+        self.assertFalse(mock_process.called)
+        self.assertFalse(mock_non.called)
+
+    @mock.patch("rmq_metadata.process_message")
+    @mock.patch("rmq_metadata.process_duplicate")
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=None))
+    @mock.patch("rmq_metadata.os.path")
+    def test_not_duplicate(self, mock_path, mock_dup, mock_process):
+
+        """Function:  test_not_duplicate
+
+        Description:  Test with PDF file not found in the content index.
+
+        Arguments:
+
+        """
+
+        self.cfg.content_index = mock.Mock()
+        self.cfg.content_index.lookup.return_value = None
+        self.cfg.queue_list[0]["dedup"] = "link"
+        mock_path.join.return_value = self.f_name
+        mock_process.return_value = True
+
+        rmq_metadata.convert_data(
+            self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
+            self.body, self.method.routing_key)
+
+        self.assertFalse(mock_dup.called)
+        self.assertEqual(mock_process.call_args[1]["content_hash"],
+                         hashlib.sha256().hexdigest())
+
+    @mock.patch("rmq_metadata.process_message")
+    @mock.patch("rmq_metadata.decode_body", mock.Mock(return_value=None))
+    @mock.patch("rmq_metadata.os.path")
+    def test_result_cache(self, mock_path, mock_process):
+
+        """Function:  test_result_cache
+
+        Description:  Test with PDF file hashed for the result cache only.
+
+        Arguments:
+
+        """
+
+        self.cfg.result_cache = mock.Mock()
+        self.cfg.content_index = mock.Mock()
+        mock_path.join.return_value = self.f_name
+        mock_process.return_value = True
+
+        rmq_metadata.convert_data(
+            self.rmq, self.logger, self.cfg, self.cfg.queue_list[0],
+            self.body, self.method.routing_key)
+
+        self.assertFalse(self.cfg.content_index.lookup.called)
+        self.assertEqual(mock_process.call_args[1]["content_hash"],
+                         hashlib.sha256().hexdigest())
+
     def tearDown(self):
 
         """Function:  tearDown
@@ -34,6 +34,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_normalize
+        test_seen_entries
         test_multiple_sets2
         test_multiple_sets
         test_duplicate_value
@@ -69,6 +71,41 @@ class UnitTest(unittest.TestCase):
         self.results3 = {
             'PERSON': ['Steve Jones'], 'LOCATION': ['London']}
         self.results4 = {'LOCATION': ['London', self.name]}
+        self.data6 = [
+            ('london', 'LOCATION'), ('United  Kingdom', 'LOCATION'),
+            (self.name, 'LOCATION')]
+        self.results5 = {'LOCATION': ['London', 'United  Kingdom']}
+
+    def test_normalize(self):
+
+        """Function:  test_normalize
+
+        Description:  Test with case and whitespace normalized duplicates.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.create_metadata(
+            self.metadata2, self.data6,
+            normalize=["whitespace", "casefold"]), self.results5)
+
+    def test_seen_entries(self):
+
+        """Function:  test_seen_entries
+
+        Description:  Test with seen entries kept across calls.
+
+        Arguments:
+
+        """
+
+        seen = {}
+        rmq_metadata.create_metadata(self.metadata, self.data2, seen)
+
+        self.assertEqual(rmq_metadata.create_metadata(
+            self.metadata, self.data5, seen), self.results4)
+        self.assertEqual(seen, {'LOCATION': {'London', self.name}})
 
     def test_multiple_sets2(self):
 
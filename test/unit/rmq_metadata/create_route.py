@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  create_route.py
+
+    Description:  Unit testing of create_route in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/create_route.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.exchange_name = "Exchange"
+        self.archive_dir = "/dir/archive_path"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_file_names
+        test_no_file_names
+        test_archive
+        test_no_archive_dir
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.queue = {"queue": "QUEUE_NAME", "routing_key": "ROUTING_KEY",
+                      "prename": "Pre", "postname": "Post", "ext": "pdf",
+                      "archive": False}
+
+    def test_file_names(self):
+
+        """Function:  test_file_names
+
+        Description:  Test with the file name prefix and suffix.
+
+        Arguments:
+
+        """
+
+        route = rmq_metadata.create_route(self.cfg, self.queue)
+
+        self.assertIs(route["queue"], self.queue)
+        self.assertEqual(
+            (route["file_prefix"], route["file_suffix"]),
+            ("Pre_Exchange_ROUTING_KEY_", "_Post.pdf"))
+        self.assertIsNone(route["archive_prefix"])
+
+    def test_no_file_names(self):
+
+        """Function:  test_no_file_names
+
+        Description:  Test with no prename, postname or extension.
+
+        Arguments:
+
+        """
+
+        self.queue.update({"prename": "", "postname": "", "ext": ""})
+        route = rmq_metadata.create_route(self.cfg, self.queue)
+
+        self.assertEqual(
+            (route["file_prefix"], route["file_suffix"]),
+            ("Exchange_ROUTING_KEY_", ""))
+
+    def test_archive(self):
+
+        """Function:  test_archive
+
+        Description:  Test with the archive path prefix.
+
+        Arguments:
+
+        """
+
+        self.queue["archive"] = True
+        route = rmq_metadata.create_route(self.cfg, self.queue)
+
+        self.assertEqual(
+            route["archive_prefix"],
+            "/dir/archive_path/Exchange_ROUTING_KEY_")
+
+    def test_no_archive_dir(self):
+
+        """Function:  test_no_archive_dir
+
+        Description:  Test with archive set and no archive directory.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_dir = None
+        self.queue["archive"] = True
+        route = rmq_metadata.create_route(self.cfg, self.queue)
+
+        self.assertIsNone(route["archive_prefix"])
+
+
+if __name__ == "__main__":
+    unittest.main()
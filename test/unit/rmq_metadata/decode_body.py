@@ -0,0 +1,213 @@
+# Classification (U)
+
+"""Program:  decode_body.py
+
+    Description:  Unit testing of decode_body in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/decode_body.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import base64
+import hashlib
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        read_file
+        test_keep_chunked
+        test_keep
+        test_chunked_lines
+        test_chunked
+        test_str_body
+        test_bytes_body
+        test_digest
+        test_digest_chunked
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = "./test/unit/rmq_metadata/testfiles"
+        self.f_name = os.path.join(self.tmpdir, "decode_body.pdf")
+        self.data = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n" * 20
+        self.body = base64.b64encode(self.data)
+
+    def read_file(self):
+
+        """Function:  read_file
+
+        Description:  Return the contents of the decoded file.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_keep_chunked(self):
+
+        """Function:  test_keep_chunked
+
+        Description:  Test with decoded data returned when decoded in chunks.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.decode_body(
+                self.body, self.f_name, chunk_size=10, keep=True), self.data)
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_keep(self):
+
+        """Function:  test_keep
+
+        Description:  Test with decoded data returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.decode_body(self.body, self.f_name, keep=True),
+            self.data)
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_chunked_lines(self):
+
+        """Function:  test_chunked_lines
+
+        Description:  Test with body split into lines decoded in chunks.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.decode_body(
+            base64.encodebytes(self.data), self.f_name, chunk_size=7)
+
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_chunked(self):
+
+        """Function:  test_chunked
+
+        Description:  Test with body decoded in chunks.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.decode_body(self.body, self.f_name, chunk_size=10)
+
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_str_body(self):
+
+        """Function:  test_str_body
+
+        Description:  Test with a string body.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.decode_body(self.body.decode("ascii"), self.f_name)
+
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_bytes_body(self):
+
+        """Function:  test_bytes_body
+
+        Description:  Test with a bytes body.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(rmq_metadata.decode_body(self.body, self.f_name))
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with hash of the decoded data.
+
+        Arguments:
+
+        """
+
+        digest = hashlib.sha256()
+        rmq_metadata.decode_body(self.body, self.f_name, digest=digest)
+
+        self.assertEqual(
+            digest.hexdigest(), hashlib.sha256(self.data).hexdigest())
+
+    def test_digest_chunked(self):
+
+        """Function:  test_digest_chunked
+
+        Description:  Test with hash of the data decoded in chunks.
+
+        Arguments:
+
+        """
+
+        digest = hashlib.sha256()
+        rmq_metadata.decode_body(self.body, self.f_name, 30, digest=digest)
+
+        self.assertEqual(
+            digest.hexdigest(), hashlib.sha256(self.data).hexdigest())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.f_name):
+            os.remove(self.f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
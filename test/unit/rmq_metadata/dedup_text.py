@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  dedup_text.py
+
+    Description:  Unit testing of dedup_text in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/dedup_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_texts
+        test_bytes_text
+        test_period_removed
+        test_whitespace_differs
+        test_distinct_lines
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.text = "John Smith lives in London.\nHe works at PAYPAL."
+        self.text2 = "John Smith lives in London.\nHe moved to Brighton."
+        self.results = "John Smith lives in London.\nHe works at PAYPAL." \
+            "\nHe moved to Brighton."
+
+    def test_empty_texts(self):
+
+        """Function:  test_empty_texts
+
+        Description:  Test with no texts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.dedup_text([]), "")
+
+    def test_bytes_text(self):
+
+        """Function:  test_bytes_text
+
+        Description:  Test with text passed as bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.dedup_text([self.text, self.text2.encode()]),
+            self.results)
+
+    def test_period_removed(self):
+
+        """Function:  test_period_removed
+
+        Description:  Test with periods removed from one of the texts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.dedup_text([self.text, self.text.replace(".", "")]),
+            self.text)
+
+    def test_whitespace_differs(self):
+
+        """Function:  test_whitespace_differs
+
+        Description:  Test with whitespace differences between texts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.dedup_text(
+                [self.text, "  John  Smith lives in London.\n\n"]),
+            self.text)
+
+    def test_distinct_lines(self):
+
+        """Function:  test_distinct_lines
+
+        Description:  Test with distinct lines kept in order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.dedup_text([self.text, self.text2, self.text]),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
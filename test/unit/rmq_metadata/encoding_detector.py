@@ -0,0 +1,228 @@
+# Classification (U)
+
+"""Program:  encoding_detector.py
+
+    Description:  Unit testing of EncodingDetector class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/encoding_detector.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.encoding_sample_size = 10
+        self.encoding_confidence = 1.0
+        self.encoding_cache = False
+        self.encoding_backend = "chardet"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_small
+        test_sample_large
+        test_detect_text_small
+        test_detect_text_large
+        test_detect
+        test_low_confidence
+        test_cache
+        test_no_cache
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.text = b"0123456789" * 2
+        self.text2 = b"head......" + b"x" * 100 + b"middle...." + \
+            b"y" * 100 + b"tail......"
+        self.data = {"encoding": "ascii", "confidence": 1.0}
+        self.data2 = {"encoding": "ascii", "confidence": 0.7}
+
+    def test_sample_small(self):
+
+        """Function:  test_sample_small
+
+        Description:  Test with text no larger than the sample windows.
+
+        Arguments:
+
+        """
+
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertEqual(detector.sample(self.text), [self.text])
+
+    def test_sample_large(self):
+
+        """Function:  test_sample_large
+
+        Description:  Test with text sampled from head, middle and tail.
+
+        Arguments:
+
+        """
+
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertEqual(
+            detector.sample(self.text2),
+            [b"head......", b"middle....", b"tail......"])
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    def test_detect_text_small(self, mock_detect):
+
+        """Function:  test_detect_text_small
+
+        Description:  Test with small text detected in one call.
+
+        Arguments:
+
+        """
+
+        mock_detect.return_value = self.data
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertEqual(detector.detect_text(self.text), self.data)
+
+    def test_detect_text_large(self):
+
+        """Function:  test_detect_text_large
+
+        Description:  Test with large text detected from the samples.
+
+        Arguments:
+
+        """
+
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertEqual(
+            detector.detect_text(self.text2)["encoding"], "ascii")
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    def test_detect(self, mock_detect):
+
+        """Function:  test_detect
+
+        Description:  Test with confident detection.
+
+        Arguments:
+
+        """
+
+        mock_detect.return_value = self.data
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertEqual(
+            detector.detect(self.text, self.logger)[0], "ascii")
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    def test_low_confidence(self, mock_detect):
+
+        """Function:  test_low_confidence
+
+        Description:  Test with confidence below the setting.
+
+        Arguments:
+
+        """
+
+        mock_detect.return_value = self.data2
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+
+        self.assertIsNone(detector.detect(self.text, self.logger)[0])
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    def test_cache(self, mock_detect):
+
+        """Function:  test_cache
+
+        Description:  Test with encoding cached for the queue.
+
+        Arguments:
+
+        """
+
+        self.cfg.encoding_cache = True
+        mock_detect.return_value = self.data
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+        detector.detect(self.text, self.logger, "queue1")
+
+        self.assertEqual(
+            detector.detect(self.text, self.logger, "queue1"), ("ascii", 0.0))
+        self.assertEqual(mock_detect.call_count, 1)
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    def test_no_cache(self, mock_detect):
+
+        """Function:  test_no_cache
+
+        Description:  Test with encoding cache disabled.
+
+        Arguments:
+
+        """
+
+        mock_detect.return_value = self.data
+        detector = rmq_metadata.EncodingDetector(self.cfg)
+        detector.detect(self.text, self.logger, "queue1")
+        detector.detect(self.text, self.logger, "queue1")
+
+        self.assertEqual(mock_detect.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -130,6 +130,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_long_lived_tagger
+        test_ner_batcher
         test_categorized_data
 
     """
@@ -153,6 +155,21 @@ class UnitTest(unittest.TestCase):
         self.nlp = StanfordNERTagger(
             self.cfg.lang_module, self.cfg.stanford_jar, self.cfg.encoding)
 
+    def test_long_lived_tagger(self):
+
+        """Function:  test_long_lived_tagger
+
+        Description:  Test with a long-lived tagger set in the configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_tagger = self.nlp
+
+        self.assertEqual(rmq_metadata.find_tokens(
+            self.tokenized_text, self.cfg), self.categorized_text)
+
     @mock.patch("rmq_metadata.StanfordNERTagger")
     def test_categorized_data(self, mock_nlp):
 
@@ -169,6 +186,23 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(rmq_metadata.find_tokens(
             self.tokenized_text, self.cfg), self.categorized_text)
 
+    def test_ner_batcher(self):
+
+        """Function:  test_ner_batcher
+
+        Description:  Test with a NER batcher set in the configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_tagger = None
+        self.cfg.ner_batcher = self.nlp
+
+        self.assertEqual(rmq_metadata.find_tokens(
+            self.tokenized_text, self.cfg), self.categorized_text)
+        self.assertEqual(self.nlp.tokenized_text, self.tokenized_text)
+
 
 if __name__ == "__main__":
     unittest.main()
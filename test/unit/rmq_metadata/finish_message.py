@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  finish_message.py
+
+    Description:  Unit testing of finish_message in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/finish_message.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        finish
+        test_successful
+        test_failed
+        test_no_done
+        test_cleanup_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rmq = mock.Mock()
+        self.logger = mock.Mock()
+        self.cfg = mock.Mock(pipeline_stats=None, ner_tagger=None)
+        self.body = "ThekljdsfkjsfdJVBERi0xLjQKJeLjz9MKMTAgMCBvYmoKPDwKL0EgP"
+        self.f_name = "/tmp/path/Filename.pdf"
+        self.done = mock.Mock()
+
+    def finish(self, status, done):
+
+        """Function:  finish
+
+        Description:  Call finish_message with the test settings.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.finish_message(
+            self.rmq, self.logger, self.cfg, self.body, "ROUTING_KEY",
+            self.f_name, "Filename.pdf", rmq_metadata.StageTimer(), done,
+            status)
+
+    @mock.patch("rmq_metadata.os.remove")
+    @mock.patch("rmq_metadata.non_proc_msg")
+    def test_successful(self, mock_non, mock_remove):
+
+        """Function:  test_successful
+
+        Description:  Test with a successful message.
+
+        Arguments:
+
+        """
+
+        self.finish(True, self.done)
+
+        self.assertFalse(mock_non.called)
+        self.assertFalse(mock_remove.called)
+        self.done.assert_called_once_with()
+
+    @mock.patch("rmq_metadata.os.remove")
+    @mock.patch("rmq_metadata.non_proc_msg")
+    def test_failed(self, mock_non, mock_remove):
+
+        """Function:  test_failed
+
+        Description:  Test with a failed message saved to a file.
+
+        Arguments:
+
+        """
+
+        self.finish(False, self.done)
+
+        self.assertTrue(mock_non.called)
+        mock_remove.assert_called_once_with(self.f_name)
+        self.done.assert_called_once_with()
+
+    @mock.patch("rmq_metadata.non_proc_msg")
+    def test_no_done(self, mock_non):
+
+        """Function:  test_no_done
+
+        Description:  Test with no done function.
+
+        Arguments:
+
+        """
+
+        self.finish(True, None)
+
+        self.assertFalse(mock_non.called)
+
+    @mock.patch("rmq_metadata.os.remove")
+    @mock.patch("rmq_metadata.non_proc_msg", mock.Mock())
+    def test_cleanup_fails(self, mock_remove):
+
+        """Function:  test_cleanup_fails
+
+        Description:  Test with done called when the cleanup fails.
+
+        Arguments:
+
+        """
+
+        mock_remove.side_effect = FileNotFoundError(self.f_name)
+
+        with self.assertRaises(FileNotFoundError):
+            self.finish(False, self.done)
+
+        self.done.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
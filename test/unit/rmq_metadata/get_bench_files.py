@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  get_bench_files.py
+
+    Description:  Unit testing of get_bench_files in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_bench_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.exchange_name = "Exchange"
+        self.queue_list = [
+            {"queue": "Queue1", "routing_key": "Route1", "stype": ""},
+            {"queue": "Queue2", "routing_key": "Route2", "stype": "encoded"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pdf_file
+        test_body_file
+        test_body_no_queue
+        test_other_files
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.bench_dir = tempfile.mkdtemp()
+
+    def make_file(self, f_name):
+
+        """Function:  make_file
+
+        Description:  Create an empty file in the benchmark directory.
+
+        Arguments:
+
+        """
+
+        f_path = os.path.join(self.bench_dir, f_name)
+
+        with open(f_path, "w", encoding="utf-8"):
+            pass
+
+        return f_path
+
+    def test_pdf_file(self):
+
+        """Function:  test_pdf_file
+
+        Description:  Test with a PDF file as an encoded message.
+
+        Arguments:
+
+        """
+
+        f_path = self.make_file("Doc.PDF")
+        files = rmq_metadata.get_bench_files(self.cfg, self.bench_dir)
+
+        self.assertEqual(
+            [(item[0], item[1]["queue"], item[1]["stype"]) for item in files],
+            [(f_path, "Queue1", "encoded")])
+
+    def test_body_file(self):
+
+        """Function:  test_body_file
+
+        Description:  Test with a body file matched to its queue.
+
+        Arguments:
+
+        """
+
+        self.make_file("Exchange_Route2_2026-10-18_08:00:00.body")
+        files = rmq_metadata.get_bench_files(self.cfg, self.bench_dir)
+
+        self.assertEqual(files[0][1]["queue"], "Queue2")
+
+    def test_body_no_queue(self):
+
+        """Function:  test_body_no_queue
+
+        Description:  Test with a body file from an unknown routing key.
+
+        Arguments:
+
+        """
+
+        self.make_file("Exchange_Route9_2026-10-18_08:00:00.body")
+        files = rmq_metadata.get_bench_files(self.cfg, self.bench_dir)
+
+        self.assertEqual(
+            (files[0][1]["queue"], files[0][1]["stype"]), ("Queue1", ""))
+
+    def test_other_files(self):
+
+        """Function:  test_other_files
+
+        Description:  Test with files and directories which are skipped.
+
+        Arguments:
+
+        """
+
+        self.make_file("Notes.txt")
+        os.mkdir(os.path.join(self.bench_dir, "Sub.pdf"))
+
+        self.assertEqual(
+            rmq_metadata.get_bench_files(self.cfg, self.bench_dir), [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.bench_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
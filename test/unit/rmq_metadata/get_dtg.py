@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  get_dtg.py
+
+    Description:  Unit testing of get_dtg in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_dtg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dtg_format
+        test_dtg_unique
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dtg_format = "%Y%m%d%H%M%S"
+
+    def test_dtg_format(self):
+
+        """Function:  test_dtg_format
+
+        Description:  Test with format of the date time group.
+
+        Arguments:
+
+        """
+
+        dtg = rmq_metadata.get_dtg(self.dtg_format)
+
+        self.assertRegex(dtg, r"^\d{14}\.\d{1,4}$")
+
+    def test_dtg_unique(self):
+
+        """Function:  test_dtg_unique
+
+        Description:  Test with date time groups unique across calls.
+
+        Arguments:
+
+        """
+
+        dtgs = [rmq_metadata.get_dtg(self.dtg_format) for _ in range(20)]
+
+        self.assertEqual(len(set(dtgs)), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
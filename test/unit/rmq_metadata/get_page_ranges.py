@@ -0,0 +1,83 @@
+# Classification (U)
+
+"""Program:  get_page_ranges.py
+
+    Description:  Unit testing of get_page_ranges in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_page_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_even_split
+        test_uneven_split
+        test_more_workers
+
+    """
+
+    def test_even_split(self):
+
+        """Function:  test_even_split
+
+        Description:  Test with pages split evenly across workers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_page_ranges(200, 2), [(0, 100), (100, 200)])
+
+    def test_uneven_split(self):
+
+        """Function:  test_uneven_split
+
+        Description:  Test with pages not split evenly across workers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_page_ranges(5, 2), [(0, 3), (3, 5)])
+
+    def test_more_workers(self):
+
+        """Function:  test_more_workers
+
+        Description:  Test with more workers than pages.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_page_ranges(2, 4), [(0, 1), (1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
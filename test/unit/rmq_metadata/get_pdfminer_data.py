@@ -142,6 +142,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_stream_failed
+        test_stream_pages
         test_extract_failure
         test_extract_success
         test_categorized_text2
@@ -171,6 +173,44 @@ class UnitTest(unittest.TestCase):
         self.logger = Logger("Name", "Name", "INFO", "%(asctime)s%(message)s",
                              "%m-%d-%YT%H:%M:%SZ|")
 
+    @mock.patch("rmq_metadata.pdfminer_pages",
+                mock.Mock(return_value=iter([])))
+    def test_stream_failed(self):
+
+        """Function:  test_stream_failed
+
+        Description:  Test with no pages extracted in streaming mode.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+
+        self.assertEqual(
+            rmq_metadata.get_pdfminer_data(self.f_name, self.cfg, self.logger),
+            (False, []))
+
+    @mock.patch("rmq_metadata.pdfminer_pages",
+                mock.Mock(return_value=iter(["x"])))
+    @mock.patch("rmq_metadata.get_stream_data")
+    def test_stream_pages(self, mock_stream):
+
+        """Function:  test_stream_pages
+
+        Description:  Test with pages streamed through the tagger.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+        mock_stream.return_value = (True, [("London", "LOCATION")])
+
+        self.assertEqual(
+            rmq_metadata.get_pdfminer_data(self.f_name, self.cfg, self.logger),
+            (True, [("London", "LOCATION")]))
+
     @mock.patch("rmq_metadata.summarize_data")
     @mock.patch("rmq_metadata.find_tokens")
     @mock.patch("rmq_metadata.word_tokenize")
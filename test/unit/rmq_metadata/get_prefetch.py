@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  get_prefetch.py
+
+    Description:  Unit testing of get_prefetch in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_prefetch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.workers = 1
+        self.prefetch_count = None
+        self.queue_list = [
+            {"queue": "rmq_metadata_unit_test",
+             "routing_key": "ROUTING_KEY",
+             "directory": "/dir/path",
+             "prename": "",
+             "postname": "",
+             "mode": "w",
+             "ext": "pdf",
+             "stype": "encoded",
+             "archive": False}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_queue_prefetch
+        test_global_prefetch
+        test_workers_prefetch
+        test_no_prefetch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.queue = self.cfg.queue_list[0]
+
+    def test_queue_prefetch(self):
+
+        """Function:  test_queue_prefetch
+
+        Description:  Test with queue entry overriding the global setting.
+
+        Arguments:
+
+        """
+
+        self.cfg.prefetch_count = 8
+        self.queue["prefetch_count"] = 2
+
+        self.assertEqual(rmq_metadata.get_prefetch(self.cfg, self.queue), 2)
+
+    def test_global_prefetch(self):
+
+        """Function:  test_global_prefetch
+
+        Description:  Test with global prefetch count.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 4
+        self.cfg.prefetch_count = 8
+
+        self.assertEqual(rmq_metadata.get_prefetch(self.cfg, self.queue), 8)
+
+    def test_workers_prefetch(self):
+
+        """Function:  test_workers_prefetch
+
+        Description:  Test with prefetch count set to the number of workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 4
+
+        self.assertEqual(rmq_metadata.get_prefetch(self.cfg, self.queue), 4)
+
+    def test_no_prefetch(self):
+
+        """Function:  test_no_prefetch
+
+        Description:  Test with no prefetch count and one worker.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(rmq_metadata.get_prefetch(self.cfg, self.queue))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,10 +141,13 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_stream_failed
+        test_stream_pages
         test_extract_failed
         test_extract_success
         test_no_categorized_data
         test_categorized_data
+        test_stage_timings
 
     """
 
@@ -177,6 +180,44 @@ class UnitTest(unittest.TestCase):
             'filename': 'mail2rmq_mail2rmq_file_20200924082706.1493.pdf',
             'datetime': '20200924_082717'}
 
+    @mock.patch("rmq_metadata.read_pdf_pages",
+                mock.Mock(return_value=iter([])))
+    def test_stream_failed(self):
+
+        """Function:  test_stream_failed
+
+        Description:  Test with no pages extracted in streaming mode.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+
+        self.assertEqual(
+            rmq_metadata.get_pypdf2_data(self.f_name, self.cfg, self.logger),
+            (False, []))
+
+    @mock.patch("rmq_metadata.read_pdf_pages",
+                mock.Mock(return_value=iter(["x"])))
+    @mock.patch("rmq_metadata.get_stream_data")
+    def test_stream_pages(self, mock_stream):
+
+        """Function:  test_stream_pages
+
+        Description:  Test with pages streamed through the tagger.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+        mock_stream.return_value = (True, [("London", "LOCATION")])
+
+        self.assertEqual(
+            rmq_metadata.get_pypdf2_data(self.f_name, self.cfg, self.logger),
+            (True, [("London", "LOCATION")]))
+
     @mock.patch("rmq_metadata.summarize_data")
     @mock.patch("rmq_metadata.find_tokens")
     @mock.patch("rmq_metadata.word_tokenize")
@@ -269,6 +310,35 @@ class UnitTest(unittest.TestCase):
             rmq_metadata.get_pypdf2_data(self.f_name, self.cfg, self.logger),
             (True, self.final_data))
 
+    @mock.patch("rmq_metadata.summarize_data")
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.read_pdf")
+    def test_stage_timings(self, mock_read, mock_token, mock_find,
+                           mock_summ):
+
+        """Function:  test_stage_timings
+
+        Description:  Test with the stages and counts recorded on the timer.
+
+        Arguments:
+
+        """
+
+        timer = rmq_metadata.StageTimer()
+        mock_read.return_value = (True, self.rawtext)
+        mock_token.return_value = self.tokens
+        mock_find.return_value = self.categorized_text
+        mock_summ.return_value = self.final_data
+        rmq_metadata.get_pypdf2_data(
+            self.f_name, self.cfg, self.logger, timer=timer)
+
+        self.assertEqual(
+            sorted(timer.stages),
+            ["pypdf2.extract", "pypdf2.ner", "pypdf2.summarize",
+             "pypdf2.tokenize"])
+        self.assertEqual(timer.counts["pypdf2.tokens"], 5)
+
 
 if __name__ == "__main__":
     unittest.main()
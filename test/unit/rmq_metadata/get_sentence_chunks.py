@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  get_sentence_chunks.py
+
+    Description:  Unit testing of get_sentence_chunks in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_sentence_chunks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_chunks
+        test_sentence_not_split
+        test_no_periods
+        test_no_boundaries
+        test_min_tokens
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tokens = ["New", "York", ".", "Los", "Angeles", ".", "Paris",
+                       ".", "Rome", "."]
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test with a chunk of whole sentences for each worker.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_sentence_chunks(self.tokens, 2, 1),
+            [["New", "York", ".", "Los", "Angeles", "."],
+             ["Paris", ".", "Rome", "."]])
+
+    def test_sentence_not_split(self):
+
+        """Function:  test_sentence_not_split
+
+        Description:  Test with a sentence longer than the chunk size.
+
+        Arguments:
+
+        """
+
+        tokens = ["The", "United", "Nations", "met", "in", "New", "York",
+                  "."]
+
+        self.assertEqual(
+            rmq_metadata.get_sentence_chunks(tokens, 4, 1), [tokens])
+
+    def test_no_periods(self):
+
+        """Function:  test_no_periods
+
+        Description:  Test with a long list of tokens without periods split
+            at the commas.
+
+        Arguments:
+
+        """
+
+        tokens = ["Bank", "of", "America", ",", "New", "York", ",", "Los",
+                  "Angeles", ",", "Paris", ",", "Rome"] * 100
+        chunks = rmq_metadata.get_sentence_chunks(tokens, 4, 1)
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual([token for chunk in chunks for token in chunk],
+                         tokens)
+        self.assertTrue(all(chunk[-1] == "," for chunk in chunks[:-1]))
+
+    def test_no_boundaries(self):
+
+        """Function:  test_no_boundaries
+
+        Description:  Test with a long list of tokens without periods or
+            commas kept whole.
+
+        Arguments:
+
+        """
+
+        tokens = ["Bank", "of", "America"] * 100
+
+        self.assertEqual(
+            rmq_metadata.get_sentence_chunks(tokens, 4, 1), [tokens])
+
+    def test_min_tokens(self):
+
+        """Function:  test_min_tokens
+
+        Description:  Test with fewer chunks than workers for a small list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_sentence_chunks(self.tokens, 4, 10),
+            [self.tokens])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.get_sentence_chunks([], 2, 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
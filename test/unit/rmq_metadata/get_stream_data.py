@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  get_stream_data.py
+
+    Description:  Unit testing of get_stream_data in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_stream_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+        self.stream_batch_tokens = 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pages
+        test_page_break
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.pages = ["Mr John", "Smith of High Road", "London"]
+        self.tags = {"John": "PERSON", "Smith": "PERSON", "High": "LOCATION",
+                     "Road": "LOCATION", "London": "LOCATION"}
+        self.results = [
+            ("John Smith", "PERSON"), ("High Road London", "LOCATION")]
+
+    @mock.patch("rmq_metadata.find_tokens")
+    def test_no_pages(self, mock_find):
+
+        """Function:  test_no_pages
+
+        Description:  Test with no pages extracted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.get_stream_data(
+                iter([]), self.cfg, self.logger, "test"), (False, []))
+        self.assertFalse(mock_find.called)
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize", str.split)
+    def test_page_break(self, mock_find):
+
+        """Function:  test_page_break
+
+        Description:  Test with entity runs joined across page breaks.
+
+        Arguments:
+
+        """
+
+        mock_find.side_effect = lambda tokens, cfg: [
+            (token, self.tags.get(token, "O")) for token in tokens]
+
+        self.assertEqual(
+            rmq_metadata.get_stream_data(
+                iter(self.pages), self.cfg, self.logger, "test"),
+            (True, self.results))
+
+
+if __name__ == "__main__":
+    unittest.main()
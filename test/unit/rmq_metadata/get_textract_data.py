@@ -156,6 +156,10 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_stream_pages
+        test_no_encoding_found
+        test_decode_error
+        test_single_extract
         test_extract_failure
         test_extract_successful
         test_categorized_text2
@@ -181,6 +185,8 @@ class UnitTest(unittest.TestCase):
         self.text = "This is extracted text"
         self.data = {"confidence": 1.0, "encoding": "utf-8"}
         self.data2 = {"confidence": 0.9, "encoding": "utf-8"}
+        self.decode_error = UnicodeDecodeError(
+            "utf-8", b"\xe9", 0, 1, "invalid continuation byte")
         self.tokens = ["Tokens Strings", "Another token string"]
         self.categorized_text = [("Token", "O"), ("Strings", "O")]
         self.categorized_text2 = []
@@ -189,6 +195,112 @@ class UnitTest(unittest.TestCase):
         self.logger = Logger("Name", "Name", "INFO", "%(asctime)s%(message)s",
                              "%m-%d-%YT%H:%M:%SZ|")
 
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.get_textract_stream")
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_stream_pages(self, mock_extract, mock_chardet, mock_stream,
+                          mock_token):
+
+        """Function:  test_stream_pages
+
+        Description:  Test with textract text streamed a page at a time.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+        mock_extract.return_value = (True, self.text)
+        mock_chardet.return_value = self.data2
+        mock_stream.return_value = self.final_data
+
+        self.assertEqual(
+            rmq_metadata.get_textract_data(self.f_name, self.cfg, self.logger),
+            (True, self.results))
+        self.assertFalse(mock_token.called)
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_no_encoding_found(self, mock_extract, mock_chardet, mock_token,
+                               mock_find):
+
+        """Function:  test_no_encoding_found
+
+        Description:  Test with decode error for all encoding codes.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.text)
+        mock_chardet.return_value = self.data2
+        mock_token.side_effect = self.decode_error
+        mock_find.return_value = self.categorized_text
+
+        self.assertEqual(
+            rmq_metadata.get_textract_data(self.f_name, self.cfg, self.logger),
+            (True, []))
+        self.assertEqual(mock_extract.call_count, 1)
+        self.assertEqual(mock_token.call_count, 4)
+        self.assertFalse(mock_find.called)
+
+    @mock.patch("rmq_metadata.summarize_data")
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_decode_error(                              # pylint:disable=R0913
+            self, mock_extract, mock_chardet, mock_token, mock_find, mock_sum):
+
+        """Function:  test_decode_error
+
+        Description:  Test with decode error retried without re-extracting.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.text)
+        mock_chardet.return_value = self.data2
+        mock_token.side_effect = [self.decode_error, self.tokens]
+        mock_find.return_value = self.categorized_text
+        mock_sum.return_value = self.final_data
+
+        self.assertEqual(
+            rmq_metadata.get_textract_data(self.f_name, self.cfg, self.logger),
+            (True, self.results))
+        self.assertEqual(mock_extract.call_count, 1)
+
+    @mock.patch("rmq_metadata.summarize_data")
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_single_extract(                            # pylint:disable=R0913
+            self, mock_extract, mock_chardet, mock_token, mock_find, mock_sum):
+
+        """Function:  test_single_extract
+
+        Description:  Test with encoding detected and textract run once.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.text)
+        mock_chardet.return_value = self.data
+        mock_token.return_value = self.tokens
+        mock_find.return_value = self.categorized_text
+        mock_sum.return_value = self.final_data
+
+        self.assertEqual(
+            rmq_metadata.get_textract_data(self.f_name, self.cfg, self.logger),
+            (True, self.results))
+        mock_extract.assert_called_once_with(self.f_name, self.logger)
+
     @mock.patch("rmq_metadata.extract_pdf")
     def test_extract_failure(self, mock_extract):
 
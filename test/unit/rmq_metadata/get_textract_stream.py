@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  get_textract_stream.py
+
+    Description:  Unit testing of get_textract_stream in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_textract_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+        self.textract_codes = ["utf-8", "ascii", "iso-8859-1"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_encoding_found
+        test_decode_error
+        test_stream
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.text = b"Page one\fPage two"
+        self.final_data = [("London", "LOCATION")]
+        self.decode_error = UnicodeDecodeError(
+            "utf-8", b"\xe9", 0, 1, "invalid continuation byte")
+
+    @mock.patch("rmq_metadata.get_stream_data")
+    def test_no_encoding_found(self, mock_stream):
+
+        """Function:  test_no_encoding_found
+
+        Description:  Test with decode error for all encoding codes.
+
+        Arguments:
+
+        """
+
+        mock_stream.side_effect = self.decode_error
+
+        self.assertEqual(
+            rmq_metadata.get_textract_stream(
+                self.text, self.text, self.cfg, self.logger), [])
+        self.assertEqual(mock_stream.call_count, 4)
+
+    @mock.patch("rmq_metadata.get_stream_data")
+    def test_decode_error(self, mock_stream):
+
+        """Function:  test_decode_error
+
+        Description:  Test with decode error retried with another encoding.
+
+        Arguments:
+
+        """
+
+        mock_stream.side_effect = [
+            self.decode_error, (True, self.final_data)]
+
+        self.assertEqual(
+            rmq_metadata.get_textract_stream(
+                self.text, self.text, self.cfg, self.logger), self.final_data)
+
+    @mock.patch("rmq_metadata.get_stream_data")
+    def test_stream(self, mock_stream):
+
+        """Function:  test_stream
+
+        Description:  Test with textract text streamed a page at a time.
+
+        Arguments:
+
+        """
+
+        mock_stream.return_value = (True, self.final_data)
+
+        self.assertEqual(
+            rmq_metadata.get_textract_stream(
+                self.text, self.text, self.cfg, self.logger), self.final_data)
+        self.assertEqual(
+            list(mock_stream.call_args[0][0]), [b"Page one", b"Page two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+# Classification (U)
+
+"""Program:  get_textract_text.py
+
+    Description:  Unit testing of get_textract_text in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_textract_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Logger():
+
+    """Class:  Logger
+
+    Description:  Class which is a representation of gen_class.Logger class.
+
+    Methods:
+        __init__
+        log_info
+        log_err
+
+    """
+
+    def __init__(                                       # pylint:disable=R0913
+            self, job_name, job_log, log_type, log_format, log_time):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the class.
+
+        Arguments:
+
+        """
+
+        self.job_name = job_name
+        self.job_log = job_log
+        self.log_type = log_type
+        self.log_format = log_format
+        self.log_time = log_time
+        self.data = None
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  log_info method.
+
+        Arguments:
+
+        """
+
+        self.data = data
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  log_err method.
+
+        Arguments:
+
+        """
+
+        self.data = data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_extract_failed
+        test_encoding_not_detected
+        test_encoding_detected
+        test_encoding_accents
+        test_detect_timer
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.f_name = "FileName.pdf"
+        self.logger = Logger("Name", "Name", "INFO", "%(asctime)s%(message)s",
+                             "%m-%d-%YT%H:%M:%SZ|")
+        self.rawtext = b"John Smith lives in London."
+        self.text = "John Smith lives in London."
+        self.detect = {"encoding": "ascii", "confidence": 1.0}
+        self.detect2 = {"encoding": "ascii", "confidence": 0.73}
+
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_extract_failed(self, mock_extract):
+
+        """Function:  test_extract_failed
+
+        Description:  Test with extraction failed.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (False, "")
+
+        self.assertEqual(
+            rmq_metadata.get_textract_text(self.f_name, self.logger),
+            (False, ""))
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_encoding_not_detected(self, mock_extract, mock_detect):
+
+        """Function:  test_encoding_not_detected
+
+        Description:  Test with no character encoding detected.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.rawtext)
+        mock_detect.return_value = self.detect2
+
+        self.assertEqual(
+            rmq_metadata.get_textract_text(self.f_name, self.logger),
+            (True, self.text))
+        self.assertEqual(mock_extract.call_count, 1)
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_encoding_detected(self, mock_extract, mock_detect):
+
+        """Function:  test_encoding_detected
+
+        Description:  Test with character encoding detected.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.rawtext)
+        mock_detect.return_value = self.detect
+
+        self.assertEqual(
+            rmq_metadata.get_textract_text(self.f_name, self.logger),
+            (True, self.text))
+        mock_extract.assert_called_once_with(self.f_name, self.logger)
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_encoding_accents(self, mock_extract, mock_detect):
+
+        """Function:  test_encoding_accents
+
+        Description:  Test with accented text recoded to the detected
+            encoding and decoded with the same encoding.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, "Zoë Müller in Köln.".encode())
+        mock_detect.return_value = {
+            "encoding": "ISO-8859-1", "confidence": 1.0}
+
+        self.assertEqual(
+            rmq_metadata.get_textract_text(self.f_name, self.logger),
+            (True, "Zoë Müller in Köln."))
+
+    @mock.patch("rmq_metadata.chardet.detect")
+    @mock.patch("rmq_metadata.extract_pdf")
+    def test_detect_timer(self, mock_extract, mock_detect):
+
+        """Function:  test_detect_timer
+
+        Description:  Test with the detection time added to the timer.
+
+        Arguments:
+
+        """
+
+        mock_extract.return_value = (True, self.rawtext)
+        mock_detect.return_value = self.detect
+        timer = rmq_metadata.StageTimer()
+        rmq_metadata.get_textract_text(self.f_name, self.logger, timer=timer)
+
+        self.assertIn("textract.detect", timer.stages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,285 @@
+# Classification (U)
+
+"""Program:  get_union_data.py
+
+    Description:  Unit testing of get_union_data in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/get_union_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Logger():
+
+    """Class:  Logger
+
+    Description:  Class which is a representation of gen_class.Logger class.
+
+    Methods:
+        __init__
+        log_info
+        log_err
+
+    """
+
+    def __init__(                                       # pylint:disable=R0913
+            self, job_name, job_log, log_type, log_format, log_time):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the class.
+
+        Arguments:
+
+        """
+
+        self.job_name = job_name
+        self.job_log = job_log
+        self.log_type = log_type
+        self.log_format = log_format
+        self.log_time = log_time
+        self.data = None
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  log_info method.
+
+        Arguments:
+
+        """
+
+        self.data = data
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  log_err method.
+
+        Arguments:
+
+        """
+
+        self.data = data
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "rmq_metadata_unit_test"
+        self.to_line = None
+        self.port = 5672
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.message_dir = "message_dir"
+        self.log_dir = "logs"
+        self.log_file = "rmq_metadata.log"
+        self.tmp_dir = "./test/unit/rmq_metadata/testfiles"
+        self.lang_module = \
+            "DIRECTORY_PATH/classifiers/english.all.3class.distsim.crf.ser.gz"
+        self.stanford_jar = "DIRECTORY_PATH/stanford-ner.jar"
+        self.encoding = "utf-8"
+        self.token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+        self.queue_list = [
+            {"queue": "rmq_metadata_unit_test",
+             "routing_key": "ROUTING_KEY",
+             "directory": "/dir/path",
+             "prename": "",
+             "postname": "",
+             "mode": "w",
+             "ext": "pdf",
+             "stype": "encoded",
+             "archive": False}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_extract_failed
+        test_one_extract_success
+        test_no_categorized_data
+        test_categorized_data
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.f_name = "FileName.pdf"
+        self.cfg = CfgTest()
+        self.logger = Logger("Name", "Name", "INFO", "%(asctime)s%(message)s",
+                             "%m-%d-%YT%H:%M:%SZ|")
+        self.rawtext = "John Smith lives in London."
+        self.tokens = ["John", "Smith", "lives", "in", "London", "."]
+        self.categorized_text = [
+            ("John", "PERSON"), ("Smith", "PERSON"), ("lives", "O"),
+            ("in", "O"), ("London", "LOCATION"), (".", "O")]
+        self.final_data = [("John Smith", "PERSON"), ("London", "LOCATION")]
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.pdf_to_string")
+    @mock.patch("rmq_metadata.get_textract_text")
+    @mock.patch("rmq_metadata.read_pdf")
+    def test_all_extract_failed(self, mock_read, mock_textract, mock_miner,
+                                mock_find):
+
+        """Function:  test_all_extract_failed
+
+        Description:  Test with all extractions failed.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = (False, "")
+        mock_textract.return_value = (False, "")
+        mock_miner.return_value = (False, "")
+
+        self.assertEqual(
+            rmq_metadata.get_union_data(self.f_name, self.cfg, self.logger),
+            (False, []))
+        self.assertFalse(mock_find.called)
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.pdf_to_string")
+    @mock.patch("rmq_metadata.get_textract_text")
+    @mock.patch("rmq_metadata.read_pdf")
+    def test_one_extract_success(                       # pylint:disable=R0913
+            self, mock_read, mock_textract, mock_miner, mock_token,
+            mock_find):
+
+        """Function:  test_one_extract_success
+
+        Description:  Test with only one extraction successful.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = (False, "")
+        mock_textract.return_value = (False, "")
+        mock_miner.return_value = (True, self.rawtext)
+        mock_token.return_value = self.tokens
+        mock_find.return_value = self.categorized_text
+        timer = rmq_metadata.StageTimer()
+
+        self.assertEqual(
+            rmq_metadata.get_union_data(
+                self.f_name, self.cfg, self.logger, timer=timer),
+            (True, self.final_data))
+        self.assertEqual(timer.counts["extract_failed"], 2)
+        self.assertIs(mock_textract.call_args[1]["timer"], timer)
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.pdf_to_string")
+    @mock.patch("rmq_metadata.get_textract_text")
+    @mock.patch("rmq_metadata.read_pdf")
+    def test_no_categorized_data(                       # pylint:disable=R0913
+            self, mock_read, mock_textract, mock_miner, mock_token,
+            mock_find):
+
+        """Function:  test_no_categorized_data
+
+        Description:  Test with no categorized data returned.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = (True, self.rawtext)
+        mock_textract.return_value = (True, self.rawtext.encode())
+        mock_miner.return_value = (True, self.rawtext)
+        mock_token.return_value = self.tokens
+        mock_find.return_value = []
+
+        self.assertEqual(
+            rmq_metadata.get_union_data(self.f_name, self.cfg, self.logger),
+            (True, []))
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize")
+    @mock.patch("rmq_metadata.pdf_to_string")
+    @mock.patch("rmq_metadata.get_textract_text")
+    @mock.patch("rmq_metadata.read_pdf")
+    def test_categorized_data(                          # pylint:disable=R0913
+            self, mock_read, mock_textract, mock_miner, mock_token,
+            mock_find):
+
+        """Function:  test_categorized_data
+
+        Description:  Test with duplicate text categorized once.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = (True, self.rawtext)
+        mock_textract.return_value = (True, self.rawtext.encode())
+        mock_miner.return_value = (True, self.rawtext.replace(".", ""))
+        mock_token.return_value = self.tokens
+        mock_find.return_value = self.categorized_text
+
+        self.assertEqual(
+            rmq_metadata.get_union_data(self.f_name, self.cfg, self.logger),
+            (True, self.final_data))
+        mock_token.assert_called_once_with(self.rawtext)
+        self.assertEqual(mock_find.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  insert_metadata.py
+
+    Description:  Unit testing of insert_metadata in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/insert_metadata.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mongo_sink
+        test_no_mongo_sink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock(spec=["mongo"])
+        self.metadata = {"FileName": "File1.pdf"}
+
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc")
+    def test_mongo_sink(self, mock_ins):
+
+        """Function:  test_mongo_sink
+
+        Description:  Test with document inserted through the Mongo sink.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock(spec=["mongo", "mongo_sink"])
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+
+        self.assertEqual(
+            rmq_metadata.insert_metadata(self.cfg, self.metadata),
+            (True, None))
+        self.assertEqual(self.cfg.mongo_sink.docs, [self.metadata])
+        self.assertFalse(mock_ins.called)
+
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc")
+    def test_no_mongo_sink(self, mock_ins):
+
+        """Function:  test_no_mongo_sink
+
+        Description:  Test with document inserted with a new connection.
+
+        Arguments:
+
+        """
+
+        mock_ins.return_value = (False, "Connection refused")
+
+        self.assertEqual(
+            rmq_metadata.insert_metadata(self.cfg, self.metadata),
+            (False, "Connection refused"))
+
+
+if __name__ == "__main__":
+    unittest.main()
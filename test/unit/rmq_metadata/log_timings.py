@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  log_timings.py
+
+    Description:  Unit testing of log_timings in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/log_timings.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.pipeline_stats = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_log_line
+        test_stats
+        test_ner_cache
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.timer = rmq_metadata.StageTimer()
+        self.timer.add("decode", 0.25)
+        self.timer.count("body_bytes", 1024)
+        self.f_name = "Filename.pdf"
+
+    def test_log_line(self):
+
+        """Function:  test_log_line
+
+        Description:  Test with a single JSON summary line logged.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.log_timings(
+            self.cfg, self.logger, self.timer, self.f_name, True)
+        line = self.logger.log_info.call_args[0][0]
+        data = json.loads(line.split(": ", 1)[1])
+
+        self.assertEqual(self.logger.log_info.call_count, 1)
+        self.assertEqual(
+            (data["file"], data["status"], data["stages"], data["counts"]),
+            (self.f_name, True, {"decode": 0.25}, {"body_bytes": 1024}))
+
+    def test_stats(self):
+
+        """Function:  test_stats
+
+        Description:  Test with timings added to the rolling statistics.
+
+        Arguments:
+
+        """
+
+        self.cfg.pipeline_stats = rmq_metadata.PipelineStats()
+        rmq_metadata.log_timings(
+            self.cfg, self.logger, self.timer, self.f_name, False)
+
+        self.assertEqual(self.cfg.pipeline_stats.messages, 1)
+        self.assertEqual(
+            list(self.cfg.pipeline_stats.stages["decode"]), [0.25])
+
+    def test_ner_cache(self):
+
+        """Function:  test_ner_cache
+
+        Description:  Test with the hit ratio of the sentence cache logged.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_tagger = mock.Mock()
+        self.cfg.ner_tagger.cache = rmq_metadata.SentenceCache(1000)
+        self.cfg.ner_tagger.cache.hits = 3
+        self.cfg.ner_tagger.cache.misses = 1
+        rmq_metadata.log_timings(
+            self.cfg, self.logger, self.timer, self.f_name, True)
+        line = self.logger.log_info.call_args[0][0]
+
+        self.assertEqual(
+            json.loads(line.split(": ", 1)[1])["ner_cache_hit_ratio"], 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  memory_sink.py
+
+    Description:  Unit testing of MemorySink class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/memory_sink.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_insert
+        test_insert_many
+
+    """
+
+    def test_insert(self):
+
+        """Function:  test_insert
+
+        Description:  Test with documents kept in memory.
+
+        Arguments:
+
+        """
+
+        sink = rmq_metadata.MemorySink()
+
+        self.assertEqual(sink.insert({"LOCATION": ["London"]}), (True, None))
+        self.assertEqual(sink.docs, [{"LOCATION": ["London"]}])
+
+    def test_insert_many(self):
+
+        """Function:  test_insert_many
+
+        Description:  Test with a batch of documents kept in memory.
+
+        Arguments:
+
+        """
+
+        sink = rmq_metadata.MemorySink()
+
+        self.assertEqual(
+            sink.insert_many([{"Doc": 1}, {"Doc": 2}]), [(True, None)] * 2)
+        self.assertEqual(sink.docs, [{"Doc": 1}, {"Doc": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,469 @@
+# Classification (U)
+
+"""Program:  mongo_sink.py
+
+    Description:  Unit testing of MongoSink class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/mongo_sink.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MongoCfg():                                       # pylint:disable=R0903
+
+    """Class:  MongoCfg
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MongoCfg class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "Database"
+        self.tbl = "Table"
+        self.pool_size = 20
+        self.reconnect_retries = 2
+        self.reconnect_backoff = 0.5
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mongo = MongoCfg()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect
+        test_connect_once
+        test_connect_failed
+        test_close
+        test_insert
+        test_insert_reconnect
+        test_insert_failed
+        test_insert_many
+        test_insert_many_errors
+        test_insert_many_reconnect
+        test_insert_duplicate
+        test_insert_duplicate_id
+        test_hash_index
+        test_hash_index_failed
+        test_find_file_name
+        test_find_file_name_missing
+        test_find_file_name_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.coll = mock.Mock()
+        self.coll.config = {}
+        self.coll.connect.return_value = (True, None)
+        self.doc = {"LOCATION": ["London"]}
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_connect(self, mock_inst):
+
+        """Function:  test_connect
+
+        Description:  Test with connection opened with the pool size.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.connect(), (True, None))
+        mock_inst.assert_called_once_with(
+            self.cfg.mongo, "Database", "Table")
+        self.assertEqual(self.coll.config, {"maxPoolSize": 20})
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_connect_once(self, mock_inst):
+
+        """Function:  test_connect_once
+
+        Description:  Test with connection reused once open.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+        sink.connect()
+        sink.connect()
+
+        self.assertEqual(mock_inst.call_count, 1)
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_connect_failed(self, mock_inst):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with failed connection.
+
+        Arguments:
+
+        """
+
+        self.coll.connect.return_value = (False, "Connection refused")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.connect(), (False, "Connection refused"))
+        self.assertIsNone(sink.coll)
+        self.assertTrue(self.coll.disconnect.called)
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_close(self, mock_inst):
+
+        """Function:  test_close
+
+        Description:  Test with connection closed.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+        sink.connect()
+        sink.close()
+        sink.close()
+
+        self.assertIsNone(sink.coll)
+        self.assertEqual(self.coll.disconnect.call_count, 1)
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert(self, mock_inst):
+
+        """Function:  test_insert
+
+        Description:  Test with documents inserted over one connection.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.insert(self.doc), (True, None))
+        self.assertEqual(sink.insert(self.doc), (True, None))
+        self.assertEqual(mock_inst.call_count, 1)
+        self.assertEqual(self.coll.ins_doc.call_count, 2)
+
+    @mock.patch("rmq_metadata.time.sleep")
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_reconnect(self, mock_inst, mock_sleep):
+
+        """Function:  test_insert_reconnect
+
+        Description:  Test with a failed insert reconnecting to Mongo.
+
+        Arguments:
+
+        """
+
+        self.coll.ins_doc.side_effect = [
+            rmq_metadata.PyMongoError("Connection reset"), None]
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.insert(self.doc), (True, None))
+        self.assertEqual(mock_inst.call_count, 2)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @mock.patch("rmq_metadata.time.sleep")
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_failed(self, mock_inst, mock_sleep):
+
+        """Function:  test_insert_failed
+
+        Description:  Test with Mongo down for all of the retries.
+
+        Arguments:
+
+        """
+
+        self.coll.connect.return_value = (False, "Connection refused")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(
+            sink.insert(self.doc), (False, "Connection refused"))
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list], [0.5, 1.0])
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_many(self, mock_inst):
+
+        """Function:  test_insert_many
+
+        Description:  Test with documents inserted with one request.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(
+            sink.insert_many([self.doc, self.doc]), [(True, None)] * 2)
+        self.assertEqual(self.coll.coll.insert_many.call_count, 1)
+        self.assertFalse(
+            self.coll.coll.insert_many.call_args[1]["ordered"])
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_many_errors(self, mock_inst):
+
+        """Function:  test_insert_many_errors
+
+        Description:  Test with a failed document, a duplicate key from an
+            earlier attempt and content already inserted.
+
+        Arguments:
+
+        """
+
+        self.coll.coll.insert_many.side_effect = rmq_metadata.BulkWriteError(
+            {"writeErrors": [
+                {"index": 0, "code": 11000, "errmsg": "Duplicate key"},
+                {"index": 1, "code": 11000,
+                 "errmsg": "Duplicate key index: ContentHash_1"},
+                {"index": 2, "code": 121, "errmsg": "Failed validation"}]})
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(
+            sink.insert_many([self.doc] * 3),
+            [(True, None), (None, "Duplicate key index: ContentHash_1"),
+             (False, "Failed validation")])
+
+    @mock.patch("rmq_metadata.time.sleep")
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_many_reconnect(self, mock_inst, mock_sleep):
+
+        """Function:  test_insert_many_reconnect
+
+        Description:  Test with a failed request reconnecting to Mongo.
+
+        Arguments:
+
+        """
+
+        self.coll.coll.insert_many.side_effect = [
+            rmq_metadata.PyMongoError("Connection reset"), None]
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.insert_many([self.doc]), [(True, None)])
+        self.assertEqual(mock_inst.call_count, 2)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @mock.patch("rmq_metadata.time.sleep")
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_duplicate(self, mock_inst, mock_sleep):
+
+        """Function:  test_insert_duplicate
+
+        Description:  Test with the same content already inserted.
+
+        Arguments:
+
+        """
+
+        self.coll.ins_doc.side_effect = rmq_metadata.DuplicateKeyError(
+            "E11000 duplicate key error index: ContentHash_1")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(
+            sink.insert(self.doc),
+            (None, "E11000 duplicate key error index: ContentHash_1"))
+        self.assertFalse(mock_sleep.called)
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_insert_duplicate_id(self, mock_inst):
+
+        """Function:  test_insert_duplicate_id
+
+        Description:  Test with the document id already inserted.
+
+        Arguments:
+
+        """
+
+        self.coll.ins_doc.side_effect = rmq_metadata.DuplicateKeyError(
+            "E11000 duplicate key error index: _id_")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.insert(self.doc), (True, None))
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_hash_index(self, mock_inst):
+
+        """Function:  test_hash_index
+
+        Description:  Test with unique ContentHash index created on connect.
+
+        Arguments:
+
+        """
+
+        self.cfg.content_index = mock.Mock()
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+        sink.connect()
+
+        self.assertEqual(
+            self.coll.coll.create_index.call_args[0][0], "ContentHash")
+        self.assertTrue(self.coll.coll.create_index.call_args[1]["unique"])
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_hash_index_failed(self, mock_inst):
+
+        """Function:  test_hash_index_failed
+
+        Description:  Test with failed creation of the ContentHash index.
+
+        Arguments:
+
+        """
+
+        self.cfg.content_index = mock.Mock()
+        self.coll.coll.create_index.side_effect = rmq_metadata.PyMongoError(
+            "Index build failed")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.connect(), (True, None))
+        self.assertTrue(self.logger.log_warn.called)
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_find_file_name(self, mock_inst):
+
+        """Function:  test_find_file_name
+
+        Description:  Test with the file name read by the content hash.
+
+        Arguments:
+
+        """
+
+        self.coll.coll.find_one.return_value = {
+            "_id": 1, "FileName": "Original.pdf"}
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertEqual(sink.find_file_name("ab" * 32), "Original.pdf")
+        self.assertEqual(self.coll.coll.find_one.call_args[0][0],
+                         {"ContentHash": "ab" * 32})
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_find_file_name_missing(self, mock_inst):
+
+        """Function:  test_find_file_name_missing
+
+        Description:  Test with no document with the content hash.
+
+        Arguments:
+
+        """
+
+        self.coll.coll.find_one.return_value = None
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertIsNone(sink.find_file_name("ab" * 32))
+
+    @mock.patch("rmq_metadata.mongo_libs.crt_coll_inst")
+    def test_find_file_name_failed(self, mock_inst):
+
+        """Function:  test_find_file_name_failed
+
+        Description:  Test with the Mongo query failing.
+
+        Arguments:
+
+        """
+
+        self.coll.coll.find_one.side_effect = rmq_metadata.PyMongoError(
+            "Connection lost")
+        mock_inst.return_value = self.coll
+        sink = rmq_metadata.MongoSink(self.cfg, self.logger)
+
+        self.assertIsNone(sink.find_file_name("ab" * 32))
+        self.assertTrue(self.logger.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
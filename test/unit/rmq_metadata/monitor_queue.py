@@ -101,6 +101,9 @@ class UnitTest(unittest.TestCase):
         test_true_and_false
         test_false_and_true
         test_true_and_true
+        test_workers
+        test_prefetch_per_queue
+        test_write_buffer
         tearDown
 
     """
@@ -300,6 +303,93 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(rmq_metadata.monitor_queue(self.cfg, mock_log))
 
+    @mock.patch("rmq_metadata.rabbitmq_class.RabbitMQCon")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_workers(self, mock_log, mock_rq):
+
+        """Function:  test_workers
+
+        Description:  Test with a pool of worker threads.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 4
+        mock_log.return_value = True
+        mock_rq.return_value = rmq_metadata.rabbitmq_class.RabbitMQCon
+        mock_rq.create_connection.return_value = (True, "Error_Message")
+        mock_rq.channel.is_open = True
+        mock_rq.consume.return_value = "RabbitMQ_Tag"
+        mock_rq.start_loop.return_value = True
+
+        self.assertFalse(rmq_metadata.monitor_queue(self.cfg, mock_log))
+        mock_rq.channel.basic_qos.assert_called_with(prefetch_count=4)
+
+    @mock.patch("rmq_metadata.rabbitmq_class.RabbitMQCon")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_prefetch_per_queue(self, mock_log, mock_rq):
+
+        """Function:  test_prefetch_per_queue
+
+        Description:  Test with the prefetch count set for each queue, so a
+            queue without a limit does not keep the previous queue's limit.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list = [
+            dict(self.cfg.queue_list[0], prefetch_count=5),
+            dict(self.cfg.queue_list[0], queue="rmq_metadata_unit_test2")]
+        mock_log.return_value = True
+        mock_rq.return_value = rmq_metadata.rabbitmq_class.RabbitMQCon
+        mock_rq.create_connection.return_value = (True, "Error_Message")
+        mock_rq.channel.is_open = True
+        mock_rq.consume.return_value = "RabbitMQ_Tag"
+        mock_rq.start_loop.return_value = True
+
+        self.assertFalse(rmq_metadata.monitor_queue(self.cfg, mock_log))
+        self.assertEqual(
+            mock_rq.channel.basic_qos.call_args_list,
+            [mock.call(prefetch_count=5), mock.call(prefetch_count=0)])
+
+    @mock.patch("rmq_metadata.process_worker")
+    @mock.patch("rmq_metadata.rabbitmq_class.RabbitMQCon")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_write_buffer(self, mock_log, mock_rq, mock_worker):
+
+        """Function:  test_write_buffer
+
+        Description:  Test with inserts buffered and messages acknowledged
+            through the tracker.
+
+        Arguments:
+
+        """
+
+        self.cfg.write_batch_size = 10
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        mock_log.return_value = True
+        mock_rq.return_value = rmq_metadata.rabbitmq_class.RabbitMQCon
+        mock_rq.create_connection.return_value = (True, "Error_Message")
+        mock_rq.channel.is_open = True
+        mock_rq.consume.return_value = "RabbitMQ_Tag"
+        mock_rq.start_loop.return_value = True
+
+        self.assertFalse(rmq_metadata.monitor_queue(self.cfg, mock_log))
+        self.assertIsInstance(self.cfg.write_buffer, rmq_metadata.WriteBuffer)
+        self.assertFalse(self.cfg.write_buffer.thread.is_alive())
+        self.assertFalse(mock_rq.start_loop.called)
+        mock_rq.channel.start_consuming.assert_called_once_with()
+
+        method = mock.Mock(routing_key="ROUTING_KEY", delivery_tag=3)
+        mock_rq.consume.call_args[0][0](None, method, None, "Body")
+        tracker = mock_worker.call_args[0][5]
+
+        self.assertIsInstance(tracker, rmq_metadata.AckTracker)
+        self.assertIn(3, tracker.pending)
+
     def tearDown(self):
 
         """Function:  tearDown
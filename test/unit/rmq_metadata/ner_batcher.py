@@ -0,0 +1,315 @@
+# Classification (U)
+
+"""Program:  ner_batcher.py
+
+    Description:  Unit testing of NerBatcher class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/ner_batcher.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Tagger():
+
+    """Class:  Tagger
+
+    Description:  Class which is a representation of the NerTagger class.
+
+    Methods:
+        __init__
+        tag
+        tag_sents
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the class.
+
+        Arguments:
+
+        """
+
+        self.calls = []
+        self.error = None
+
+    def tag(self, tokenized_text):
+
+        """Method:  tag
+
+        Description:  tag method.
+
+        Arguments:
+
+        """
+
+        return self.tag_sents([tokenized_text])[0]
+
+    def tag_sents(self, token_lists):
+
+        """Method:  tag_sents
+
+        Description:  tag_sents method.
+
+        Arguments:
+
+        """
+
+        self.calls.append(token_lists)
+
+        if self.error:
+            raise self.error
+
+        return [[(token, "O") for token in tokens] for tokens in token_lists]
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.ner_tagger = Tagger()
+        self.ner_batch_docs = 2
+        self.ner_batch_tokens = 50000
+        self.ner_batch_wait = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        run_threads
+        test_batch
+        test_wait
+        test_max_tokens
+        test_empty
+        test_error
+        test_stop_pending
+        test_stopped
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.batcher = rmq_metadata.NerBatcher(self.cfg, self.logger)
+        self.results = {}
+
+    def run_threads(self, token_lists):
+
+        """Function:  run_threads
+
+        Description:  Tag each list of tokens in its own thread.
+
+        Arguments:
+
+        """
+
+        def worker(name, tokens):
+
+            """Function:  worker
+
+            Description:  Tag a list of tokens.
+
+            Arguments:
+
+            """
+
+            self.results[name] = self.batcher.tag(tokens)
+
+        threads = [threading.Thread(target=worker, args=(name, tokens))
+                   for name, tokens in token_lists.items()]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(10)
+
+    def test_batch(self):
+
+        """Function:  test_batch
+
+        Description:  Test with requests from two threads sent together.
+
+        Arguments:
+
+        """
+
+        self.batcher.start()
+        self.run_threads({"doc1": ["London"], "doc2": ["Paris", "."]})
+
+        self.assertEqual(len(self.cfg.ner_tagger.calls), 1)
+        self.assertEqual(self.results["doc1"], [("London", "O")])
+        self.assertEqual(self.results["doc2"], [("Paris", "O"), (".", "O")])
+        self.assertEqual((self.batcher.requests, self.batcher.docs), (1, 2))
+
+    def test_wait(self):
+
+        """Function:  test_wait
+
+        Description:  Test with a request sent after the batch wait.
+
+        Arguments:
+
+        """
+
+        self.batcher.wait = 0.01
+        self.batcher.start()
+
+        self.assertEqual(self.batcher.tag(["London"]), [("London", "O")])
+        self.assertEqual((self.batcher.requests, self.batcher.docs), (1, 1))
+
+    def test_max_tokens(self):
+
+        """Function:  test_max_tokens
+
+        Description:  Test with batches limited by the number of tokens.
+
+        Arguments:
+
+        """
+
+        self.batcher.max_tokens = 2
+        self.batcher.start()
+        self.run_threads({"doc1": ["London", "."], "doc2": ["Paris", "."]})
+
+        self.assertEqual(len(self.cfg.ner_tagger.calls), 2)
+        self.assertEqual(self.results["doc2"], [("Paris", "O"), (".", "O")])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.batcher.tag([]), [])
+        self.assertEqual(self.cfg.ner_tagger.calls, [])
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test with a failed batch raised in each thread.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_tagger.error = OSError("Java command failed")
+        self.batcher.wait = 0.01
+        self.batcher.start()
+
+        with self.assertRaises(OSError):
+            self.batcher.tag(["London"])
+
+        self.assertTrue(self.logger.log_warn.called)
+
+    def test_stop_pending(self):
+
+        """Function:  test_stop_pending
+
+        Description:  Test with pending requests sent when stopped.
+
+        Arguments:
+
+        """
+
+        self.batcher.start()
+        thread = threading.Thread(
+            target=self.run_threads, args=({"doc1": ["London"]},))
+        thread.start()
+
+        while not self.batcher.pending:
+            thread.join(0.01)
+
+        self.batcher.stop()
+        thread.join(10)
+
+        self.assertEqual(self.results["doc1"], [("London", "O")])
+
+    def test_stopped(self):
+
+        """Function:  test_stopped
+
+        Description:  Test with tokens tagged directly once stopped.
+
+        Arguments:
+
+        """
+
+        self.batcher.stop()
+
+        self.assertEqual(self.batcher.tag(["London"]), [("London", "O")])
+        self.assertEqual(self.batcher.requests, 0)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.batcher.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
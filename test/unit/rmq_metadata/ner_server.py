@@ -0,0 +1,299 @@
+# Classification (U)
+
+"""Program:  ner_server.py
+
+    Description:  Unit testing of NerServer class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/ner_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.lang_module = \
+            "DIRECTORY_PATH/classifiers/english.all.3class.distsim.crf.ser.gz"
+        self.stanford_jar = "DIRECTORY_PATH/stanford-ner.jar"
+        self.encoding = "utf-8"
+        self.ner_server = True
+        self.ner_server_port = 9199
+        self.ner_server_timeout = 0
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_command
+        test_is_running
+        test_not_running
+        test_start_existing
+        test_start_fails
+        test_start_not_ready
+        test_start_private
+        test_stop_private
+        test_stop_shared
+        test_tag
+        test_tag_mismatch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.tokens = ["London", ","]
+        self.results = [("London", "LOCATION"), (",", "O")]
+
+    def test_command(self):
+
+        """Function:  test_command
+
+        Description:  Test with the server command line.
+
+        Arguments:
+
+        """
+
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertIn("edu.stanford.nlp.ie.NERServer", ner.command())
+        self.assertIn("9199", ner.command())
+
+    @mock.patch("rmq_metadata.socket.create_connection")
+    def test_is_running(self, mock_conn):
+
+        """Function:  test_is_running
+
+        Description:  Test with a server listening on the port.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = mock.MagicMock()
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertTrue(ner.is_running())
+
+    @mock.patch("rmq_metadata.socket.create_connection")
+    def test_not_running(self, mock_conn):
+
+        """Function:  test_not_running
+
+        Description:  Test with no server listening on the port.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = ConnectionRefusedError
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertFalse(ner.is_running())
+
+    @mock.patch("rmq_metadata.subprocess.Popen")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    @mock.patch("rmq_metadata.NerServer.is_running",
+                mock.Mock(return_value=True))
+    def test_start_existing(self, mock_log, mock_popen):
+
+        """Function:  test_start_existing
+
+        Description:  Test with a server already running on the host.
+
+        Arguments:
+
+        """
+
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertTrue(ner.start(mock_log))
+        self.assertFalse(mock_popen.called)
+
+    @mock.patch("rmq_metadata.subprocess.Popen")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    @mock.patch("rmq_metadata.NerServer.is_running",
+                mock.Mock(return_value=False))
+    def test_start_fails(self, mock_log, mock_popen):
+
+        """Function:  test_start_fails
+
+        Description:  Test with java not able to start.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = FileNotFoundError("java")
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertFalse(ner.start(mock_log))
+
+    @mock.patch("rmq_metadata.subprocess.Popen")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    @mock.patch("rmq_metadata.NerServer.is_running",
+                mock.Mock(return_value=False))
+    def test_start_not_ready(self, mock_log, mock_popen):
+
+        """Function:  test_start_not_ready
+
+        Description:  Test with server not ready before the timeout.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value.poll.return_value = 1
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertFalse(ner.start(mock_log))
+
+    @mock.patch("rmq_metadata.subprocess.Popen")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    @mock.patch("rmq_metadata.NerServer.is_running",
+                mock.Mock(return_value=True))
+    def test_start_private(self, mock_log, mock_popen):
+
+        """Function:  test_start_private
+
+        Description:  Test with a private server started on a free port, even
+            with a shared server running.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value.poll.return_value = None
+        ner = rmq_metadata.NerServer(self.cfg, private=True)
+
+        self.assertTrue(ner.start(mock_log))
+        self.assertTrue(ner.is_alive())
+        self.assertNotEqual(ner.port, 9199)
+        self.assertFalse(mock_popen.call_args[1]["start_new_session"])
+
+    def test_stop_private(self):
+
+        """Function:  test_stop_private
+
+        Description:  Test with a private server stopped.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock()
+        proc.poll.return_value = None
+        ner = rmq_metadata.NerServer(self.cfg, private=True)
+        ner.proc = proc
+        ner.port = 40000
+        ner.stop()
+
+        proc.terminate.assert_called_once_with()
+        self.assertEqual((ner.proc, ner.port), (None, None))
+        self.assertFalse(ner.is_alive())
+
+    def test_stop_shared(self):
+
+        """Function:  test_stop_shared
+
+        Description:  Test with a shared server left running.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock()
+        ner = rmq_metadata.NerServer(self.cfg)
+        ner.proc = proc
+        ner.stop()
+
+        self.assertFalse(proc.terminate.called)
+        self.assertEqual(ner.port, 9199)
+
+    @mock.patch("rmq_metadata.socket.create_connection")
+    def test_tag(self, mock_conn):
+
+        """Function:  test_tag
+
+        Description:  Test with tokens tagged by the server.
+
+        Arguments:
+
+        """
+
+        sock = mock_conn.return_value.__enter__.return_value
+        sock.recv.side_effect = [b"London/LOCATION ,/O\n", b""]
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+
+    @mock.patch("rmq_metadata.socket.create_connection")
+    def test_tag_mismatch(self, mock_conn):
+
+        """Function:  test_tag_mismatch
+
+        Description:  Test with server response not matching the request.
+
+        Arguments:
+
+        """
+
+        sock = mock_conn.return_value.__enter__.return_value
+        sock.recv.side_effect = [b"London/LOCATION\n", b""]
+        ner = rmq_metadata.NerServer(self.cfg)
+
+        with self.assertRaises(ValueError):
+            ner.tag(self.tokens)
+
+
+if __name__ == "__main__":
+    unittest.main()
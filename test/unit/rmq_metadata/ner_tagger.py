@@ -0,0 +1,577 @@
+# Classification (U)
+
+"""Program:  ner_tagger.py
+
+    Description:  Unit testing of NerTagger class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/ner_tagger.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Logger():
+
+    """Class:  Logger
+
+    Description:  Class which is a representation of gen_class.Logger class.
+
+    Methods:
+        __init__
+        log_warn
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the class.
+
+        Arguments:
+
+        """
+
+        self.data = None
+
+    def log_warn(self, data):
+
+        """Method:  log_warn
+
+        Description:  log_warn method.
+
+        Arguments:
+
+        """
+
+        self.data = data
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.lang_module = \
+            "DIRECTORY_PATH/classifiers/english.all.3class.distsim.crf.ser.gz"
+        self.stanford_jar = "DIRECTORY_PATH/stanford-ner.jar"
+        self.encoding = "utf-8"
+        self.ner_server = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_warm_up
+        test_warm_up_local
+        test_warm_up_fails
+        test_is_healthy
+        test_is_healthy_server
+        test_restart
+        test_tag
+        test_tag_restart
+        test_tag_restart_fails
+        test_warm_up_server
+        test_server_tag
+        test_server_fallback
+        test_no_cache
+        test_cache
+        test_cache_mismatch
+        test_cache_long_sentence
+        test_tag_sents
+        test_tag_sents_server
+        test_tag_sents_cache
+        test_parallel
+        test_parallel_small
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = Logger()
+        self.tokens = ["London", ","]
+        self.results = [("London", "LOCATION"), (",", "O")]
+
+    @mock.patch("rmq_metadata.NerServer.tag")
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_warm_up(self, mock_nlp, mock_tag):
+
+        """Function:  test_warm_up
+
+        Description:  Test with warm-up through the private NER server.
+
+        Arguments:
+
+        """
+
+        mock_tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertTrue(ner.warm_up(self.logger))
+        self.assertTrue(ner.server.private)
+        self.assertFalse(mock_nlp.called)
+
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=False))
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_warm_up_local(self, mock_nlp):
+
+        """Function:  test_warm_up_local
+
+        Description:  Test with warm-up through the nltk tagger when the NER
+            server does not start.
+
+        Arguments:
+
+        """
+
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertTrue(ner.warm_up(self.logger))
+        self.assertEqual(mock_nlp.call_count, 1)
+
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=False))
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_warm_up_fails(self, mock_nlp):
+
+        """Function:  test_warm_up_fails
+
+        Description:  Test with failed warm-up of the tagger.
+
+        Arguments:
+
+        """
+
+        mock_nlp.side_effect = LookupError("stanford-ner.jar not found")
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertFalse(ner.warm_up(self.logger))
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_is_healthy(self, mock_nlp):
+
+        """Function:  test_is_healthy
+
+        Description:  Test health check of the nltk tagger before and after a
+            tag request.
+
+        Arguments:
+
+        """
+
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+        self.assertFalse(ner.is_healthy())
+        ner.tag(self.tokens)
+
+        self.assertTrue(ner.is_healthy())
+
+    @mock.patch("rmq_metadata.NerServer.is_running",
+                mock.Mock(return_value=True))
+    def test_is_healthy_server(self):
+
+        """Function:  test_is_healthy_server
+
+        Description:  Test health check of the private NER server process.
+
+        Arguments:
+
+        """
+
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.server.port = 40000
+        ner.server.proc = mock.Mock()
+        ner.server.proc.poll.return_value = None
+        self.assertTrue(ner.is_healthy())
+        ner.server.proc.poll.return_value = 1
+
+        self.assertFalse(ner.is_healthy())
+
+    @mock.patch("rmq_metadata.NerServer.start")
+    @mock.patch("rmq_metadata.NerServer.stop")
+    def test_restart(self, mock_stop, mock_start):
+
+        """Function:  test_restart
+
+        Description:  Test the private NER server is restarted once for the
+            failed server process.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock()
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.server.port = 40000
+        ner.server.proc = proc
+        mock_start.side_effect = lambda log: setattr(
+            ner.server, "proc", mock.Mock())
+
+        self.assertTrue(ner.restart(proc))
+        self.assertTrue(ner.restart(proc))
+        self.assertEqual(ner.restarts, 1)
+        self.assertEqual((mock_stop.call_count, mock_start.call_count),
+                         (1, 1))
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_tag(self, mock_nlp):
+
+        """Function:  test_tag
+
+        Description:  Test with a new nltk tagger for each request, as it is
+            not safe to share between threads.
+
+        Arguments:
+
+        """
+
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.tag(self.tokens)
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        self.assertEqual(mock_nlp.call_count, 2)
+
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.NerServer.stop", mock.Mock())
+    @mock.patch("rmq_metadata.NerServer.tag")
+    def test_tag_restart(self, mock_tag):
+
+        """Function:  test_tag_restart
+
+        Description:  Test with a failed request restarting the private NER
+            server.
+
+        Arguments:
+
+        """
+
+        mock_tag.side_effect = [OSError("Connection reset"), self.results]
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.server.port = 40000
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        self.assertEqual((ner.restarts, ner.fallbacks), (1, 0))
+
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=False))
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    @mock.patch("rmq_metadata.NerServer.tag")
+    def test_tag_restart_fails(self, mock_tag, mock_nlp):
+
+        """Function:  test_tag_restart_fails
+
+        Description:  Test with the private NER server not restarting and the
+            request falling back to the nltk tagger.
+
+        Arguments:
+
+        """
+
+        mock_tag.side_effect = OSError("Connection reset")
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.server.port = 40000
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        self.assertEqual((ner.restarts, ner.fallbacks), (1, 1))
+        self.assertIsNone(ner.server.port)
+
+    @mock.patch("rmq_metadata.NerServer.tag")
+    @mock.patch("rmq_metadata.NerServer.start", mock.Mock(return_value=True))
+    def test_warm_up_server(self, mock_tag):
+
+        """Function:  test_warm_up_server
+
+        Description:  Test with warm-up through the NER server.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_server = True
+        mock_tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertTrue(ner.warm_up(self.logger))
+        self.assertFalse(ner.server.private)
+
+    @mock.patch("rmq_metadata.NerServer.tag")
+    def test_server_tag(self, mock_tag):
+
+        """Function:  test_server_tag
+
+        Description:  Test with tokens tagged by the NER server.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_server = True
+        mock_tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        self.assertEqual(ner.fallbacks, 0)
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    @mock.patch("rmq_metadata.NerServer.tag")
+    def test_server_fallback(self, mock_tag, mock_nlp):
+
+        """Function:  test_server_fallback
+
+        Description:  Test with NER server failure falling back to the
+            in-process tagger.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_server = True
+        mock_tag.side_effect = ConnectionRefusedError
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        self.assertEqual(ner.fallbacks, 1)
+
+    def test_no_cache(self):
+
+        """Function:  test_no_cache
+
+        Description:  Test with no sentence cache by default.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(rmq_metadata.NerTagger(self.cfg).cache)
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_cache(self, mock_nlp):
+
+        """Function:  test_cache
+
+        Description:  Test with only sentences not in the cache tagged.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_cache_size = 10000
+        mock_nlp.return_value.tag.side_effect = [
+            [("London", "LOCATION"), (".", "O")],
+            [("Paris", "LOCATION"), (".", "O")]]
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.tag(["London", "."])
+
+        self.assertEqual(
+            ner.tag(["Paris", ".", "London", "."]),
+            [("Paris", "LOCATION"), (".", "O"), ("London", "LOCATION"),
+             (".", "O")])
+        mock_nlp.return_value.tag.assert_called_with(["Paris", "."])
+        self.assertEqual((ner.cache.hits, ner.cache.misses), (1, 2))
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_cache_mismatch(self, mock_nlp):
+
+        """Function:  test_cache_mismatch
+
+        Description:  Test with tagger results not matching the tokens.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_cache_size = 10000
+        mock_nlp.return_value.tag.side_effect = [
+            [("London.", "LOCATION")], [("London.", "LOCATION")]]
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag(["London", "."]), [("London.", "LOCATION")])
+        self.assertEqual(len(ner.cache.entries), 0)
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_tag_sents(self, mock_nlp):
+
+        """Function:  test_tag_sents
+
+        Description:  Test with several lists of tokens in one request.
+
+        Arguments:
+
+        """
+
+        mock_nlp.return_value.tag_sents.return_value = [
+            self.results, [("Paris", "LOCATION")]]
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag_sents([self.tokens, ["Paris"]]),
+                         [self.results, [("Paris", "LOCATION")]])
+        mock_nlp.return_value.tag_sents.assert_called_once_with(
+            [self.tokens, ["Paris"]])
+
+    @mock.patch("rmq_metadata.NerServer.tag")
+    def test_tag_sents_server(self, mock_tag):
+
+        """Function:  test_tag_sents_server
+
+        Description:  Test with lists of tokens joined for the NER server.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_server = True
+        mock_tag.return_value = self.results + [("Paris", "LOCATION")]
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag_sents([self.tokens, ["Paris"]]),
+                         [self.results, [("Paris", "LOCATION")]])
+        mock_tag.assert_called_once_with(["London", ",", "Paris"])
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_tag_sents_cache(self, mock_nlp):
+
+        """Function:  test_tag_sents_cache
+
+        Description:  Test with only sentences not in the cache tagged.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_cache_size = 10000
+        mock_nlp.return_value.tag.side_effect = [
+            [("London", "LOCATION"), (".", "O")],
+            [("Paris", "LOCATION"), (".", "O")]]
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.tag(["London", "."])
+
+        self.assertEqual(
+            ner.tag_sents([["Paris", "."], ["London", "."]]),
+            [[("Paris", "LOCATION"), (".", "O")],
+             [("London", "LOCATION"), (".", "O")]])
+        mock_nlp.return_value.tag.assert_called_with(["Paris", "."])
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_parallel(self, mock_nlp):
+
+        """Function:  test_parallel
+
+        Description:  Test with sentence-aligned chunks tagged in parallel.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_workers = 2
+        self.cfg.ner_chunk_tokens = 1
+        mock_nlp.return_value.tag.side_effect = lambda tokens: [
+            (token, "O" if token == "." else "LOCATION") for token in tokens]
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(
+            ner.tag(["New", "York", ".", "Los", "Angeles", "."]),
+            [("New", "LOCATION"), ("York", "LOCATION"), (".", "O"),
+             ("Los", "LOCATION"), ("Angeles", "LOCATION"), (".", "O")])
+        self.assertEqual(
+            sorted(item[0][0] for item in
+                   mock_nlp.return_value.tag.call_args_list),
+            [["Los", "Angeles", "."], ["New", "York", "."]])
+        self.assertEqual(mock_nlp.call_count, 2)
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_parallel_small(self, mock_nlp):
+
+        """Function:  test_parallel_small
+
+        Description:  Test with a list of tokens too small to split.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_workers = 2
+        mock_nlp.return_value.tag.return_value = self.results
+        ner = rmq_metadata.NerTagger(self.cfg)
+
+        self.assertEqual(ner.tag(self.tokens), self.results)
+        mock_nlp.return_value.tag.assert_called_once_with(self.tokens)
+
+    @mock.patch("rmq_metadata.StanfordNERTagger")
+    def test_cache_long_sentence(self, mock_nlp):
+
+        """Function:  test_cache_long_sentence
+
+        Description:  Test with text without periods not cached.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_cache_size = 10000000
+        tokens = ["London"] * 1000 + ["Paris", "."]
+        mock_nlp.return_value.tag.side_effect = lambda items: [
+            (item, "LOCATION") for item in items]
+        ner = rmq_metadata.NerTagger(self.cfg)
+        ner.tag(["Paris", "."])
+
+        self.assertEqual(
+            ner.tag(["Rome", "."] + tokens),
+            [("Rome", "LOCATION"), (".", "LOCATION")]
+            + [(item, "LOCATION") for item in tokens])
+        mock_nlp.return_value.tag.assert_called_with(["Rome", "."] + tokens)
+        self.assertEqual(len(ner.cache.entries), 2)
+        self.assertEqual((ner.cache.hits, ner.cache.misses), (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
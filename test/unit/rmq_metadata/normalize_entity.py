@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  normalize_entity.py
+
+    Description:  Unit testing of normalize_entity in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/normalize_entity.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all
+        test_casefold
+        test_whitespace
+        test_no_normalize
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.entity = " United\n Kingdom "
+
+    def test_all(self):
+
+        """Function:  test_all
+
+        Description:  Test with all normalizations.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.normalize_entity(
+                self.entity, ["whitespace", "casefold"]), "united kingdom")
+
+    def test_casefold(self):
+
+        """Function:  test_casefold
+
+        Description:  Test with casefold normalization.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.normalize_entity(self.entity, ["casefold"]),
+            " united\n kingdom ")
+
+    def test_whitespace(self):
+
+        """Function:  test_whitespace
+
+        Description:  Test with whitespace normalization.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.normalize_entity(self.entity, ["whitespace"]),
+            "United Kingdom")
+
+    def test_no_normalize(self):
+
+        """Function:  test_no_normalize
+
+        Description:  Test with no normalization.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.normalize_entity(self.entity, []), self.entity)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  open_pdf.py
+
+    Description:  Unit testing of open_pdf in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/open_pdf.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_memoryview
+        test_pdf_data
+        test_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = "./test/unit/rmq_metadata/testfiles"
+        self.f_name = os.path.join(self.tmpdir, "t_file.txt")
+        self.pdf_data = b"%PDF-1.4\n"
+
+    def test_memoryview(self):
+
+        """Function:  test_memoryview
+
+        Description:  Test with PDF data in a memoryview.
+
+        Arguments:
+
+        """
+
+        with rmq_metadata.open_pdf(
+                self.f_name, memoryview(self.pdf_data)) as f_hdlr:
+
+            self.assertEqual(f_hdlr.read(), self.pdf_data)
+
+    def test_pdf_data(self):
+
+        """Function:  test_pdf_data
+
+        Description:  Test with PDF data in memory.
+
+        Arguments:
+
+        """
+
+        with rmq_metadata.open_pdf(self.f_name, self.pdf_data) as f_hdlr:
+
+            self.assertEqual(f_hdlr.read(), self.pdf_data)
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with PDF file.
+
+        Arguments:
+
+        """
+
+        with rmq_metadata.open_pdf(self.f_name) as f_hdlr:
+
+            self.assertEqual(f_hdlr.name, self.f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  pdf_page_count.py
+
+    Description:  Unit testing of pdf_page_count in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pdf_page_count.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_page_count
+        test_indirect_count
+        test_no_page_tree
+        test_bad_count
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.doc = mock.Mock(catalog={"Pages": {"Count": 5}})
+
+    def test_page_count(self):
+
+        """Function:  test_page_count
+
+        Description:  Test with the number of pages in the page tree.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.pdf_page_count(self.doc), 5)
+
+    @mock.patch("rmq_metadata.resolve1")
+    def test_indirect_count(self, mock_resolve):
+
+        """Function:  test_indirect_count
+
+        Description:  Test with the page count an indirect object.
+
+        Arguments:
+
+        """
+
+        mock_resolve.side_effect = [{"Count": "ref"}, 7]
+
+        self.assertEqual(rmq_metadata.pdf_page_count(self.doc), 7)
+
+    def test_no_page_tree(self):
+
+        """Function:  test_no_page_tree
+
+        Description:  Test with no page tree in the catalog.
+
+        Arguments:
+
+        """
+
+        self.doc.catalog = {}
+
+        self.assertEqual(rmq_metadata.pdf_page_count(self.doc), 0)
+
+    def test_bad_count(self):
+
+        """Function:  test_bad_count
+
+        Description:  Test with a page count which is not a number.
+
+        Arguments:
+
+        """
+
+        self.doc.catalog = {"Pages": {"Count": "five"}}
+
+        self.assertEqual(rmq_metadata.pdf_page_count(self.doc), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  pdf_pages.py
+
+    Description:  Unit testing of pdf_pages in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pdf_pages.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_generator
+        test_no_pages
+        test_pages
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pdfreader = mock.Mock()
+        self.pdfreader.pages = [mock.Mock(), mock.Mock()]
+        self.pdfreader.pages[0].extract_text.return_value = "Page one"
+        self.pdfreader.pages[1].extract_text.return_value = "Page two"
+
+    def test_generator(self):
+
+        """Function:  test_generator
+
+        Description:  Test pages are extracted as they are read.
+
+        Arguments:
+
+        """
+
+        pages = rmq_metadata.pdf_pages(self.pdfreader)
+
+        self.assertIsInstance(pages, types.GeneratorType)
+        self.assertEqual(next(pages), "Page one")
+        self.assertFalse(self.pdfreader.pages[1].extract_text.called)
+
+    def test_no_pages(self):
+
+        """Function:  test_no_pages
+
+        Description:  Test with no pages in the PDF.
+
+        Arguments:
+
+        """
+
+        self.pdfreader.pages = []
+
+        self.assertEqual(list(rmq_metadata.pdf_pages(self.pdfreader)), [])
+
+    def test_pages(self):
+
+        """Function:  test_pages
+
+        Description:  Test with text of each page.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(rmq_metadata.pdf_pages(self.pdfreader)),
+            ["Page one", "Page two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@
 # Standard
 import sys
 import os
+import concurrent.futures
 import unittest
 import mock
 
@@ -167,6 +168,10 @@ class UnitTest(unittest.TestCase):
         setUp
         test_multiple_pages
         test_pdf_to_string
+        test_page_ranges
+        test_below_min_pages
+        test_bad_page_tree
+        test_no_pool
 
     """
 
@@ -242,6 +247,125 @@ class UnitTest(unittest.TestCase):
             rmq_metadata.pdf_to_string(self.f_name, self.logger),
             (True, self.results))
 
+    @mock.patch("rmq_metadata.pdfminer_page_range")
+    @mock.patch("rmq_metadata.resolve1", mock.Mock(return_value={"Count": 5}))
+    @mock.patch("rmq_metadata.PDFDocument", mock.MagicMock())
+    @mock.patch("rmq_metadata.PDFParser", mock.Mock(return_value="parser"))
+    def test_page_ranges(self, mock_range):
+
+        """Function:  test_page_ranges
+
+        Description:  Test with page ranges extracted by the worker pool.
+
+        Arguments:
+
+        """
+
+        mock_range.side_effect = \
+            lambda f_name, start, end, pdf_data: "Pages %s-%s. " % (start, end)
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                rmq_metadata.pdf_to_string(
+                    self.f_name, self.logger, workers=2, min_pages=5,
+                    executor=executor),
+                (True, "Pages 0-3 Pages 3-5 "))
+
+    @mock.patch("rmq_metadata.TextConverter", mock.Mock(return_value="device"))
+    @mock.patch("rmq_metadata.PDFResourceManager",
+                mock.Mock(return_value="rsrcmgr"))
+    @mock.patch("rmq_metadata.pdfminer_page_range")
+    @mock.patch("rmq_metadata.resolve1", mock.Mock(return_value={"Count": 5}))
+    @mock.patch("rmq_metadata.PDFDocument", mock.MagicMock())
+    @mock.patch("rmq_metadata.PDFParser", mock.Mock(return_value="parser"))
+    @mock.patch("rmq_metadata.PDFPage.create_pages")
+    @mock.patch("rmq_metadata.PDFPageInterpreter")
+    @mock.patch("rmq_metadata.io.BytesIO")
+    def test_below_min_pages(                           # pylint:disable=R0913
+            self, mock_io, mock_inter, mock_pages, mock_range):
+
+        """Function:  test_below_min_pages
+
+        Description:  Test with too few pages for the worker pool.
+
+        Arguments:
+
+        """
+
+        mock_io.return_value = self.bytesio
+        mock_inter.return_value = self.interpreter
+        mock_pages.return_value = self.page_list
+
+        self.assertEqual(
+            rmq_metadata.pdf_to_string(
+                self.f_name, self.logger, workers=2, min_pages=100,
+                executor=mock.Mock()),
+            (True, self.results))
+        self.assertFalse(mock_range.called)
+
+    @mock.patch("rmq_metadata.TextConverter", mock.Mock(return_value="device"))
+    @mock.patch("rmq_metadata.PDFResourceManager",
+                mock.Mock(return_value="rsrcmgr"))
+    @mock.patch("rmq_metadata.resolve1",
+                mock.Mock(side_effect=KeyError("Count")))
+    @mock.patch("rmq_metadata.PDFDocument", mock.MagicMock())
+    @mock.patch("rmq_metadata.PDFParser", mock.Mock(return_value="parser"))
+    @mock.patch("rmq_metadata.PDFPage.create_pages")
+    @mock.patch("rmq_metadata.PDFPageInterpreter")
+    @mock.patch("rmq_metadata.io.BytesIO")
+    def test_bad_page_tree(self, mock_io, mock_inter, mock_pages):
+
+        """Function:  test_bad_page_tree
+
+        Description:  Test with a malformed page tree extracted serially.
+
+        Arguments:
+
+        """
+
+        mock_io.return_value = self.bytesio
+        mock_inter.return_value = self.interpreter
+        mock_pages.return_value = self.page_list
+        executor = mock.Mock()
+
+        self.assertEqual(
+            rmq_metadata.pdf_to_string(
+                self.f_name, self.logger, workers=2, min_pages=1,
+                executor=executor),
+            (True, self.results))
+        self.assertFalse(executor.map.called)
+
+    @mock.patch("rmq_metadata.TextConverter", mock.Mock(return_value="device"))
+    @mock.patch("rmq_metadata.PDFResourceManager",
+                mock.Mock(return_value="rsrcmgr"))
+    @mock.patch("rmq_metadata.pdfminer_page_range")
+    @mock.patch("rmq_metadata.resolve1", mock.Mock(return_value={"Count": 5}))
+    @mock.patch("rmq_metadata.PDFDocument", mock.MagicMock())
+    @mock.patch("rmq_metadata.PDFParser", mock.Mock(return_value="parser"))
+    @mock.patch("rmq_metadata.PDFPage.create_pages")
+    @mock.patch("rmq_metadata.PDFPageInterpreter")
+    @mock.patch("rmq_metadata.io.BytesIO")
+    def test_no_pool(                                   # pylint:disable=R0913
+            self, mock_io, mock_inter, mock_pages, mock_range):
+
+        """Function:  test_no_pool
+
+        Description:  Test with no process pool set up.
+
+        Arguments:
+
+        """
+
+        mock_io.return_value = self.bytesio
+        mock_inter.return_value = self.interpreter
+        mock_pages.return_value = self.page_list
+
+        self.assertEqual(
+            rmq_metadata.pdf_to_string(
+                self.f_name, self.logger, workers=2, min_pages=1),
+            (True, self.results))
+        self.assertFalse(mock_range.called)
+
 
 if __name__ == "__main__":
     unittest.main()
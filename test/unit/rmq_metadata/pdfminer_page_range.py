@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  pdfminer_page_range.py
+
+    Description:  Unit testing of pdfminer_page_range in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pdfminer_page_range.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_page_range
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pdf_data = b"%PDF-1.4\n"
+        self.pages = [b"Page one ", b"Page two ", b"Page three "]
+
+    @mock.patch("rmq_metadata.PDFPage.create_pages")
+    @mock.patch("rmq_metadata.PDFPageInterpreter")
+    @mock.patch("rmq_metadata.TextConverter")
+    @mock.patch("rmq_metadata.PDFDocument", mock.Mock())
+    def test_page_range(self, mock_conv, mock_interp, mock_pages):
+
+        """Function:  test_page_range
+
+        Description:  Test with only the pages in the range extracted.
+
+        Arguments:
+
+        """
+
+        def process_page(page):
+
+            """Function:  process_page
+
+            Description:  Write the page text to the output string.
+
+            Arguments:
+
+            """
+
+            mock_conv.call_args[0][1].write(page)
+
+        mock_pages.return_value = iter(self.pages)
+        mock_interp.return_value.process_page.side_effect = process_page
+
+        self.assertEqual(
+            rmq_metadata.pdfminer_page_range(
+                None, 1, 3, pdf_data=self.pdf_data),
+            b"Page two Page three ")
+
+
+if __name__ == "__main__":
+    unittest.main()
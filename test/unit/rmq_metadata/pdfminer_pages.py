@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  pdfminer_pages.py
+
+    Description:  Unit testing of pdfminer_pages in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pdfminer_pages.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_password_protected
+        test_pages
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logger = mock.Mock()
+        self.pdf_data = b"%PDF-1.4\n"
+
+    @mock.patch("rmq_metadata.PDFDocument")
+    def test_password_protected(self, mock_doc):
+
+        """Function:  test_password_protected
+
+        Description:  Test with PDF password protected.
+
+        Arguments:
+
+        """
+
+        mock_doc.side_effect = \
+            rmq_metadata.pdfminer.pdfdocument.PDFPasswordIncorrect
+
+        self.assertEqual(
+            list(rmq_metadata.pdfminer_pages(
+                None, self.logger, pdf_data=self.pdf_data)), [])
+
+    @mock.patch("rmq_metadata.PDFPage.create_pages")
+    @mock.patch("rmq_metadata.PDFPageInterpreter")
+    @mock.patch("rmq_metadata.TextConverter")
+    @mock.patch("rmq_metadata.PDFDocument", mock.Mock())
+    def test_pages(self, mock_conv, mock_interp, mock_pages):
+
+        """Function:  test_pages
+
+        Description:  Test with text of each page.
+
+        Arguments:
+
+        """
+
+        def process_page(page):
+
+            """Function:  process_page
+
+            Description:  Write the page text to the output string.
+
+            Arguments:
+
+            """
+
+            mock_conv.call_args[0][1].write(page)
+
+        mock_pages.return_value = ["Page one.", "Page two."]
+        mock_interp.return_value.process_page.side_effect = process_page
+
+        self.assertEqual(
+            list(rmq_metadata.pdfminer_pages(
+                None, self.logger, pdf_data=self.pdf_data)),
+            ["Page one", "Page two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+# Classification (U)
+
+"""Program:  pipeline_fingerprint.py
+
+    Description:  Unit testing of pipeline_fingerprint in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pipeline_fingerprint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.lang_module = "./test/unit/rmq_metadata/testfiles/lang_module"
+        self.stanford_jar = "DIRECTORY_PATH/stanford-ner.jar"
+        self.token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_settings
+        test_token_types
+        test_entity_normalize
+        test_model_replaced
+        test_stream_pages
+        test_textract_codes
+        test_encoding_backend
+        test_encoding_confidence
+        test_encoding_sample_size
+        test_encoding_cache
+        test_ner_server
+        test_ner_batch_docs
+        test_ner_workers
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+        with open(self.cfg.lang_module, "w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("Model")
+
+        self.fingerprint = rmq_metadata.pipeline_fingerprint(self.cfg)
+
+    def test_same_settings(self):
+
+        """Function:  test_same_settings
+
+        Description:  Test with the same settings.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.pipeline_fingerprint(CfgTest()), self.fingerprint)
+
+    def test_token_types(self):
+
+        """Function:  test_token_types
+
+        Description:  Test with different token types.
+
+        Arguments:
+
+        """
+
+        self.cfg.token_types = ["LOCATION"]
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_entity_normalize(self):
+
+        """Function:  test_entity_normalize
+
+        Description:  Test with entity normalization set.
+
+        Arguments:
+
+        """
+
+        self.cfg.entity_normalize = ["casefold"]
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_model_replaced(self):
+
+        """Function:  test_model_replaced
+
+        Description:  Test with the NER model file replaced.
+
+        Arguments:
+
+        """
+
+        with open(self.cfg.lang_module, "w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("New model")
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_stream_pages(self):
+
+        """Function:  test_stream_pages
+
+        Description:  Test with streaming of pages set.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_pages = True
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_textract_codes(self):
+
+        """Function:  test_textract_codes
+
+        Description:  Test with different textract codes.
+
+        Arguments:
+
+        """
+
+        self.cfg.textract_codes = ["utf-8"]
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_encoding_backend(self):
+
+        """Function:  test_encoding_backend
+
+        Description:  Test with a different encoding detector.
+
+        Arguments:
+
+        """
+
+        self.cfg.encoding_backend = "cchardet"
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_encoding_confidence(self):
+
+        """Function:  test_encoding_confidence
+
+        Description:  Test with a different encoding confidence.
+
+        Arguments:
+
+        """
+
+        self.cfg.encoding_confidence = 0.8
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_encoding_sample_size(self):
+
+        """Function:  test_encoding_sample_size
+
+        Description:  Test with a different encoding sample size.
+
+        Arguments:
+
+        """
+
+        self.cfg.encoding_sample_size = 4096
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_encoding_cache(self):
+
+        """Function:  test_encoding_cache
+
+        Description:  Test with the encoding cache turned on.
+
+        Arguments:
+
+        """
+
+        self.cfg.encoding_cache = True
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_ner_server(self):
+
+        """Function:  test_ner_server
+
+        Description:  Test with the NER server set.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_server = True
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_ner_batch_docs(self):
+
+        """Function:  test_ner_batch_docs
+
+        Description:  Test with NER batching set.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_batch_docs = 8
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def test_ner_workers(self):
+
+        """Function:  test_ner_workers
+
+        Description:  Test with parallel NER workers set.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_workers = 4
+
+        self.assertNotEqual(
+            rmq_metadata.pipeline_fingerprint(self.cfg), self.fingerprint)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.cfg.lang_module):
+            os.remove(self.cfg.lang_module)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  pipeline_stats.py
+
+    Description:  Unit testing of PipelineStats class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/pipeline_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_record
+        test_window
+        test_percentiles
+        test_no_messages
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = rmq_metadata.PipelineStats(window=100)
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test with the stages and total recorded.
+
+        Arguments:
+
+        """
+
+        self.stats.record({"total": 2.0, "stages": {"decode": 0.5},
+                           "counts": {}})
+
+        self.assertEqual(self.stats.messages, 1)
+        self.assertEqual(sorted(self.stats.stages), ["decode", "total"])
+
+    def test_window(self):
+
+        """Function:  test_window
+
+        Description:  Test with only the most recent messages kept.
+
+        Arguments:
+
+        """
+
+        stats = rmq_metadata.PipelineStats(window=2)
+
+        for seconds in [1.0, 2.0, 3.0]:
+            stats.record({"total": seconds, "stages": {}, "counts": {}})
+
+        self.assertEqual(list(stats.stages["total"]), [2.0, 3.0])
+        self.assertEqual(stats.messages, 3)
+
+    def test_percentiles(self):
+
+        """Function:  test_percentiles
+
+        Description:  Test with nearest-rank percentiles of a stage.
+
+        Arguments:
+
+        """
+
+        for seconds in range(1, 101):
+            self.stats.record(
+                {"total": seconds, "stages": {"ner": seconds / 10},
+                 "counts": {}})
+
+        data = self.stats.percentiles()
+
+        self.assertEqual(
+            data["total"], {"count": 100, "p50": 50, "p90": 90, "p99": 99})
+        self.assertEqual(data["ner"]["p90"], 9.0)
+
+    def test_no_messages(self):
+
+        """Function:  test_no_messages
+
+        Description:  Test with no messages recorded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.stats.percentiles(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  process_conflict.py
+
+    Description:  Unit testing of process_conflict in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/process_conflict.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_original_in_mongo
+        test_original_in_index
+        test_original_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.queue = {"directory": "/dir/path", "dedup": "link"}
+        self.cfg = mock.Mock()
+        self.f_name = "/tmp/path/Filename.pdf"
+        self.logger = mock.Mock()
+        self.timer = rmq_metadata.StageTimer()
+        self.digest = "ab" * 32
+
+    @mock.patch("rmq_metadata.process_duplicate")
+    def test_original_in_mongo(self, mock_dup):
+
+        """Function:  test_original_in_mongo
+
+        Description:  Test with the original file inserted by another daemon
+            and read from Mongo, with a miss in the content index.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink.find_file_name.return_value = "Original.pdf"
+        self.cfg.content_index.lookup.return_value = None
+        mock_dup.return_value = True
+
+        self.assertTrue(rmq_metadata.process_conflict(
+            self.queue, self.cfg, self.f_name, self.logger, self.digest,
+            self.timer))
+        self.cfg.mongo_sink.find_file_name.assert_called_once_with(
+            self.digest)
+        mock_dup.assert_called_once_with(
+            self.queue, self.cfg, self.f_name, self.logger, self.digest,
+            "Original.pdf", self.timer)
+
+    @mock.patch("rmq_metadata.process_duplicate")
+    def test_original_in_index(self, mock_dup):
+
+        """Function:  test_original_in_index
+
+        Description:  Test with the original file not found in Mongo and read
+            from the content index.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink.find_file_name.return_value = None
+        self.cfg.content_index.lookup.return_value = "Original.pdf"
+        mock_dup.return_value = True
+
+        self.assertTrue(rmq_metadata.process_conflict(
+            self.queue, self.cfg, self.f_name, self.logger, self.digest,
+            self.timer))
+        self.assertEqual(mock_dup.call_args[0][5], "Original.pdf")
+
+    @mock.patch("rmq_metadata.process_duplicate")
+    def test_original_not_found(self, mock_dup):
+
+        """Function:  test_original_not_found
+
+        Description:  Test with the original file not found in Mongo or the
+            content index.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink.find_file_name.return_value = None
+        self.cfg.content_index.lookup.return_value = None
+        mock_dup.return_value = False
+
+        self.assertFalse(rmq_metadata.process_conflict(
+            self.queue, self.cfg, self.f_name, self.logger, self.digest,
+            self.timer))
+        self.assertIsNone(mock_dup.call_args[0][5])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  process_duplicate.py
+
+    Description:  Unit testing of process_duplicate in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/process_duplicate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.content_index = rmq_metadata.ContentIndex(
+            "content_index.db", mock.Mock())
+        self.mongo_sink = rmq_metadata.MemorySink()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        process
+        test_skip
+        test_link
+        test_link_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.queue = {"directory": "/dir/path", "dedup": "skip"}
+        self.f_name = "/tmp/path/File2.pdf"
+        self.digest = "ab" * 32
+        self.timer = rmq_metadata.StageTimer()
+
+    def process(self):
+
+        """Function:  process
+
+        Description:  Call process_duplicate with the test settings.
+
+        Arguments:
+
+        """
+
+        return rmq_metadata.process_duplicate(
+            self.queue, self.cfg, self.f_name, self.logger, self.digest,
+            "File1.pdf", self.timer)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    @mock.patch("rmq_metadata.os.remove")
+    def test_skip(self, mock_remove, mock_mv):
+
+        """Function:  test_skip
+
+        Description:  Test with duplicate PDF file removed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.process())
+        mock_remove.assert_called_once_with(self.f_name)
+        self.assertFalse(mock_mv.called)
+        self.assertEqual(self.cfg.mongo_sink.docs, [])
+        self.assertEqual(self.cfg.content_index.hits["skip"], 1)
+        self.assertEqual(self.timer.counts["dedup_hits"], 1)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    @mock.patch("rmq_metadata.os.remove")
+    def test_link(self, mock_remove, mock_mv):
+
+        """Function:  test_link
+
+        Description:  Test with a document referencing the existing metadata.
+
+        Arguments:
+
+        """
+
+        self.queue["dedup"] = "link"
+
+        self.assertTrue(self.process())
+        doc = self.cfg.mongo_sink.docs[0]
+        self.assertEqual(
+            (doc["FileName"], doc["DuplicateOf"], doc["OriginalFileName"]),
+            ("File2.pdf", self.digest, "File1.pdf"))
+        mock_mv.assert_called_once_with(self.f_name, "/dir/path", "File2.pdf")
+        self.assertFalse(mock_remove.called)
+        self.assertEqual(self.cfg.content_index.hits["link"], 1)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    def test_link_failed(self, mock_mv):
+
+        """Function:  test_link_failed
+
+        Description:  Test with failed insert of the reference document.
+
+        Arguments:
+
+        """
+
+        self.queue["dedup"] = "link"
+        self.cfg.mongo_sink = mock.Mock()
+        self.cfg.mongo_sink.insert.return_value = (False, "Connection refused")
+
+        self.assertFalse(self.process())
+        self.assertFalse(mock_mv.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
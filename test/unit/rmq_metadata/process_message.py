@@ -176,6 +176,18 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_single_pass_fails
+        test_single_pass
+        test_extract_workers
+        test_pdf_data
+        test_stage_timings
+        test_mongo_sink
+        test_write_buffer
+        test_content_hash
+        test_content_conflict
+        test_cache_hit
+        test_cache_miss
+        test_cache_partial
         test_mongo_failed
         test_mongo_successful
         test_all_extract_fails
@@ -206,6 +218,194 @@ class UnitTest(unittest.TestCase):
         self.f_name = "/working/path/Filename.pdf"
         self.final_data = ["List", "of", "a", "data"]
 
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    @mock.patch("rmq_metadata.get_union_data")
+    def test_single_pass_fails(self, mock_union, mock_pypdf2):
+
+        """Function:  test_single_pass_fails
+
+        Description:  Test with single NER pass and all extractions fail.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_single_pass = True
+        mock_union.return_value = (False, [])
+
+        self.assertFalse(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger))
+        self.assertFalse(mock_pypdf2.called)
+
+    @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    @mock.patch("rmq_metadata.get_union_data")
+    def test_single_pass(self, mock_union, mock_pypdf2):
+
+        """Function:  test_single_pass
+
+        Description:  Test with single NER pass over all extractions.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_single_pass = True
+        mock_union.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger))
+        self.assertFalse(mock_pypdf2.called)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.create_metadata")
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_extract_workers(self, mock_pypdf2, mock_textract, mock_pdfminer,
+                             mock_create):
+
+        """Function:  test_extract_workers
+
+        Description:  Test with extractions run in a thread pool.
+
+        Arguments:
+
+        """
+
+        self.cfg.extract_workers = 3
+        mock_pypdf2.return_value = (True, ["pypdf2"])
+        mock_textract.return_value = (False, [])
+        mock_pdfminer.return_value = (True, ["pdfminer"])
+        mock_create.return_value = {}
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger))
+        self.assertEqual(
+            [item[0][1] for item in mock_create.call_args_list],
+            [["pypdf2"], ["pdfminer"]])
+
+    @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_pdf_data(self, mock_pypdf2, mock_textract, mock_pdfminer):
+
+        """Function:  test_pdf_data
+
+        Description:  Test with PDF file contents passed in memory.
+
+        Arguments:
+
+        """
+
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            pdf_data=b"%PDF"))
+        self.assertEqual(mock_pypdf2.call_args[1]["pdf_data"], b"%PDF")
+        self.assertEqual(mock_pdfminer.call_args[1]["pdf_data"], b"%PDF")
+        self.assertNotIn("pdf_data", mock_textract.call_args[1])
+
+    @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_stage_timings(self, mock_pypdf2, mock_textract, mock_pdfminer):
+
+        """Function:  test_stage_timings
+
+        Description:  Test with the stages timed on the message timer.
+
+        Arguments:
+
+        """
+
+        timer = rmq_metadata.StageTimer()
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            timer=timer))
+        self.assertIs(mock_textract.call_args[1]["timer"], timer)
+        self.assertEqual(
+            sorted(timer.stages), ["metadata", "mongo", "move"])
+
+    @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.mongo_libs.ins_doc")
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_mongo_sink(self, mock_pypdf2, mock_textract, mock_pdfminer,
+                        mock_ins):
+
+        """Function:  test_mongo_sink
+
+        Description:  Test with metadata inserted into the Mongo sink.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger))
+        self.assertEqual(self.cfg.mongo_sink.docs, ["data"])
+        self.assertFalse(mock_ins.called)
+
+    @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_write_buffer(self, mock_pypdf2, mock_textract, mock_pdfminer,
+                          mock_mv):
+
+        """Function:  test_write_buffer
+
+        Description:  Test with metadata added to the write buffer.
+
+        Arguments:
+
+        """
+
+        on_done = mock.Mock()
+        self.cfg.write_buffer = mock.Mock()
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertIsNone(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            on_done=on_done))
+        self.assertEqual(
+            self.cfg.write_buffer.add.call_args[0][0], "data")
+        self.assertFalse(mock_mv.called)
+        self.cfg.write_buffer.add.call_args[0][1](True, None)
+        on_done.assert_called_once_with(True)
+        self.assertTrue(mock_mv.called)
+
     @mock.patch("rmq_metadata.create_metadata", mock.Mock(return_value="data"))
     @mock.patch("rmq_metadata.mongo_libs.ins_doc",
                 mock.Mock(return_value=(False, "Connection Error")))
@@ -449,6 +649,178 @@ class UnitTest(unittest.TestCase):
         self.assertTrue(rmq_metadata.process_message(
             self.cfg.queue_list[0], self.cfg, self.f_name, self.logger))
 
+    @mock.patch("rmq_metadata.create_metadata",
+                mock.Mock(side_effect=lambda metadata, *args: metadata))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_content_hash(self, mock_pypdf2, mock_textract, mock_pdfminer):
+
+        """Function:  test_content_hash
+
+        Description:  Test with hash added to the content index after the
+            insert.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        self.cfg.content_index = mock.Mock()
+        self.cfg.queue_list[0]["dedup"] = "skip"
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            content_hash="ab" * 32))
+        self.assertEqual(
+            self.cfg.mongo_sink.docs[0]["ContentHash"], "ab" * 32)
+        self.cfg.content_index.add.assert_called_once_with(
+            "ab" * 32, "Filename.pdf")
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_cache_hit(self, mock_pypdf2, mock_textract, mock_pdfminer):
+
+        """Function:  test_cache_hit
+
+        Description:  Test with entities taken from the result cache.
+
+        Arguments:
+
+        """
+
+        timer = rmq_metadata.StageTimer()
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        self.cfg.result_cache = mock.Mock()
+        self.cfg.result_cache.get.return_value = {"LOCATION": ["London"]}
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            timer=timer, content_hash="ab" * 32))
+        self.assertFalse(mock_pypdf2.called)
+        self.assertFalse(mock_textract.called)
+        self.assertFalse(mock_pdfminer.called)
+        self.assertEqual(
+            self.cfg.mongo_sink.docs[0]["LOCATION"], ["London"])
+        self.assertFalse(self.cfg.result_cache.put.called)
+        self.assertEqual(timer.counts["cache_hits"], 1)
+
+    @mock.patch("rmq_metadata.create_metadata")
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_cache_miss(self, mock_pypdf2, mock_textract, mock_pdfminer,
+                        mock_create):
+
+        """Function:  test_cache_miss
+
+        Description:  Test with extracted entities added to the result cache.
+
+        Arguments:
+
+        """
+
+        def create(metadata, *args):
+
+            """Function:  create
+
+            Description:  Add an entity to the metadata.
+
+            Arguments:
+
+            """
+
+            metadata["LOCATION"] = ["London"]
+
+            return metadata
+
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        self.cfg.result_cache = mock.Mock()
+        self.cfg.result_cache.get.return_value = None
+        mock_create.side_effect = create
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            content_hash="ab" * 32))
+        self.cfg.result_cache.put.assert_called_once_with(
+            self.cfg.result_cache.key.return_value, {"LOCATION": ["London"]})
+
+    @mock.patch("rmq_metadata.create_metadata",
+                mock.Mock(side_effect=lambda metadata, *args: metadata))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_cache_partial(self, mock_pypdf2, mock_textract, mock_pdfminer):
+
+        """Function:  test_cache_partial
+
+        Description:  Test with entities of a partly failed extraction not
+            added to the result cache.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = rmq_metadata.MemorySink()
+        self.cfg.result_cache = mock.Mock()
+        self.cfg.result_cache.get.return_value = None
+        timer = rmq_metadata.StageTimer()
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (False, [])
+        mock_pdfminer.return_value = (True, self.final_data)
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, self.logger,
+            timer=timer, content_hash="ab" * 32))
+        self.assertFalse(self.cfg.result_cache.put.called)
+        self.assertEqual(timer.counts["extract_failed"], 1)
+
+    @mock.patch("rmq_metadata.process_conflict")
+    @mock.patch("rmq_metadata.create_metadata",
+                mock.Mock(side_effect=lambda metadata, *args: metadata))
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    @mock.patch("rmq_metadata.get_pdfminer_data")
+    @mock.patch("rmq_metadata.get_textract_data")
+    @mock.patch("rmq_metadata.get_pypdf2_data")
+    def test_content_conflict(                          # pylint:disable=R0913
+            self, mock_pypdf2, mock_textract, mock_pdfminer, mock_mv,
+            mock_conflict):
+
+        """Function:  test_content_conflict
+
+        Description:  Test with the content inserted by another daemon.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = mock.Mock()
+        self.cfg.mongo_sink.insert.return_value = (None, "Duplicate key")
+        self.cfg.content_index = mock.Mock()
+        self.cfg.queue_list[0]["dedup"] = "link"
+        mock_pypdf2.return_value = (True, self.final_data)
+        mock_textract.return_value = (True, self.final_data)
+        mock_pdfminer.return_value = (True, self.final_data)
+        mock_conflict.return_value = True
+
+        self.assertTrue(rmq_metadata.process_message(
+            self.cfg.queue_list[0], self.cfg, self.f_name, mock.Mock(),
+            content_hash="ab" * 32))
+        self.assertEqual(mock_conflict.call_args[0][4], "ab" * 32)
+        self.assertFalse(self.cfg.content_index.add.called)
+        self.assertFalse(mock_mv.called)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -177,7 +177,9 @@ class UnitTest(unittest.TestCase):
         test_archive_body
         test_queue_found
         test_queue_not_found
+        test_queue_not_found_done
         test_no_queue_list
+        test_route_index
 
     """
 
@@ -301,6 +303,25 @@ class UnitTest(unittest.TestCase):
             rmq_metadata.process_msg(
                 self.rmq, self.logger, self.cfg, self.method, self.body))
 
+    @mock.patch("rmq_metadata.non_proc_msg", mock.Mock(return_value=True))
+    def test_queue_not_found_done(self):
+
+        """Function:  test_queue_not_found_done
+
+        Description:  Test with message finished when no queue is found.
+
+        Arguments:
+
+        """
+
+        done = mock.Mock()
+        self.cfg.queue_list[0]["routing_key"] = "NotMyKey"
+        rmq_metadata.process_msg(
+            self.rmq, self.logger, self.cfg, self.method, self.body,
+            done=done)
+
+        done.assert_called_once_with()
+
     @mock.patch("rmq_metadata.non_proc_msg", mock.Mock(return_value=True))
     def test_no_queue_list(self):
 
@@ -318,6 +339,29 @@ class UnitTest(unittest.TestCase):
             rmq_metadata.process_msg(
                 self.rmq, self.logger, self.cfg, self.method, self.body))
 
+    @mock.patch("rmq_metadata.gen_libs.write_file")
+    @mock.patch("rmq_metadata.convert_data")
+    def test_route_index(self, mock_convert, mock_write):
+
+        """Function:  test_route_index
+
+        Description:  Test with queue found through the routing key index.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list[0]["archive"] = True
+        rmq_metadata.validate_routes(self.cfg, True, "")
+        rmq_metadata.process_msg(
+            self.rmq, self.logger, self.cfg, self.method, self.body)
+
+        self.assertIs(mock_convert.call_args[0][3], self.cfg.queue_list[0])
+        self.assertIs(mock_convert.call_args[1]["route"],
+                      self.cfg.route_index["MY_ROUTING_KEY"])
+        self.assertTrue(mock_write.call_args[0][0].startswith(
+            "/dir/archive_path/rmq_metadata_unit_test_MY_ROUTING_KEY_"))
+
 
 if __name__ == "__main__":
     unittest.main()
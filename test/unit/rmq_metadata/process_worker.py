@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  process_worker.py
+
+    Description:  Unit testing of process_worker in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/process_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MethodTest():                                     # pylint:disable=R0903
+
+    """Class:  MethodTest
+
+    Description:  Class which is a representation of a method module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.routing_key = "ROUTING_KEY"
+        self.delivery_tag = 7
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_process_failed
+        test_save_failed
+        test_process_successful
+        test_tracker_done
+        test_tracker_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rmq = mock.MagicMock()
+        self.method = MethodTest()
+        self.body = "ThekljdsfkjsfdJVBERi0xLjQKJeLjz9MKMTAgMCBvYmoKPDwKL0EgP"
+        self.cfg = "Cfg"
+
+    @mock.patch("rmq_metadata.non_proc_msg")
+    @mock.patch("rmq_metadata.process_msg")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_process_failed(self, mock_log, mock_process, mock_non):
+
+        """Function:  test_process_failed
+
+        Description:  Test with unexpected error processing the message.
+
+        Arguments:
+
+        """
+
+        mock_process.side_effect = ValueError("Unexpected error")
+        rmq_metadata.process_worker(
+            self.rmq, mock_log, self.cfg, self.method, self.body)
+        ack = self.rmq.connection.add_callback_threadsafe.call_args[0][0]
+        ack()
+
+        self.assertTrue(mock_non.called)
+        self.assertEqual(mock_non.call_args[0][3], self.body)
+        self.rmq.ack.assert_called_once_with(7)
+
+    @mock.patch("rmq_metadata.non_proc_msg")
+    @mock.patch("rmq_metadata.process_msg")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_save_failed(self, mock_log, mock_process, mock_non):
+
+        """Function:  test_save_failed
+
+        Description:  Test with the failed message not able to be saved.
+
+        Arguments:
+
+        """
+
+        mock_process.side_effect = ValueError("Unexpected error")
+        mock_non.side_effect = OSError("No space left on device")
+        rmq_metadata.process_worker(
+            self.rmq, mock_log, self.cfg, self.method, self.body)
+        ack = self.rmq.connection.add_callback_threadsafe.call_args[0][0]
+        ack()
+
+        self.rmq.ack.assert_called_once_with(7)
+
+    @mock.patch("rmq_metadata.process_msg", mock.Mock(return_value=None))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_process_successful(self, mock_log):
+
+        """Function:  test_process_successful
+
+        Description:  Test with ack passed back to the connection thread.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.process_worker(
+            self.rmq, mock_log, self.cfg, self.method, self.body)
+        ack = self.rmq.connection.add_callback_threadsafe.call_args[0][0]
+        ack()
+
+        self.rmq.ack.assert_called_once_with(7)
+
+    @mock.patch("rmq_metadata.process_msg")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_tracker_done(self, mock_log, mock_process):
+
+        """Function:  test_tracker_done
+
+        Description:  Test with message acknowledged through the tracker.
+
+        Arguments:
+
+        """
+
+        tracker = mock.Mock()
+        rmq_metadata.process_worker(
+            self.rmq, mock_log, self.cfg, self.method, self.body,
+            tracker=tracker)
+        mock_process.call_args[1]["done"]()
+
+        tracker.done.assert_called_once_with(7)
+        self.assertFalse(self.rmq.connection.add_callback_threadsafe.called)
+
+    @mock.patch("rmq_metadata.non_proc_msg")
+    @mock.patch("rmq_metadata.process_msg")
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_tracker_failed(self, mock_log, mock_process, mock_non):
+
+        """Function:  test_tracker_failed
+
+        Description:  Test with failed message saved and acknowledged
+            through the tracker.
+
+        Arguments:
+
+        """
+
+        tracker = mock.Mock()
+        mock_process.side_effect = ValueError("Unexpected error")
+        rmq_metadata.process_worker(
+            self.rmq, mock_log, self.cfg, self.method, self.body,
+            tracker=tracker)
+
+        self.assertTrue(mock_non.called)
+        tracker.done.assert_called_once_with(7)
+        self.assertFalse(self.rmq.connection.add_callback_threadsafe.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -91,6 +91,7 @@ class PageExtract():                                    # pylint:disable=R0903
 
     Methods:
         __init__
+        extract_text
 
     """
 
@@ -106,9 +107,9 @@ class PageExtract():                                    # pylint:disable=R0903
 
         self.body = 'Intheseunprecedentedtimeswewanttomakesurewecankeep'
 
-    def extractText(self):                              # pylint:disable=C0103
+    def extract_text(self):
 
-        """Method:  extractText
+        """Method:  extract_text
 
         Description:  Extract data from page.
 
@@ -123,11 +124,10 @@ class PyPDF2():                                         # pylint:disable=R0903
 
     """Class:  PyPDF2
 
-    Description:  Class which is a representation of PyPDF2 class.
+    Description:  Class which is a representation of PyPDF2.PdfReader class.
 
     Methods:
         __init__
-        getPage
 
     """
 
@@ -142,23 +142,8 @@ class PyPDF2():                                         # pylint:disable=R0903
         """
 
         self.fname = fname
-        self.numPages = 1                               # pylint:disable=C0103
-        self.pagenum = None
-        self.isEncrypted = False                        # pylint:disable=C0103
-
-    def getPage(self, pagenum):                         # pylint:disable=C0103
-
-        """Method:  getPage
-
-        Description:  Data from page number passed.
-
-        Arguments:
-
-        """
-
-        self.pagenum = pagenum
-
-        return PageExtract()
+        self.pages = [PageExtract()]
+        self.is_encrypted = False
 
 
 class UnitTest(unittest.TestCase):
@@ -169,6 +154,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_multiple_pages
         test_is_encrypted
         test_not_encrypted
         test_read_pdf
@@ -192,7 +178,25 @@ class UnitTest(unittest.TestCase):
         self.pdfr = PyPDF2(self.filename)
         self.body = "Intheseunprecedentedtimeswewanttomakesurewecankeep"
 
-    @mock.patch("rmq_metadata.PyPDF2.PdfFileReader")
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
+    def test_multiple_pages(self, mock_pypdf):
+
+        """Function:  test_multiple_pages
+
+        Description:  Test with text from multiple pages.
+
+        Arguments:
+
+        """
+
+        self.pdfr.pages = [PageExtract(), PageExtract()]
+
+        mock_pypdf.return_value = self.pdfr
+
+        self.assertEqual(rmq_metadata.read_pdf(self.filename, self.logger),
+                         (True, self.body + self.body))
+
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
     def test_is_encrypted(self, mock_pypdf):
 
         """Function:  test_is_encrypted
@@ -203,14 +207,14 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.pdfr.isEncrypted = True
+        self.pdfr.is_encrypted = True
 
         mock_pypdf.return_value = self.pdfr
 
         self.assertEqual(rmq_metadata.read_pdf(self.filename, self.logger),
                          (False, ""))
 
-    @mock.patch("rmq_metadata.PyPDF2.PdfFileReader")
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
     def test_not_encrypted(self, mock_pypdf):
 
         """Function:  test_not_encrypted
@@ -226,7 +230,7 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(rmq_metadata.read_pdf(self.filename, self.logger),
                          (True, self.body))
 
-    @mock.patch("rmq_metadata.PyPDF2.PdfFileReader")
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
     def test_read_pdf(self, mock_pypdf):
 
         """Function:  test_read_pdf
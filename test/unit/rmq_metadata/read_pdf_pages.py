@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  read_pdf_pages.py
+
+    Description:  Unit testing of read_pdf_pages in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/read_pdf_pages.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_is_encrypted
+        test_pages
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logger = mock.Mock()
+        self.pdf_data = b"%PDF-1.4\n"
+        self.pdfreader = mock.Mock()
+        self.pdfreader.is_encrypted = False
+        self.pdfreader.pages = [mock.Mock(), mock.Mock()]
+        self.pdfreader.pages[0].extract_text.return_value = "Page one"
+        self.pdfreader.pages[1].extract_text.return_value = "Page two"
+
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
+    def test_is_encrypted(self, mock_pypdf):
+
+        """Function:  test_is_encrypted
+
+        Description:  Test with PDF encrypted.
+
+        Arguments:
+
+        """
+
+        self.pdfreader.is_encrypted = True
+        mock_pypdf.return_value = self.pdfreader
+
+        self.assertEqual(
+            list(rmq_metadata.read_pdf_pages(
+                None, self.logger, pdf_data=self.pdf_data)), [])
+
+    @mock.patch("rmq_metadata.PyPDF2.PdfReader")
+    def test_pages(self, mock_pypdf):
+
+        """Function:  test_pages
+
+        Description:  Test with text of each page.
+
+        Arguments:
+
+        """
+
+        mock_pypdf.return_value = self.pdfreader
+
+        self.assertEqual(
+            list(rmq_metadata.read_pdf_pages(
+                None, self.logger, pdf_data=self.pdf_data)),
+            ["Page one", "Page two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  recode_text.py
+
+    Description:  Unit testing of recode_text in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/recode_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_str_text
+        test_ascii
+        test_latin1
+        test_utf8
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.text = "Café in Zürich"
+
+    def test_str_text(self):
+
+        """Function:  test_str_text
+
+        Description:  Test with text already decoded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.recode_text(self.text, "iso-8859-1"),
+            self.text.encode("iso-8859-1"))
+
+    def test_ascii(self):
+
+        """Function:  test_ascii
+
+        Description:  Test with characters not in the encoding dropped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.recode_text(self.text.encode("utf-8"), "ascii"),
+            b"Caf in Zrich")
+
+    def test_latin1(self):
+
+        """Function:  test_latin1
+
+        Description:  Test with text encoded as iso-8859-1.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.recode_text(self.text.encode("utf-8"), "iso-8859-1"),
+            self.text.encode("iso-8859-1"))
+
+    def test_utf8(self):
+
+        """Function:  test_utf8
+
+        Description:  Test with text already in utf-8.
+
+        Arguments:
+
+        """
+
+        data = self.text.encode("utf-8")
+
+        self.assertIs(rmq_metadata.recode_text(data, "UTF8"), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+# Classification (U)
+
+"""Program:  result_cache.py
+
+    Description:  Unit testing of ResultCache class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/result_cache.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_open_failed
+        test_key
+        test_miss
+        test_hit
+        test_fingerprint_changed
+        test_evict_least_recent
+        test_too_large
+        test_replace
+        test_reopen
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = "./test/unit/rmq_metadata/testfiles"
+        self.path = os.path.join(self.tmpdir, "result_cache.db")
+        self.logger = mock.Mock()
+        self.entities = {"LOCATION": ["London"], "PERSON": ["Smith"]}
+        self.cache = rmq_metadata.ResultCache(
+            self.path, 1000, "fingerprint", self.logger)
+        self.cache.open()
+
+    def test_open_failed(self):
+
+        """Function:  test_open_failed
+
+        Description:  Test with a database which cannot be created.
+
+        Arguments:
+
+        """
+
+        cache = rmq_metadata.ResultCache(
+            os.path.join(self.tmpdir, "no_dir", "cache.db"), 1000,
+            "fingerprint", self.logger)
+
+        self.assertFalse(cache.open()[0])
+        self.assertIsNone(cache.get("key"))
+
+    def test_key(self):
+
+        """Function:  test_key
+
+        Description:  Test with key made of the hash and fingerprint.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.cache.key("abcd"), "abcd:fingerprint")
+
+    def test_miss(self):
+
+        """Function:  test_miss
+
+        Description:  Test with an entry not in the cache.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_hit(self):
+
+        """Function:  test_hit
+
+        Description:  Test with an entry in the cache.
+
+        Arguments:
+
+        """
+
+        self.cache.put("key", self.entities)
+
+        self.assertEqual(self.cache.get("key"), self.entities)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 0))
+
+    def test_fingerprint_changed(self):
+
+        """Function:  test_fingerprint_changed
+
+        Description:  Test with entry cached by another pipeline version.
+
+        Arguments:
+
+        """
+
+        self.cache.put(self.cache.key("abcd"), self.entities)
+        cache = rmq_metadata.ResultCache(
+            self.path, 1000, "new_fingerprint", self.logger)
+        cache.open()
+
+        self.assertIsNone(cache.get(cache.key("abcd")))
+        cache.close()
+
+    @mock.patch("rmq_metadata.time.time")
+    def test_evict_least_recent(self, mock_time):
+
+        """Function:  test_evict_least_recent
+
+        Description:  Test with least recently used entry evicted.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        self.cache.max_bytes = 130
+        self.cache.put("key1", self.entities)
+        self.cache.put("key2", self.entities)
+        self.cache.get("key1")
+        self.cache.put("key3", self.entities)
+
+        self.assertIsNone(self.cache.get("key2"))
+        self.assertEqual(self.cache.get("key1"), self.entities)
+        self.assertEqual(self.cache.get("key3"), self.entities)
+        self.assertLessEqual(self.cache.total, 130)
+
+    def test_too_large(self):
+
+        """Function:  test_too_large
+
+        Description:  Test with an entry larger than the cache.
+
+        Arguments:
+
+        """
+
+        self.cache.max_bytes = 10
+        self.cache.put("key", self.entities)
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(self.cache.total, 0)
+
+    def test_replace(self):
+
+        """Function:  test_replace
+
+        Description:  Test with an entry cached twice.
+
+        Arguments:
+
+        """
+
+        self.cache.put("key", self.entities)
+        self.cache.put("key", {"LOCATION": ["Paris"]})
+
+        self.assertEqual(self.cache.get("key"), {"LOCATION": ["Paris"]})
+        self.assertEqual(
+            self.cache.total, len('{"LOCATION": ["Paris"]}'))
+
+    def test_reopen(self):
+
+        """Function:  test_reopen
+
+        Description:  Test with the cache kept across a restart.
+
+        Arguments:
+
+        """
+
+        self.cache.put("key", self.entities)
+        total = self.cache.total
+        self.cache.close()
+        cache = rmq_metadata.ResultCache(
+            self.path, 1000, "fingerprint", self.logger)
+        cache.open()
+
+        self.assertEqual(cache.total, total)
+        self.assertEqual(cache.get("key"), self.entities)
+        cache.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.cache.close()
+
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
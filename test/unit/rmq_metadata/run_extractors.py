@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  run_extractors.py
+
+    Description:  Unit testing of run_extractors in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/run_extractors.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def extract_slow(f_name, log):
+
+    """Function Stub:  extract_slow
+
+    Description:  Extraction stub which finishes last.
+
+    Arguments:
+
+    """
+
+    time.sleep(0.05)
+
+    return True, f"slow:{f_name}:{log}"
+
+
+def extract_fast(f_name, log):
+
+    """Function Stub:  extract_fast
+
+    Description:  Extraction stub which finishes first.
+
+    Arguments:
+
+    """
+
+    return False, f"fast:{f_name}:{log}"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_extractors
+        test_concurrent
+        test_sequential
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ("FileName.pdf", "Log")
+        self.results = [(True, "slow:FileName.pdf:Log"),
+                        (False, "fast:FileName.pdf:Log")]
+
+    def test_no_extractors(self):
+
+        """Function:  test_no_extractors
+
+        Description:  Test with no extraction functions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.run_extractors([], self.args, 3), [])
+
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test with results kept in list order in a thread pool.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.run_extractors(
+                [extract_slow, extract_fast], self.args, 2), self.results)
+
+    def test_sequential(self):
+
+        """Function:  test_sequential
+
+        Description:  Test with extractions run one after another.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.run_extractors(
+                [extract_slow, extract_fast], self.args), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
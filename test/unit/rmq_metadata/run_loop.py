@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  run_loop.py
+
+    Description:  Unit testing of run_loop in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/run_loop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_loop_stopped
+        test_loop_interrupted
+        test_no_workers
+        test_connection_closed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.calls = mock.Mock()
+        self.rmq = self.calls.rmq
+        self.rmq.connection.is_open = True
+        self.executor = self.calls.executor
+        self.buffer = self.calls.buffer
+        self.logger = mock.Mock()
+
+    def test_loop_stopped(self):
+
+        """Function:  test_loop_stopped
+
+        Description:  Test with the buffer flushed and the acks sent before
+            the connection is closed.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.run_loop(
+            self.rmq, self.logger, self.executor, self.buffer)
+
+        self.assertEqual(
+            [call[0] for call in self.calls.mock_calls],
+            ["rmq.channel.start_consuming", "executor.shutdown",
+             "buffer.stop", "rmq.connection.process_data_events",
+             "rmq.drop_connection"])
+
+    def test_loop_interrupted(self):
+
+        """Function:  test_loop_interrupted
+
+        Description:  Test with the loop interrupted by a CTRL-C.
+
+        Arguments:
+
+        """
+
+        self.rmq.channel.start_consuming.side_effect = KeyboardInterrupt
+        rmq_metadata.run_loop(
+            self.rmq, self.logger, self.executor, self.buffer)
+
+        self.rmq.channel.stop_consuming.assert_called_once_with()
+        self.buffer.stop.assert_called_once_with()
+        self.rmq.connection.process_data_events.assert_called_once_with(
+            time_limit=0)
+
+    def test_no_workers(self):
+
+        """Function:  test_no_workers
+
+        Description:  Test with only the write buffer.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.run_loop(self.rmq, self.logger, None, self.buffer)
+
+        self.buffer.stop.assert_called_once_with()
+        self.assertFalse(self.executor.shutdown.called)
+        self.rmq.drop_connection.assert_called_once_with()
+
+    def test_connection_closed(self):
+
+        """Function:  test_connection_closed
+
+        Description:  Test with the connection already closed.
+
+        Arguments:
+
+        """
+
+        self.rmq.connection.is_open = False
+        rmq_metadata.run_loop(self.rmq, self.logger, self.executor)
+
+        self.assertFalse(self.rmq.connection.process_data_events.called)
+        self.rmq.drop_connection.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
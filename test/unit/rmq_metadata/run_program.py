@@ -224,6 +224,9 @@ class UnitTest(unittest.TestCase):
         test_status_false
         test_status_true
         test_func_call
+        test_mongo_sink_closed
+        test_pdfminer_pool_shutdown
+        test_ner_tagger_stop
         test_raise_exception
         tearDown
 
@@ -251,11 +254,13 @@ class UnitTest(unittest.TestCase):
         self.proglock = ProgramLock(["cmdline"], "FlavorID")
         self.func_names = {"-M": monitor_queue}
 
+    @mock.patch("rmq_metadata.setup_pipeline")
     @mock.patch("rmq_metadata.monitor_queue")
     @mock.patch("rmq_metadata.validate_create_settings")
     @mock.patch("rmq_metadata.gen_libs.load_module")
     @mock.patch("rmq_metadata.gen_class")
-    def test_flavor_id2(self, mock_class, mock_load, mock_valid, mock_func):
+    def test_flavor_id2(                            # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
 
         """Function:  test_flavor_id2
 
@@ -271,14 +276,17 @@ class UnitTest(unittest.TestCase):
         mock_class.Logger.log_close.return_value = True
         mock_class.ProgramLock.return_value = self.proglock
         mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
 
         self.assertFalse(rmq_metadata.run_program(self.args2, self.func_names))
 
+    @mock.patch("rmq_metadata.setup_pipeline")
     @mock.patch("rmq_metadata.monitor_queue")
     @mock.patch("rmq_metadata.validate_create_settings")
     @mock.patch("rmq_metadata.gen_libs.load_module")
     @mock.patch("rmq_metadata.gen_class")
-    def test_flavor_id(self, mock_class, mock_load, mock_valid, mock_func):
+    def test_flavor_id(                            # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
 
         """Function:  test_flavor_id
 
@@ -294,6 +302,7 @@ class UnitTest(unittest.TestCase):
         mock_class.Logger.log_close.return_value = True
         mock_class.ProgramLock.return_value = self.proglock
         mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
 
         self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
 
@@ -318,6 +327,7 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(rmq_metadata.run_program(self.args,
                                                       self.func_names))
 
+    @mock.patch("rmq_metadata.setup_pipeline", mock.Mock(return_value=None))
     @mock.patch("rmq_metadata.validate_create_settings")
     @mock.patch("rmq_metadata.gen_libs.load_module")
     @mock.patch("rmq_metadata.gen_class.Logger")
@@ -341,11 +351,13 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
 
+    @mock.patch("rmq_metadata.setup_pipeline")
     @mock.patch("rmq_metadata.monitor_queue")
     @mock.patch("rmq_metadata.validate_create_settings")
     @mock.patch("rmq_metadata.gen_libs.load_module")
     @mock.patch("rmq_metadata.gen_class")
-    def test_func_call(self, mock_class, mock_load, mock_valid, mock_func):
+    def test_func_call(                            # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
 
         """Function:  test_func_call
 
@@ -361,9 +373,37 @@ class UnitTest(unittest.TestCase):
         mock_class.Logger.log_close.return_value = True
         mock_class.ProgramLock.return_value = self.proglock
         mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
 
         self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
 
+    @mock.patch("rmq_metadata.setup_pipeline")
+    @mock.patch("rmq_metadata.monitor_queue")
+    @mock.patch("rmq_metadata.validate_create_settings")
+    @mock.patch("rmq_metadata.gen_libs.load_module")
+    @mock.patch("rmq_metadata.gen_class")
+    def test_mongo_sink_closed(                     # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
+
+        """Function:  test_mongo_sink_closed
+
+        Description:  Test with the Mongo connection closed on exit.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = mock.Mock()
+        mock_class.Logger.return_value = rmq_metadata.gen_class.Logger
+        mock_load.side_effect = [self.cfg, self.mongo_cfg]
+        mock_valid.return_value = (self.cfg, True, "")
+        mock_class.ProgramLock.return_value = self.proglock
+        mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
+
+        self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
+        self.assertTrue(self.cfg.mongo_sink.close.called)
+
     @mock.patch("rmq_metadata.gen_class.Logger")
     @mock.patch("rmq_metadata.validate_create_settings")
     @mock.patch("rmq_metadata.gen_libs.load_module")
@@ -399,6 +439,60 @@ class UnitTest(unittest.TestCase):
 
         self.cfg = None
 
+    @mock.patch("rmq_metadata.setup_pipeline")
+    @mock.patch("rmq_metadata.monitor_queue")
+    @mock.patch("rmq_metadata.validate_create_settings")
+    @mock.patch("rmq_metadata.gen_libs.load_module")
+    @mock.patch("rmq_metadata.gen_class")
+    def test_pdfminer_pool_shutdown(                # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
+
+        """Function:  test_pdfminer_pool_shutdown
+
+        Description:  Test with the pdfminer process pool shut down on exit.
+
+        Arguments:
+
+        """
+
+        self.cfg.pdfminer_pool = mock.Mock()
+        mock_class.Logger.return_value = rmq_metadata.gen_class.Logger
+        mock_load.side_effect = [self.cfg, self.mongo_cfg]
+        mock_valid.return_value = (self.cfg, True, "")
+        mock_class.ProgramLock.return_value = self.proglock
+        mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
+
+        self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
+        self.cfg.pdfminer_pool.shutdown.assert_called_once_with(wait=True)
+
+    @mock.patch("rmq_metadata.setup_pipeline")
+    @mock.patch("rmq_metadata.monitor_queue")
+    @mock.patch("rmq_metadata.validate_create_settings")
+    @mock.patch("rmq_metadata.gen_libs.load_module")
+    @mock.patch("rmq_metadata.gen_class")
+    def test_ner_tagger_stop(                       # pylint:disable=R0913
+            self, mock_class, mock_load, mock_valid, mock_func, mock_pipe):
+
+        """Function:  test_ner_tagger_stop
+
+        Description:  Test with the private NER server stopped on exit.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_tagger = mock.Mock()
+        mock_class.Logger.return_value = rmq_metadata.gen_class.Logger
+        mock_load.side_effect = [self.cfg, self.mongo_cfg]
+        mock_valid.return_value = (self.cfg, True, "")
+        mock_class.ProgramLock.return_value = self.proglock
+        mock_func.return_value = True
+        mock_pipe.return_value = self.cfg
+
+        self.assertFalse(rmq_metadata.run_program(self.args, self.func_names))
+        self.cfg.ner_tagger.stop.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
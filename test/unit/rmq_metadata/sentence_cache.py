@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  sentence_cache.py
+
+    Description:  Unit testing of SentenceCache class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/sentence_cache.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_key
+        test_miss
+        test_hit
+        test_ratio
+        test_evict_least_recent
+        test_too_large
+        test_replace
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tags = [("London", "LOCATION"), (".", "O")]
+        self.size = 120 + len("London") + 120 + len(".") + 120
+        self.cache = rmq_metadata.SentenceCache(self.size * 2)
+
+    def test_key(self):
+
+        """Function:  test_key
+
+        Description:  Test with keys of the sentence tokens.
+
+        Arguments:
+
+        """
+
+        key = self.cache.key(["London", "."])
+
+        self.assertEqual(key, self.cache.key(["London", "."]))
+        self.assertNotEqual(key, self.cache.key(["London."]))
+
+    def test_miss(self):
+
+        """Function:  test_miss
+
+        Description:  Test with a sentence not in the cache.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.cache.get(b"key"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_hit(self):
+
+        """Function:  test_hit
+
+        Description:  Test with a sentence in the cache.
+
+        Arguments:
+
+        """
+
+        self.cache.put(b"key", self.tags)
+
+        self.assertEqual(self.cache.get(b"key"), self.tags)
+        self.assertEqual(self.cache.size, self.size)
+
+    def test_ratio(self):
+
+        """Function:  test_ratio
+
+        Description:  Test with the hit ratio of the cache.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.cache.ratio(), 0.0)
+        self.cache.put(b"key", self.tags)
+        self.cache.get(b"key")
+        self.cache.get(b"key2")
+
+        self.assertEqual(self.cache.ratio(), 0.5)
+
+    def test_evict_least_recent(self):
+
+        """Function:  test_evict_least_recent
+
+        Description:  Test with least recently used sentence evicted.
+
+        Arguments:
+
+        """
+
+        self.cache.put(b"key1", self.tags)
+        self.cache.put(b"key2", self.tags)
+        self.cache.get(b"key1")
+        self.cache.put(b"key3", self.tags)
+
+        self.assertEqual(list(self.cache.entries), [b"key1", b"key3"])
+        self.assertEqual(self.cache.size, self.size * 2)
+
+    def test_too_large(self):
+
+        """Function:  test_too_large
+
+        Description:  Test with a sentence larger than the cache.
+
+        Arguments:
+
+        """
+
+        self.cache.max_bytes = 100
+        self.cache.put(b"key", self.tags)
+
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_replace(self):
+
+        """Function:  test_replace
+
+        Description:  Test with a sentence cached twice.
+
+        Arguments:
+
+        """
+
+        self.cache.put(b"key", self.tags)
+        self.cache.put(b"key", self.tags)
+
+        self.assertEqual(self.cache.size, self.size)
+
+
+if __name__ == "__main__":
+    unittest.main()
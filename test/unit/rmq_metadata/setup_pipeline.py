@@ -0,0 +1,294 @@
+# Classification (U)
+
+"""Program:  setup_pipeline.py
+
+    Description:  Unit testing of setup_pipeline in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/setup_pipeline.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.lang_module = \
+            "DIRECTORY_PATH/classifiers/english.all.3class.distsim.crf.ser.gz"
+        self.stanford_jar = "DIRECTORY_PATH/stanford-ner.jar"
+        self.encoding = "utf-8"
+        self.token_types = ["LOCATION", "PERSON", "ORGANIZATION"]
+        self.mongo = None
+        self.bench_dir = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_tagger_not_ready
+        test_tagger_ready
+        test_mongo_failed
+        test_benchmark
+        test_content_index
+        test_content_index_failed
+        test_result_cache
+        test_ner_batcher
+        test_pdfminer_pool
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=False))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_tagger_not_ready(self, mock_log):
+
+        """Function:  test_tagger_not_ready
+
+        Description:  Test with the NER tagger failing warm-up.
+
+        Arguments:
+
+        """
+
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.ner_tagger, rmq_metadata.NerTagger)
+
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_tagger_ready(self, mock_log):
+
+        """Function:  test_tagger_ready
+
+        Description:  Test with the NER tagger ready for use.
+
+        Arguments:
+
+        """
+
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.ner_tagger, rmq_metadata.NerTagger)
+        self.assertIsInstance(
+            cfg.encoding_detector, rmq_metadata.EncodingDetector)
+        self.assertIsInstance(cfg.pipeline_stats, rmq_metadata.PipelineStats)
+        self.assertIsInstance(cfg.mongo_sink, rmq_metadata.MongoSink)
+
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(False, "Connection refused")))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_mongo_failed(self, mock_log):
+
+        """Function:  test_mongo_failed
+
+        Description:  Test with Mongo not available at startup.
+
+        Arguments:
+
+        """
+
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.mongo_sink, rmq_metadata.MongoSink)
+        self.assertTrue(mock_log.log_warn.called)
+
+    @mock.patch("rmq_metadata.MongoSink.connect")
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_benchmark(self, mock_log, mock_connect):
+
+        """Function:  test_benchmark
+
+        Description:  Test with no Mongo connection for the benchmark.
+
+        Arguments:
+
+        """
+
+        self.cfg.bench_dir = "/dir/path"
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertFalse(hasattr(cfg, "mongo_sink"))
+        self.assertFalse(mock_connect.called)
+
+    @mock.patch("rmq_metadata.ContentIndex.open")
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_content_index(self, mock_log, mock_open):
+
+        """Function:  test_content_index
+
+        Description:  Test with the content index opened.
+
+        Arguments:
+
+        """
+
+        self.cfg.dedup_db = "/dir/dedup.db"
+        mock_open.return_value = (True, None)
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.content_index, rmq_metadata.ContentIndex)
+        self.assertTrue(cfg.mongo_sink.unique_hash)
+
+    @mock.patch("rmq_metadata.ContentIndex.open")
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_content_index_failed(self, mock_log, mock_open):
+
+        """Function:  test_content_index_failed
+
+        Description:  Test with the content index failing to open.
+
+        Arguments:
+
+        """
+
+        self.cfg.dedup_db = "/dir/dedup.db"
+        mock_open.return_value = (False, "unable to open database file")
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsNone(cfg.content_index)
+        self.assertFalse(cfg.mongo_sink.unique_hash)
+        self.assertTrue(mock_log.log_warn.called)
+
+    @mock.patch("rmq_metadata.ResultCache.open",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_result_cache(self, mock_log):
+
+        """Function:  test_result_cache
+
+        Description:  Test with the result cache opened.
+
+        Arguments:
+
+        """
+
+        self.cfg.result_cache_db = "/dir/result_cache.db"
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.result_cache, rmq_metadata.ResultCache)
+        self.assertEqual(cfg.result_cache.max_bytes, 268435456)
+
+    @mock.patch("rmq_metadata.NerBatcher.start")
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_ner_batcher(self, mock_log, mock_start):
+
+        """Function:  test_ner_batcher
+
+        Description:  Test with the NER batcher started.
+
+        Arguments:
+
+        """
+
+        self.cfg.ner_batch_docs = 8
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIsInstance(cfg.ner_batcher, rmq_metadata.NerBatcher)
+        self.assertIs(cfg.ner_batcher.tagger, cfg.ner_tagger)
+        self.assertTrue(mock_start.called)
+
+    @mock.patch("rmq_metadata.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("rmq_metadata.MongoSink.connect",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("rmq_metadata.NerTagger.warm_up",
+                mock.Mock(return_value=True))
+    @mock.patch("rmq_metadata.gen_class.Logger")
+    def test_pdfminer_pool(self, mock_log, mock_pool):
+
+        """Function:  test_pdfminer_pool
+
+        Description:  Test with one pdfminer process pool from a forkserver.
+
+        Arguments:
+
+        """
+
+        self.cfg.pdfminer_workers = 4
+        cfg = rmq_metadata.setup_pipeline(self.cfg, mock_log)
+
+        self.assertIs(cfg.pdfminer_pool, mock_pool.return_value)
+        self.assertEqual(mock_pool.call_args[1]["max_workers"], 4)
+        self.assertEqual(
+            mock_pool.call_args[1]["mp_context"].get_start_method(),
+            "forkserver")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_tmp_data_in_place
         test_new_type2
         test_new_type
         test_item_type2
@@ -78,6 +79,23 @@ class UnitTest(unittest.TestCase):
         self.result_list = []
         self.result_tmp = []
 
+    def test_tmp_data_in_place(self):
+
+        """Function:  test_tmp_data_in_place
+
+        Description:  Test the run is extended in the tmp_data list passed in.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.sort_data(
+                self.item3, self.current_type3, self.data_list,
+                self.tmp_data2, self.token_types),
+            (self.result_type2, self.result_list, self.result_tmp3))
+        self.assertEqual(self.tmp_data2, self.result_tmp3)
+
     def test_new_type2(self):
 
         """Function:  test_new_type2
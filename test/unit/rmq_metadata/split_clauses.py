@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  split_clauses.py
+
+    Description:  Unit testing of split_clauses in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/split_clauses.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_clauses
+        test_no_break
+        test_empty
+
+    """
+
+    def test_clauses(self):
+
+        """Function:  test_clauses
+
+        Description:  Test with tokens split at the clause breaks.
+
+        Arguments:
+
+        """
+
+        tokens = ["Paris", ",", "France", ";", "Note", ":", "Rome"]
+
+        self.assertEqual(
+            rmq_metadata.split_clauses(tokens),
+            [["Paris", ","], ["France", ";"], ["Note", ":"], ["Rome"]])
+
+    def test_no_break(self):
+
+        """Function:  test_no_break
+
+        Description:  Test with tokens without a clause break.
+
+        Arguments:
+
+        """
+
+        tokens = ["AT", "&", "T"]
+
+        self.assertEqual(rmq_metadata.split_clauses(tokens), [tokens])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.split_clauses([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  split_sentences.py
+
+    Description:  Unit testing of split_sentences in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/split_sentences.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_sentences
+        test_no_end
+        test_empty
+
+    """
+
+    def test_sentences(self):
+
+        """Function:  test_sentences
+
+        Description:  Test with tokens split at the sentence endings.
+
+        Arguments:
+
+        """
+
+        tokens = ["Go", "to", "London", ".", "Why", "?", "Now", "!"]
+
+        self.assertEqual(
+            rmq_metadata.split_sentences(tokens),
+            [["Go", "to", "London", "."], ["Why", "?"], ["Now", "!"]])
+
+    def test_no_end(self):
+
+        """Function:  test_no_end
+
+        Description:  Test with tokens after the last sentence ending.
+
+        Arguments:
+
+        """
+
+        tokens = ["London", ".", "Page", "1"]
+
+        self.assertEqual(
+            rmq_metadata.split_sentences(tokens),
+            [["London", "."], ["Page", "1"]])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(rmq_metadata.split_sentences([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
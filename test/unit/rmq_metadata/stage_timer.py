@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  stage_timer.py
+
+    Description:  Unit testing of StageTimer class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/stage_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_time
+        test_time_exception
+        test_count
+        test_wrap
+        test_summary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timer = rmq_metadata.StageTimer()
+
+    @mock.patch("rmq_metadata.time.monotonic")
+    def test_time(self, mock_time):
+
+        """Function:  test_time
+
+        Description:  Test with durations added up for a stage.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 10.5, 20.0, 20.25]
+
+        with self.timer.time("decode"):
+            pass
+
+        with self.timer.time("decode"):
+            pass
+
+        self.assertEqual(self.timer.stages, {"decode": 0.75})
+
+    @mock.patch("rmq_metadata.time.monotonic")
+    def test_time_exception(self, mock_time):
+
+        """Function:  test_time_exception
+
+        Description:  Test with stage timed when the block raises.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 11.0]
+
+        with self.assertRaises(ValueError):
+            with self.timer.time("mongo"):
+                raise ValueError("Insert failed")
+
+        self.assertEqual(self.timer.stages, {"mongo": 1.0})
+
+    def test_count(self):
+
+        """Function:  test_count
+
+        Description:  Test with values added up for a count.
+
+        Arguments:
+
+        """
+
+        self.timer.count("pypdf2.tokens", 100)
+        self.timer.count("pypdf2.tokens", 50)
+
+        self.assertEqual(self.timer.counts, {"pypdf2.tokens": 150})
+
+    def test_wrap(self):
+
+        """Function:  test_wrap
+
+        Description:  Test with a function call timed.
+
+        Arguments:
+
+        """
+
+        func = self.timer.wrap("pypdf2.extract", lambda x, y=1: x + y)
+
+        self.assertEqual(func(1, y=2), 3)
+        self.assertIn("pypdf2.extract", self.timer.stages)
+
+    @mock.patch("rmq_metadata.time.monotonic")
+    def test_summary(self, mock_time):
+
+        """Function:  test_summary
+
+        Description:  Test with summary of the timings and counts.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [0.0, 1.0, 1.5, 2.0]
+        timer = rmq_metadata.StageTimer()
+
+        with timer.time("decode"):
+            timer.count("body_bytes", 1024)
+
+        self.assertEqual(
+            timer.summary(),
+            {"total": 2.0, "stages": {"decode": 0.5},
+             "counts": {"body_bytes": 1024}})
+
+
+if __name__ == "__main__":
+    unittest.main()
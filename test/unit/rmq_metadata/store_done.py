@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  store_done.py
+
+    Description:  Unit testing of store_done in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/store_done.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_inserted
+        test_insert_failed
+        test_move_failed
+        test_record
+        test_record_failed
+        test_conflict
+        test_conflict_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.queue = {"directory": "/dir/path"}
+        self.f_name = "/tmp/path/Filename.pdf"
+        self.logger = mock.Mock()
+        self.on_done = mock.Mock()
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    def test_inserted(self, mock_mv):
+
+        """Function:  test_inserted
+
+        Description:  Test with the PDF moved after the insert.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, True, None)
+
+        mock_mv.assert_called_once_with(
+            self.f_name, "/dir/path", "Filename.pdf")
+        self.on_done.assert_called_once_with(True)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    def test_insert_failed(self, mock_mv):
+
+        """Function:  test_insert_failed
+
+        Description:  Test with a failed insert.
+
+        Arguments:
+
+        """
+
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, False,
+            "Connection refused")
+
+        self.assertFalse(mock_mv.called)
+        self.on_done.assert_called_once_with(False)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    def test_move_failed(self, mock_mv):
+
+        """Function:  test_move_failed
+
+        Description:  Test with the move of the PDF failing.
+
+        Arguments:
+
+        """
+
+        mock_mv.side_effect = OSError("No space left on device")
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, True, None)
+
+        self.on_done.assert_called_once_with(False)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock())
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test with the record function called after the insert.
+
+        Arguments:
+
+        """
+
+        record = mock.Mock()
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, True, None,
+            record=record)
+
+        record.assert_called_once_with()
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2", mock.Mock())
+    def test_record_failed(self):
+
+        """Function:  test_record_failed
+
+        Description:  Test with the record function not called after a
+            failed insert.
+
+        Arguments:
+
+        """
+
+        record = mock.Mock()
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, False,
+            "Connection refused", record=record)
+
+        self.assertFalse(record.called)
+
+    @mock.patch("rmq_metadata.gen_libs.mv_file2")
+    def test_conflict(self, mock_mv):
+
+        """Function:  test_conflict
+
+        Description:  Test with the content already inserted.
+
+        Arguments:
+
+        """
+
+        record = mock.Mock()
+        conflict = mock.Mock(return_value=True)
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, None,
+            "Duplicate key", record=record, conflict=conflict)
+
+        self.assertTrue(conflict.called)
+        self.assertFalse(record.called)
+        self.assertFalse(mock_mv.called)
+        self.on_done.assert_called_once_with(True)
+
+    def test_conflict_failed(self):
+
+        """Function:  test_conflict_failed
+
+        Description:  Test with the duplicate PDF not able to be processed.
+
+        Arguments:
+
+        """
+
+        conflict = mock.Mock(side_effect=OSError("No such file"))
+        rmq_metadata.store_done(
+            self.queue, self.f_name, self.logger, self.on_done, None,
+            "Duplicate key", conflict=conflict)
+
+        self.on_done.assert_called_once_with(False)
+
+
+if __name__ == "__main__":
+    unittest.main()
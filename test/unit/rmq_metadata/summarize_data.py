@@ -16,6 +16,7 @@
 # Standard
 import sys
 import os
+import random
 import unittest
 import mock
 
@@ -27,6 +28,65 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
+def baseline_summarize(categorized_text, token_types):
+
+    """Function:  baseline_summarize
+
+    Description:  Copy of the original summarize_data, sort_data and
+        merge_data functions, used as the reference output.
+
+    Arguments:
+        (input) categorized_text -> List of categorized tokens
+        (input) token_types -> List of token types to be accepted
+        (output) data_list -> List of summarized categorized tokens
+
+    """
+
+    def merge(data_list, tmp_data):
+        data_list = list(data_list)
+        tmp_data = list(tmp_data)
+        data = tmp_data.pop(0)
+        tmp_a = data[0]
+        data_type = data[1]
+
+        for item in tmp_data:
+            tmp_a = tmp_a + " " + item[0]
+
+        data_list.append((tmp_a, data_type))
+
+        return data_list
+
+    data_list = []
+    tmp_data = []
+    current_type = ""
+
+    for item in list(categorized_text):
+        tmp_data = list(tmp_data)
+
+        if item[1] == "O":
+            current_type = item[1]
+
+            if tmp_data:
+                data_list = merge(data_list, tmp_data)
+                tmp_data = []
+
+        elif item[1] in token_types and item[1] == current_type:
+            tmp_data.append(item)
+
+        elif item[1] in token_types:
+
+            if tmp_data:
+                data_list = merge(data_list, tmp_data)
+
+            tmp_data = [item]
+            current_type = item[1]
+
+    if tmp_data:
+        data_list = merge(data_list, tmp_data)
+
+    return data_list
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -35,8 +95,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_baseline_output
+        test_single_run
         test_empty_categorized_text
         test_summarize_data
+        test_token_stream
 
     """
 
@@ -66,6 +129,61 @@ class UnitTest(unittest.TestCase):
         self.data_list = [('London', 'LOCATION'), ('SW1W9AX', 'LOCATION')]
         self.results = [('London', 'LOCATION')]
         self.results2 = [('London', 'LOCATION'), ('SW1W9AX', 'LOCATION')]
+        self.categorized_text3 = [
+            ('John', 'PERSON'), ('Smith', 'PERSON'), ('of', 'O'),
+            ('High', 'LOCATION'), ('Road', 'LOCATION'), ('London', 'LOCATION'),
+            ('Acme', 'ORGANIZATION'), ('Ltd', 'ORGANIZATION'),
+            ('Paris', 'LOCATION'), ('Euro', 'MISC'), ('Rome', 'LOCATION')]
+        self.results3 = [
+            ('John Smith', 'PERSON'), ('High Road London', 'LOCATION'),
+            ('Acme Ltd', 'ORGANIZATION'), ('Paris Rome', 'LOCATION')]
+
+    def test_baseline_output(self):
+
+        """Function:  test_baseline_output
+
+        Description:  Test the output is byte-identical to the original
+            implementation on a generated token stream.
+
+        Arguments:
+
+        """
+
+        rand = random.Random(5)
+        types = self.token_types + ["O", "O", "MISC", "DATE"]
+        words = ["London", "Acme", "Ltd", "John", "Smith", ",", "&", "of"]
+        text = [(rand.choice(words), rand.choice(types))
+                for _ in range(5000)]
+        text.append(("Paris", "LOCATION"))
+
+        self.assertEqual(
+            repr(rmq_metadata.summarize_data(iter(text), self.token_types)),
+            repr(baseline_summarize(text, self.token_types)))
+
+    def test_single_run(self):
+
+        """Function:  test_single_run
+
+        Description:  Test a long single type run is built in one list and
+            not copied for each token, and the input is not changed.
+
+        Arguments:
+
+        """
+
+        text = [("Acme", "ORGANIZATION")] * 20000
+        result = [(" ".join(["Acme"] * 20000), "ORGANIZATION")]
+
+        with mock.patch("rmq_metadata.sort_data",
+                        wraps=rmq_metadata.sort_data) as mock_sort:
+            self.assertEqual(
+                rmq_metadata.summarize_data(text, self.token_types), result)
+
+        runs = {id(call[0][3]) for call in mock_sort.call_args_list}
+
+        self.assertEqual(mock_sort.call_count, 20000)
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(text, [("Acme", "ORGANIZATION")] * 20000)
 
     @mock.patch("rmq_metadata.merge_data")
     @mock.patch("rmq_metadata.sort_data")
@@ -117,6 +235,20 @@ class UnitTest(unittest.TestCase):
             rmq_metadata.summarize_data(
                 self.categorized_text, self.token_types), self.results)
 
+    def test_token_stream(self):
+
+        """Function:  test_token_stream
+
+        Description:  Test with an iterator of multi-token series.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.summarize_data(
+                iter(self.categorized_text3), self.token_types), self.results3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  tag_pages.py
+
+    Description:  Unit testing of tag_pages in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/tag_pages.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.stream_batch_tokens = 3
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_batches
+        test_no_pages
+        test_single_batch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.pages = ["John Smith", "lives in", "London"]
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize", str.split)
+    def test_batches(self, mock_find):
+
+        """Function:  test_batches
+
+        Description:  Test with tokens tagged in batches across pages.
+
+        Arguments:
+
+        """
+
+        mock_find.side_effect = lambda tokens, cfg: [
+            (token, "O") for token in tokens]
+
+        self.assertEqual(
+            [item[0] for item in rmq_metadata.tag_pages(
+                iter(self.pages), self.cfg)],
+            ["John", "Smith", "lives", "in", "London"])
+        self.assertEqual(
+            [item[0][0] for item in mock_find.call_args_list],
+            [["John", "Smith", "lives", "in"], ["London"]])
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize", str.split)
+    def test_no_pages(self, mock_find):
+
+        """Function:  test_no_pages
+
+        Description:  Test with no pages.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(rmq_metadata.tag_pages(iter([]), self.cfg)), [])
+        self.assertFalse(mock_find.called)
+
+    @mock.patch("rmq_metadata.find_tokens")
+    @mock.patch("rmq_metadata.word_tokenize", str.split)
+    def test_single_batch(self, mock_find):
+
+        """Function:  test_single_batch
+
+        Description:  Test with all pages in a single batch.
+
+        Arguments:
+
+        """
+
+        self.cfg.stream_batch_tokens = 100
+        mock_find.return_value = [("John", "PERSON")]
+
+        self.assertEqual(
+            list(rmq_metadata.tag_pages(iter(self.pages), self.cfg)),
+            [("John", "PERSON")])
+        self.assertEqual(mock_find.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  textract_pages.py
+
+    Description:  Unit testing of textract_pages in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/textract_pages.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_str_text
+        test_single_page
+        test_bytes_text
+
+    """
+
+    def test_str_text(self):
+
+        """Function:  test_str_text
+
+        Description:  Test with pages in a string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(rmq_metadata.textract_pages("Page 1\fPage 2\f")),
+            ["Page 1", "Page 2", ""])
+
+    def test_single_page(self):
+
+        """Function:  test_single_page
+
+        Description:  Test with text without form feeds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(rmq_metadata.textract_pages(b"Page 1")), [b"Page 1"])
+
+    def test_bytes_text(self):
+
+        """Function:  test_bytes_text
+
+        Description:  Test with pages in bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(rmq_metadata.textract_pages(b"Page 1\fPage 2")),
+            [b"Page 1", b"Page 2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
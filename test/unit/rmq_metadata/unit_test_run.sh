@@ -6,25 +6,76 @@
 
 echo ""
 echo "Unit test:  rmq_metadata.py"
+/usr/bin/python test/unit/rmq_metadata/ack_tracker.py
+/usr/bin/python test/unit/rmq_metadata/bench_file.py
+/usr/bin/python test/unit/rmq_metadata/benchmark.py
+/usr/bin/python test/unit/rmq_metadata/content_index.py
 /usr/bin/python test/unit/rmq_metadata/convert_data.py
 /usr/bin/python test/unit/rmq_metadata/create_metadata.py
+/usr/bin/python test/unit/rmq_metadata/create_route.py
+/usr/bin/python test/unit/rmq_metadata/decode_body.py
+/usr/bin/python test/unit/rmq_metadata/dedup_text.py
+/usr/bin/python test/unit/rmq_metadata/encoding_detector.py
 /usr/bin/python test/unit/rmq_metadata/extract_pdf.py
 /usr/bin/python test/unit/rmq_metadata/find_tokens.py
+/usr/bin/python test/unit/rmq_metadata/finish_message.py
+/usr/bin/python test/unit/rmq_metadata/get_bench_files.py
+/usr/bin/python test/unit/rmq_metadata/get_dtg.py
+/usr/bin/python test/unit/rmq_metadata/get_page_ranges.py
 /usr/bin/python test/unit/rmq_metadata/get_pdfminer_data.py
+/usr/bin/python test/unit/rmq_metadata/get_prefetch.py
 /usr/bin/python test/unit/rmq_metadata/get_pypdf2_data.py
+/usr/bin/python test/unit/rmq_metadata/get_sentence_chunks.py
+/usr/bin/python test/unit/rmq_metadata/get_stream_data.py
 /usr/bin/python test/unit/rmq_metadata/get_textract_data.py
+/usr/bin/python test/unit/rmq_metadata/get_textract_stream.py
+/usr/bin/python test/unit/rmq_metadata/get_textract_text.py
+/usr/bin/python test/unit/rmq_metadata/get_union_data.py
 /usr/bin/python test/unit/rmq_metadata/help_message.py
+/usr/bin/python test/unit/rmq_metadata/insert_metadata.py
+/usr/bin/python test/unit/rmq_metadata/log_timings.py
 /usr/bin/python test/unit/rmq_metadata/main.py
+/usr/bin/python test/unit/rmq_metadata/memory_sink.py
 /usr/bin/python test/unit/rmq_metadata/merge_data.py
+/usr/bin/python test/unit/rmq_metadata/mongo_sink.py
 /usr/bin/python test/unit/rmq_metadata/monitor_queue.py
+/usr/bin/python test/unit/rmq_metadata/ner_batcher.py
+/usr/bin/python test/unit/rmq_metadata/ner_server.py
+/usr/bin/python test/unit/rmq_metadata/ner_tagger.py
 /usr/bin/python test/unit/rmq_metadata/non_proc_msg.py
+/usr/bin/python test/unit/rmq_metadata/normalize_entity.py
+/usr/bin/python test/unit/rmq_metadata/open_pdf.py
+/usr/bin/python test/unit/rmq_metadata/pdf_page_count.py
+/usr/bin/python test/unit/rmq_metadata/pdf_pages.py
 /usr/bin/python test/unit/rmq_metadata/pdf_to_string.py
+/usr/bin/python test/unit/rmq_metadata/pdfminer_page_range.py
+/usr/bin/python test/unit/rmq_metadata/pdfminer_pages.py
+/usr/bin/python test/unit/rmq_metadata/pipeline_fingerprint.py
+/usr/bin/python test/unit/rmq_metadata/pipeline_stats.py
+/usr/bin/python test/unit/rmq_metadata/process_conflict.py
+/usr/bin/python test/unit/rmq_metadata/process_duplicate.py
 /usr/bin/python test/unit/rmq_metadata/process_message.py
 /usr/bin/python test/unit/rmq_metadata/process_msg.py
+/usr/bin/python test/unit/rmq_metadata/process_worker.py
 /usr/bin/python test/unit/rmq_metadata/read_pdf.py
+/usr/bin/python test/unit/rmq_metadata/read_pdf_pages.py
+/usr/bin/python test/unit/rmq_metadata/recode_text.py
+/usr/bin/python test/unit/rmq_metadata/result_cache.py
+/usr/bin/python test/unit/rmq_metadata/run_extractors.py
+/usr/bin/python test/unit/rmq_metadata/run_loop.py
 /usr/bin/python test/unit/rmq_metadata/run_program.py
+/usr/bin/python test/unit/rmq_metadata/sentence_cache.py
+/usr/bin/python test/unit/rmq_metadata/setup_pipeline.py
 /usr/bin/python test/unit/rmq_metadata/sort_data.py
+/usr/bin/python test/unit/rmq_metadata/split_clauses.py
+/usr/bin/python test/unit/rmq_metadata/split_sentences.py
+/usr/bin/python test/unit/rmq_metadata/stage_timer.py
+/usr/bin/python test/unit/rmq_metadata/store_done.py
 /usr/bin/python test/unit/rmq_metadata/summarize_data.py
+/usr/bin/python test/unit/rmq_metadata/tag_pages.py
+/usr/bin/python test/unit/rmq_metadata/textract_pages.py
 /usr/bin/python test/unit/rmq_metadata/validate_create_settings.py
 /usr/bin/python test/unit/rmq_metadata/validate_files.py
+/usr/bin/python test/unit/rmq_metadata/validate_routes.py
+/usr/bin/python test/unit/rmq_metadata/write_buffer.py
 
@@ -78,6 +78,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_prefetch_invalid
+        test_duplicate_routing_key
         test_stanford_jar_path_false
         test_stanford_jar_path_true
         test_stanford_jar_false
@@ -88,6 +90,7 @@ class UnitTest(unittest.TestCase):
         test_lang_module_true
         test_tmp_dir_false
         test_tmp_dir_not_abs
+        test_dedup_db_not_abs
         test_tmp_dir_true
         test_archive_dir_false
         test_archive_not_abs
@@ -131,6 +134,54 @@ class UnitTest(unittest.TestCase):
         self.log_name = \
             base_name + "_" + self.cfg.exchange_name + ext_name
 
+    @mock.patch("rmq_metadata.gen_libs")
+    def test_prefetch_invalid(self, mock_lib):
+
+        """Function:  test_prefetch_invalid
+
+        Description:  Test with an invalid prefetch count for a queue.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list[0]["prefetch_count"] = "ten"
+        msg = "prefetch_count invalid for queue: rmq_metadata_unit_test"
+
+        mock_lib.chk_crt_file.side_effect = [(True, None), (True, None)]
+        mock_lib.chk_crt_dir.side_effect = [
+            (True, None), (True, None), (True, None), (True, None),
+            (True, None)]
+        _, status_flag, err_msg = \
+            rmq_metadata.validate_create_settings(self.cfg)
+
+        self.assertEqual((status_flag, err_msg), (False, msg))
+
+    @mock.patch("rmq_metadata.gen_libs")
+    def test_duplicate_routing_key(self, mock_lib):
+
+        """Function:  test_duplicate_routing_key
+
+        Description:  Test with a routing key in two queue entries.
+
+        Arguments:
+
+        """
+
+        self.cfg2.queue_list[1]["routing_key"] = "MY_ROUTING_KEY"
+        msg = "Duplicate routing_key: MY_ROUTING_KEY in queue:" \
+            " rmq_metadata_unit_test2"
+
+        mock_lib.chk_crt_file.side_effect = [(True, None), (True, None)]
+        mock_lib.chk_crt_dir.side_effect = [
+            (True, None), (True, None), (True, None), (True, None),
+            (True, None), (True, None)]
+        cfg, status_flag, err_msg = \
+            rmq_metadata.validate_create_settings(self.cfg2)
+
+        self.assertEqual((status_flag, err_msg), (False, msg))
+        self.assertEqual(list(cfg.route_index), ["MY_ROUTING_KEY"])
+
     @mock.patch("rmq_metadata.gen_libs")
     def test_stanford_jar_path_false(self, mock_lib):
 
@@ -341,6 +392,30 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual((status_flag, err_msg), (True, ""))
 
+    @mock.patch("rmq_metadata.gen_libs")
+    def test_dedup_db_not_abs(self, mock_lib):
+
+        """Function:  test_dedup_db_not_abs
+
+        Description:  Test when dedup_db is not abs.
+
+        Arguments:
+
+        """
+
+        self.cfg.dedup_db = "dedup.db"
+
+        mock_lib.chk_crt_file.side_effect = [(True, None), (True, None)]
+        mock_lib.chk_crt_dir.side_effect = [
+            (True, None), (True, None), (True, None), (True, None),
+            (True, None)]
+        cfg, status_flag, err_msg = \
+            rmq_metadata.validate_create_settings(self.cfg)
+
+        self.assertEqual((status_flag, err_msg), (True, ""))
+        self.assertEqual(
+            cfg.dedup_db, os.path.join(self.cfg.base_dir, "dedup.db"))
+
     @mock.patch("rmq_metadata.gen_libs")
     def test_tmp_dir_true(self, mock_lib):
 
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  validate_routes.py
+
+    Description:  Unit testing of validate_routes in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/validate_routes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.exchange_name = "Exchange"
+        self.archive_dir = None
+        self.queue_list = [
+            {"queue": "QUEUE_NAME", "routing_key": "ROUTING_KEY"},
+            {"queue": "QUEUE_NAME2", "routing_key": "ROUTING_KEY2"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_index
+        test_duplicate_key
+        test_status_kept
+        test_dedup_invalid
+        test_dedup_no_db
+        test_dedup
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_index(self):
+
+        """Function:  test_index
+
+        Description:  Test with an index entry for each routing key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, True, ""), (True, ""))
+        self.assertEqual(
+            sorted(self.cfg.route_index), ["ROUTING_KEY", "ROUTING_KEY2"])
+        self.assertIs(self.cfg.route_index["ROUTING_KEY2"]["queue"],
+                      self.cfg.queue_list[1])
+
+    def test_duplicate_key(self):
+
+        """Function:  test_duplicate_key
+
+        Description:  Test with a routing key in two queue entries.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list[1]["routing_key"] = "ROUTING_KEY"
+
+        msg = "Duplicate routing_key: ROUTING_KEY in queue: QUEUE_NAME2"
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, True, ""), (False, msg))
+        self.assertIs(self.cfg.route_index["ROUTING_KEY"]["queue"],
+                      self.cfg.queue_list[0])
+
+    def test_status_kept(self):
+
+        """Function:  test_status_kept
+
+        Description:  Test with an earlier failed check.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, False, "Error"),
+            (False, "Error"))
+
+    def test_dedup_invalid(self):
+
+        """Function:  test_dedup_invalid
+
+        Description:  Test with an invalid dedup setting.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list[0]["dedup"] = "drop"
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, True, ""),
+            (False, "dedup invalid for queue: QUEUE_NAME"))
+
+    def test_dedup_no_db(self):
+
+        """Function:  test_dedup_no_db
+
+        Description:  Test with dedup set and no content index file.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_list[0]["dedup"] = "skip"
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, True, ""),
+            (False, "dedup_db not set for dedup in queue: QUEUE_NAME"))
+
+    def test_dedup(self):
+
+        """Function:  test_dedup
+
+        Description:  Test with dedup set and a content index file.
+
+        Arguments:
+
+        """
+
+        self.cfg.dedup_db = "/dir/dedup.db"
+        self.cfg.queue_list[0]["dedup"] = "link"
+        self.cfg.queue_list[1]["dedup"] = "reprocess"
+
+        self.assertEqual(
+            rmq_metadata.validate_routes(self.cfg, True, ""), (True, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
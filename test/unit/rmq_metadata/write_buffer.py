@@ -0,0 +1,249 @@
+# Classification (U)
+
+"""Program:  write_buffer.py
+
+    Description:  Unit testing of WriteBuffer class in rmq_metadata.py.
+
+    Usage:
+        test/unit/rmq_metadata/write_buffer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import rmq_metadata                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mongo_sink = rmq_metadata.MemorySink()
+        self.write_batch_size = 2
+        self.write_flush_interval = 0.02
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_below_batch_size
+        test_batch_size
+        test_insert_failed
+        test_insert_error
+        test_timer
+        test_callback_fails
+        test_flush_interval
+        test_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.logger = mock.Mock()
+        self.callback = mock.Mock()
+        self.buffer = rmq_metadata.WriteBuffer(self.cfg, self.logger)
+
+    def test_below_batch_size(self):
+
+        """Function:  test_below_batch_size
+
+        Description:  Test with documents held below the batch size.
+
+        Arguments:
+
+        """
+
+        self.buffer.add({"Doc": 1}, self.callback)
+
+        self.assertEqual(self.cfg.mongo_sink.docs, [])
+        self.assertFalse(self.callback.called)
+
+    def test_batch_size(self):
+
+        """Function:  test_batch_size
+
+        Description:  Test with buffer flushed at the batch size.
+
+        Arguments:
+
+        """
+
+        self.buffer.add({"Doc": 1}, self.callback)
+        self.buffer.add({"Doc": 2}, self.callback)
+
+        self.assertEqual(self.cfg.mongo_sink.docs, [{"Doc": 1}, {"Doc": 2}])
+        self.assertEqual(self.callback.call_count, 2)
+        self.callback.assert_called_with(True, None)
+        self.assertEqual(self.buffer.entries, [])
+
+    def test_insert_failed(self):
+
+        """Function:  test_insert_failed
+
+        Description:  Test with callbacks passed the result of each insert.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = mock.Mock()
+        self.cfg.mongo_sink.insert_many.return_value = [
+            (True, None), (False, "Document failed validation")]
+        callback2 = mock.Mock()
+        buffer = rmq_metadata.WriteBuffer(self.cfg, self.logger)
+        buffer.add({"Doc": 1}, self.callback)
+        buffer.add({"Doc": 2}, callback2)
+
+        self.callback.assert_called_once_with(True, None)
+        callback2.assert_called_once_with(
+            False, "Document failed validation")
+
+    def test_insert_error(self):
+
+        """Function:  test_insert_error
+
+        Description:  Test with every callback passed a failed status when the
+            insert raises an error.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_sink = mock.Mock()
+        self.cfg.mongo_sink.insert_many.side_effect = TypeError(
+            "Document is not serializable")
+        callback2 = mock.Mock()
+        buffer = rmq_metadata.WriteBuffer(self.cfg, self.logger)
+        buffer.add({"Doc": 1}, self.callback)
+        buffer.add({"Doc": 2}, callback2)
+
+        self.callback.assert_called_once_with(
+            False, "Document is not serializable")
+        callback2.assert_called_once_with(
+            False, "Document is not serializable")
+        self.assertTrue(self.logger.log_err.called)
+
+    def test_timer(self):
+
+        """Function:  test_timer
+
+        Description:  Test with insert time added to the message timers.
+
+        Arguments:
+
+        """
+
+        timer = rmq_metadata.StageTimer()
+        self.buffer.add({"Doc": 1}, self.callback, timer)
+        self.buffer.flush()
+
+        self.assertIn("mongo", timer.stages)
+
+    def test_callback_fails(self):
+
+        """Function:  test_callback_fails
+
+        Description:  Test with an error in a callback not stopping the
+            other callbacks.
+
+        Arguments:
+
+        """
+
+        callback2 = mock.Mock(side_effect=OSError("No such file"))
+        self.buffer.add({"Doc": 1}, callback2)
+        self.buffer.add({"Doc": 2}, self.callback)
+
+        self.assertTrue(self.callback.called)
+        self.assertTrue(self.logger.log_err.called)
+
+    def test_flush_interval(self):
+
+        """Function:  test_flush_interval
+
+        Description:  Test with buffer flushed by the flush thread.
+
+        Arguments:
+
+        """
+
+        self.buffer.start()
+        self.buffer.add({"Doc": 1}, self.callback)
+
+        for _ in range(100):
+            if self.callback.called:
+                break
+
+            time.sleep(0.01)
+
+        self.buffer.stop()
+
+        self.callback.assert_called_once_with(True, None)
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test with buffer flushed when stopped.
+
+        Arguments:
+
+        """
+
+        self.cfg.write_flush_interval = 60
+        buffer = rmq_metadata.WriteBuffer(self.cfg, self.logger)
+        buffer.start()
+        buffer.add({"Doc": 1}, self.callback)
+        buffer.stop()
+
+        self.callback.assert_called_once_with(True, None)
+        self.assertFalse(buffer.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
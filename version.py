@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "0.1.8"
+__version__ = "0.2.0"